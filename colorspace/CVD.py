@@ -395,29 +395,24 @@ class CVD(object):
         """
 
 
-        from copy import deepcopy
-        cols = deepcopy(self._colors_)
-
         from .colorlib import colorobject
 
-        if not isinstance(cols, colorobject):
+        if not isinstance(self._colors_, colorobject):
             raise ValueError("input cols to {:s}".format(self.__class__.__name__) + \
                     "has to be a colorobject (e.g., CIELAB, RGB, hexcols).")
 
-        # Convert to sRGB
-        cols.to("sRGB")
+        # Convert to sRGB (new object)
+        cols = self._colors_.as_("sRGB")
 
         # Transform color
-        from numpy import dot, vstack
-        RGB = vstack([cols.get("R"), cols.get("G"), cols.get("B")])
         CVD = self._interpolate_cvd_transform()
 
-        # Apply coefficients/CVD transformation matrix
-        [R, G, B] = [RGB[i] for i in [0,1,2]]
-        RGB = RGB.transpose().dot(CVD).transpose()
-
-        # Save simulated data
-        cols.set(R = RGB[0], G = RGB[1], B = RGB[2])
+        # Apply coefficients/CVD transformation matrix on
+        # the (n, 3) coordinates (R, G, B) of the color object
+        # (in the precision of the object) and save simulated data
+        RGB = cols._coords_.dot(CVD.astype(cols._coords_.dtype))
+        cols._set_coords_(["R", "G", "B"], [RGB[:,0], RGB[:,1], RGB[:,2]],
+                          cols.get("alpha"), adopt = True)
 
         # User provided hex colors?
         from copy import copy
@@ -551,9 +546,7 @@ def desaturate(col, amount = 1.):
     original_class = col.__class__.__name__
     original_class = "hex" if original_class == "hexcols" else original_class
 
-    from copy import deepcopy
-    col = deepcopy(col)
-    col.to("HCL")
+    col = col.as_("HCL")
     
     # Desaturation
     col.set(C = (1. - amount) * col.get("C"))
@@ -561,8 +554,8 @@ def desaturate(col, amount = 1.):
     from numpy import where, logical_or
     idx = where(logical_or(col.get("L") <= 0, col.get("L") >= 100))[0]
     if len(idx) > 0:
-        C = col.get("C"); C[idx] = 0
-        H = col.get("H"); H[idx] = 0
+        C = col.get("C").copy(); C[idx] = 0
+        H = col.get("H").copy(); H[idx] = 0
         col.set(C = C, H = H)
 
     col.to(original_class)
@@ -33,15 +33,341 @@
 
 import sys
 import numpy as np
-import inspect
+from .kernels import kernels
+
+
+def _check_dtype_(dtype):
+    """_check_dtype_(dtype)
+
+    Checks the floating point precision used to store coordinates
+    and to convert colors.
+
+    Parameters
+    ----------
+    dtype : str or numpy.dtype
+        ``"float32"`` or ``"float64"`` (or the corresponding `numpy.dtype`)
+
+    Returns
+    -------
+    numpy.dtype
+        Returns the `numpy.dtype`, raises a ValueError if ``dtype``
+        is not one of the allowed types.
+    """
+    try:
+        res = np.dtype(dtype)
+    except TypeError:
+        res = None
+    if not res in [np.dtype("float32"), np.dtype("float64")]:
+        raise ValueError("dtype has to be \"float32\" or \"float64\", got {:s}".format(str(dtype)))
+    return res
+
+
+# Value of the ASCII characters "0-9", "A-F", and "a-f"
+# as hexadecimal digits, -1 for all other characters.
+_NIBBLES_ = np.full(256, -1, dtype = "int16")
+for _i_,_x_ in enumerate("0123456789ABCDEF"):
+    _NIBBLES_[ord(_x_)] = _i_; _NIBBLES_[ord(_x_.lower())] = _i_
+del _i_, _x_
+
+def _decode_hex_(hex_):
+    """_decode_hex_(hex_)
+
+    Decodes hex colors (``"#RRGGBB"`` or ``"#RRGGBBAA"``, where ``AA`` are
+    two decimal digits giving the alpha value in percent) without a loop
+    over the colors. The strings are viewed as a ``(n, width)`` array of
+    characters (bytes or unicode code points), the characters are
+    translated into hexadecimal digits with a lookup table.
+
+    Parameters
+    ----------
+    hex_ : str, list of str, or numpy.ndarray
+        hex colors, unicode or byte strings (e.g., ``"|S7"`` or ``"|S9"``)
+
+    Returns
+    -------
+    list
+        Returns a list ``[codes, alpha, nan]``: an integer array of shape
+        ``(n, 3)`` with the red, green, and blue values (``0`` to ``255``,
+        ``-1`` for invalid hex colors), a float array with the alpha
+        values (``nan`` for colors without alpha), and a boolean array
+        which is ``True`` for the strings ``"nan"``.
+    """
+    if isinstance(hex_, (str, bytes)): hex_ = [hex_]
+    hex_ = np.asarray(hex_)
+    if not hex_.dtype.kind in "SU": hex_ = hex_.astype("U")
+    hex_ = hex_.reshape(-1)
+
+    # Fixed-width (at least 9 characters) view on the characters
+    kind  = hex_.dtype.kind
+    width = max(9, hex_.dtype.itemsize // (4 if kind == "U" else 1))
+    hex_  = np.ascontiguousarray(hex_, dtype = "{:s}{:s}{:d}".format("<" if kind == "U" else "|",
+                                                                      kind, width))
+    chars = hex_.view("<u4" if kind == "U" else "u1").reshape(len(hex_), width)
+    size  = np.count_nonzero(chars, axis = 1)
+    head  = chars[:,0:9].astype("int16")
+
+    # Digits of the colors, alpha: two decimal digits
+    nib   = _NIBBLES_[np.minimum(head[:,1:7], 255)]
+    dec   = head[:,7:9] - ord("0")
+    valid = (head[:,0] == ord("#")) & np.all(nib >= 0, axis = 1)
+    withalpha = valid & (size == 9) & np.all((dec >= 0) & (dec <= 9), axis = 1)
+    valid = (valid & (size == 7)) | withalpha
+
+    codes = nib[:,0::2] * 16 + nib[:,1::2]
+    codes = codes.astype("int"); codes[~valid] = -1
+    alpha = np.where(withalpha, (dec[:,0] * 10 + dec[:,1]) / 100., np.nan)
+    nan   = (size == 3) & np.all(head[:,0:3] == [ord(x) for x in "nan"], axis = 1)
+    return [codes, alpha, nan]
+
+# Two-character (upper case) hex representation of 0, ..., 255 as bytes
+_HEXPAIRS_ = np.frombuffer("".join(["{:02X}".format(i) for i in range(256)]).encode("ascii"),
+                           dtype = "u1").reshape((256, 2))
+
+def _encode_hex_(codes, valid, dtype = None):
+    """_encode_hex_(codes, valid, dtype = None)
+
+    Encodes 8-bit colors as hex colors (``"#RRGGBB"``) without a loop over
+    the colors: the characters are assembled in a ``(n, 7)`` byte array
+    using a table with the two hex digits of all 256 values.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        integer array of shape ``(n, 3)`` with the red, green, and blue
+        values (``0`` to ``255``)
+    valid : numpy.ndarray
+        boolean array of length ``n``, ``False`` for invalid colors
+    dtype : None or str
+        ``None`` (default) returns a list of str (``nan`` for invalid
+        colors), ``"U7"`` or ``"S7"`` a `numpy.ndarray` of this type
+        (``"nan"`` for invalid colors)
+
+    Returns
+    -------
+    list or numpy.ndarray
+        Returns the hex colors.
+    """
+    if not dtype is None and not np.dtype(dtype) in [np.dtype("U7"), np.dtype("S7")]:
+        raise ValueError("dtype has to be None, \"U7\", or \"S7\", got {:s}".format(str(dtype)))
+    codes = np.asarray(codes)
+    buf   = np.empty((len(codes), 7), dtype = "u1")
+    buf[:,0] = ord("#")
+    for i in range(3): np.take(_HEXPAIRS_, codes[:,i], axis = 0, out = buf[:,1 + 2 * i:3 + 2 * i])
+    res = buf.view("S7").reshape(-1)
+
+    invalid = ~np.asarray(valid, dtype = bool)
+    if dtype is None:
+        res = res.astype("U7").tolist()
+        for i in np.where(invalid)[0]: res[i] = np.nan
+        return res
+    if not np.dtype(dtype).kind == "S": res = res.astype("U7")
+    res[invalid] = "nan"
+    return res
+
+
+def _pack_(codes, valid):
+    """_pack_(codes, valid)
+
+    Packs 8-bit colors into 32-bit integers ``0xRRGGBBAA`` (opaque,
+    alpha byte ``255``), see :py:class:`packedRGBA`. Invalid colors
+    are packed as transparent black (``0``).
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        integer array of shape ``(n, 3)`` with the red, green, and blue
+        values (``0`` to ``255``)
+    valid : numpy.ndarray
+        boolean array of length ``n``, ``False`` for invalid colors
+
+    Returns
+    -------
+    numpy.ndarray
+        Returns an ``uint32`` array of length ``n``.
+    """
+    codes = np.asarray(codes).astype("uint32")
+    res   = codes[:,0] << np.uint32(24)
+    res  |= codes[:,1] << np.uint32(16)
+    res  |= codes[:,2] << np.uint32(8)
+    res  |= np.uint32(255)
+    res[~np.asarray(valid, dtype = bool)] = 0
+    return res
+
+def _unpack_(x):
+    """_unpack_(x)
+
+    Unpacks 32-bit colors ``0xRRGGBBAA`` (see :py:class:`packedRGBA`).
+
+    Returns
+    -------
+    numpy.ndarray
+        Returns an ``uint8`` array of shape ``(n, 4)`` with the red,
+        green, blue, and alpha bytes.
+    """
+    x   = np.asarray(x, dtype = "uint32")
+    res = np.empty((len(x), 4), dtype = "uint8")
+    for i,shift in enumerate([24, 16, 8, 0]): res[:,i] = (x >> np.uint32(shift)) & np.uint32(255)
+    return res
+
+def _column_base_(cols):
+    """_column_base_(cols)
+
+    Checks whether the one-dimensional arrays in ``cols`` are consecutive
+    column views of one C-contiguous ``(n, len(cols))`` array (as returned
+    by e.g., :py:func:`colorlib.RGB_to_XYZ` or stored on a
+    :py:class:`colorobject`).
+
+    Parameters
+    ----------
+    cols : list
+        list of `numpy.ndarray`'s
+
+    Returns
+    -------
+    None or numpy.ndarray
+        Returns a (zero-copy) view on the ``(n, len(cols))`` array if all
+        columns share one memory block, ``None`` otherwise.
+    """
+    if not np.all([isinstance(x, np.ndarray) and x.ndim == 1 for x in cols]): return None
+    dtype = cols[0].dtype; k = len(cols); n = len(cols[0])
+    if not dtype.kind == "f" or n == 0: return None
+    ptr = cols[0].__array_interface__["data"][0]
+    for i,x in enumerate(cols):
+        if not x.dtype == dtype or not len(x) == n: return None
+        if not x.strides[0] == k * dtype.itemsize: return None
+        if not x.__array_interface__["data"][0] == ptr + i * dtype.itemsize: return None
+    from numpy.lib.stride_tricks import as_strided
+    return as_strided(cols[0], shape = (n, k), strides = (k * dtype.itemsize, dtype.itemsize),
+                      writeable = cols[0].flags.writeable)
+
+
+class workspace(object):
+    """workspace()
+
+    Reusable buffers for the transformations of :py:class:`colorlib`.
+
+    By default each transformation allocates new arrays for its results
+    and intermediate results. When converting many arrays of the same size
+    (e.g., the frames of a video) a workspace can be attached to the
+    :py:class:`colorlib` object (or used with
+    :py:func:`conversiongraph.transform`); the intermediate arrays are then
+    allocated once (per name, shape, and type) and re-used in all
+    subsequent calls. Combined with the ``out`` arguments of the
+    transformations, repeated conversions do not allocate new arrays
+    after the first call.
+
+    A workspace must not be shared between threads.
+
+    Examples
+    --------
+    >>> from colorspace.colorlib import colorlib, workspace
+    >>> import numpy as np
+    >>> ws   = workspace()
+    >>> clib = colorlib(validate = False, workspace = ws)
+    >>> rgb  = np.random.uniform(0, 1, (3, 1000))
+    >>> hcl  = np.empty((3, 1000))
+    >>> for i in range(10):
+    >>>     clib.sRGB_to_polarLUV(rgb[0], rgb[1], rgb[2], out = [hcl[0], hcl[1], hcl[2]])
+    >>> ws
+    """
+
+    def __init__(self):
+
+        self._buffers_ = {}
+
+    def __repr__(self):
+        return "workspace ({:d} buffers, {:d} bytes)".format(len(self._buffers_), self.nbytes())
+
+    def buffer(self, name, shape, dtype = "float"):
+        """buffer(name, shape, dtype = "float")
+
+        Returns the buffer ``name``. A new (uninitialized) buffer is
+        allocated if the buffer does not yet exist or has a different
+        shape or type.
+
+        Parameters
+        ----------
+        name : str
+            name of the buffer
+        shape : int or tuple
+            shape of the buffer
+        dtype : str or numpy.dtype
+            type of the buffer
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns the buffer.
+        """
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        key   = (name, np.dtype(dtype).str)
+        buf   = self._buffers_.get(key)
+        if buf is None or not buf.shape == shape:
+            buf = np.empty(shape, dtype = dtype)
+            self._buffers_[key] = buf
+        return buf
+
+    def nbytes(self):
+        """nbytes()
+
+        Returns
+        -------
+        int
+            Returns the number of bytes allocated by the workspace.
+        """
+        return int(np.sum([x.nbytes for x in self._buffers_.values()]))
+
+    def clear(self):
+        """clear()
+
+        Releases all buffers.
+        """
+        self._buffers_ = {}
+
 
 class colorlib(object):
-    """The colorlib class is a collection of methods
+    """colorlib(validate = True, workspace = None, dtype = "float64")
+
+    The colorlib class is a collection of methods
     used to convert or transform colors between different
-    color spaces."""
+    color spaces.
+
+    Parameters
+    ----------
+    validate : bool
+        if ``True`` (default) the inputs of all methods are checked (types,
+        lengths, white point specification). If ``False`` the checks are
+        skipped; the inputs have to be float `numpy.ndarray`'s of the same
+        length (the white point either of length one or of the same length).
+        Used for pre-validated data, e.g., by the conversions of the
+        :py:class:`colorobject`'s, where the checks dominate the
+        runtime for small palettes.
+    workspace : None or workspace
+        if set, all intermediate arrays are taken from (and kept on) the
+        :py:class:`workspace`, see also the ``out`` arguments of the methods.
+    dtype : str or numpy.dtype
+        floating point precision of the results and intermediate arrays,
+        ``"float64"`` (default) or ``"float32"``. Single precision halves
+        the memory traffic of large (image) conversions and is accurate to
+        well below the resolution of 8-bit (hex) colors.
+
+    Examples
+    --------
+    >>> from colorspace.colorlib import colorlib
+    >>> from numpy import asarray
+    >>> clib = colorlib(validate = False)
+    >>> [L, U, V] = clib.polarLUV_to_LUV(asarray([70.]), asarray([50.]), asarray([120.]))
+    """
 
+    # Check inputs (default), no workspace, double precision
+    validate  = True
+    workspace = None
+    dtype     = np.dtype("float64")
 
-    # No initialization method, but some constants are specified here
+    def __init__(self, validate = True, workspace = None, dtype = "float64"):
+        self.validate  = bool(validate)
+        self.workspace = workspace
+        self.dtype     = _check_dtype_(dtype)
 
     # Often approximated as 903.3 */
     # static const double self.KAPPA = 24389.0/27.0;
@@ -52,6 +378,15 @@ class colorlib(object):
     # Also, instead of the oft-used approximation 7.787 we use (self.KAPPA / 116)
     EPSILON = 216.0/24389.0
 
+    # Linear transformation matrices between device
+    # independent RGB and CIEXYZ (used with YN = 1)
+    _RGB_TO_XYZ_ = np.asarray([[0.412453,  0.357580, 0.180423],
+                               [0.212671,  0.715160, 0.072169],
+                               [0.019334,  0.119193, 0.950227]])
+    _XYZ_TO_RGB_ = np.asarray([[3.240479, -1.537150, -0.498535],
+                               [-0.969256, 1.875992,  0.041556],
+                               [0.055648, -0.204043,  1.057311]])
+
     # Default white spot
     XN = np.asarray([ 95.047])
     YN = np.asarray([100.000])
@@ -102,7 +437,8 @@ class colorlib(object):
         white color) has to be specified. This function checks and prepares the
         XN, YN, ZN definition. Defaults are used if the user does not specify a
         custom white splot. If set, XN, YN, ZN have to be of type np.ndarray
-        either of length one (will be expanded to length "n") or of length n.
+        either of length one (not expanded, used via numpy broadcasting)
+        or of length n.
 
         Parameters
         ----------
@@ -110,7 +446,8 @@ class colorlib(object):
             string, name of the parent method, only used if errors are dropped.
             @TODO get rid of this thing and write a proper exception.
         n : int
-            integer, number of colors to which NX, NY, NZ will be expanded
+            integer, number of colors (expected length of NX, NY, NZ if
+            not of length one)
         XN : None, numpy.ndarray
             either None (default) or an nd.array of length one
             or length n. White point specification for dimension X
@@ -122,30 +459,28 @@ class colorlib(object):
         Returns
         -------
         list
-            Returns a list ``[XN, YN, ZN]`` with three ``numpy.ndarrays`` of length ``n``.
-            If the inputs XN, YN, ZN (or some) were ``None``: take class defaults.
+            Returns a list ``[XN, YN, ZN]`` with three ``numpy.ndarrays`` of length
+            ``1`` or ``n``. If the inputs XN, YN, ZN (or some) were ``None``:
+            take class defaults.
         """
 
         # Take defaults if not further specified
-        if not XN: XN = self.XN
-        if not YN: YN = self.YN
-        if not ZN: ZN = self.ZN
+        if XN is None: XN = self.XN
+        if YN is None: YN = self.YN
+        if ZN is None: ZN = self.ZN
 
-        if isinstance(XN,float): XN = np.asarray([XN])
-        if isinstance(YN,float): YN = np.asarray([YN])
-        if isinstance(ZN,float): ZN = np.asarray([ZN])
+        if isinstance(XN, (float, int)): XN = np.asarray([XN], dtype = self.dtype)
+        if isinstance(YN, (float, int)): YN = np.asarray([YN], dtype = self.dtype)
+        if isinstance(ZN, (float, int)): ZN = np.asarray([ZN], dtype = self.dtype)
+        if not self.validate: return [XN, YN, ZN]
 
         # Checking type
-        if not np.all(isinstance(x, np.ndarray) for x in [XN, YN, ZN]):
+        if not np.all([isinstance(x, np.ndarray) for x in [XN, YN, ZN]]):
             raise ValueError("Inputs to {:s} have to be of class np.ndarray.".format(__fname__))
     
-        # Expand if required
-        if len(XN) == 1 and not len(XN) == n: XN = np.repeat(XN, n)
-        if len(YN) == 1 and not len(YN) == n: YN = np.repeat(YN, n)
-        if len(ZN) == 1 and not len(ZN) == n: ZN = np.repeat(ZN, n)
-    
-        # Check if all lengths match
-        if not np.all([len(x) == n for x in [XN, YN, ZN]]):
+        # Check if all lengths match; no need to expand white points
+        # of length one, numpy broadcasting takes care of it.
+        if not np.all([len(x) == n or len(x) == 1 for x in [XN, YN, ZN]]):
             raise ValueError("Inputs XN/YN/ZN to {:s} have to be of the same length.".format(__fname__))
 
         return [XN, YN, ZN]
@@ -172,6 +507,8 @@ class colorlib(object):
             Returns ``True`` if everything is ok, else a ValueError will be raised. 
         """
 
+        if not self.validate: return True
+
         # Message will be dropped if problems occur
         msg = "Problem while checking inputs \"{:s}\" to method \"{:s}\":".format(
                 ", ".join(kwargs.keys()), __fname__)
@@ -191,13 +528,125 @@ class colorlib(object):
         # Check if all do have the same length
         if not np.all([x == lengths[0] for x in lengths]):
             msg += " Arguments of different lengths: {:s}".format(
-                   ", ".join(["{:s} = {:d}".format(kwargs.keys()[i],lengths[i]) \
+                   ", ".join(["{:s} = {:d}".format(list(kwargs.keys())[i],lengths[i]) \
                    for i in range(0,len(kwargs))]))
             raise ValueError(msg)
 
 
         return True
 
+    def _buffer_(self, name, shape, dtype = None):
+        """_buffer_(name, shape, dtype = None)
+
+        Returns a buffer for intermediate results. Taken from the
+        :py:class:`workspace` if set, else a new array is allocated.
+
+        Parameters
+        ----------
+        name : str
+            name of the buffer, unique for each use
+            (e.g., ``"<name of the method>.<variable>"``)
+        shape : int or tuple
+            shape of the buffer
+        dtype : None, str or numpy.dtype
+            type of the buffer, ``None`` (default) for the floating point
+            precision of the object (see ``dtype``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an uninitialized array.
+        """
+        if dtype is None: dtype = self.dtype
+        if self.workspace is None: return np.empty(shape, dtype = dtype)
+        return self.workspace.buffer(name, shape, dtype)
+
+    def _columns_(self, name, n):
+        """_columns_(name, n)
+
+        Returns the three columns of an ``(n, 3)`` buffer (see
+        :py:func:`_buffer_`), used for the intermediate results of
+        transformations involving matrix multiplications.
+
+        Returns
+        -------
+        list
+            List of three `numpy.ndarray`'s (views) of length ``n``.
+        """
+        buf = self._buffer_(name, (n, 3))
+        return [buf[:,0], buf[:,1], buf[:,2]]
+
+    def _out_(self, __fname__, out, n, k = 3):
+        """_out_(__fname__, out, n, k = 3)
+
+        Prepares the arrays to store the results of a transformation.
+
+        Parameters
+        ----------
+        __fname__ : str
+            name of the method who called this routine.
+            Only used to drop a useful error message if required
+        out : None or list
+            either ``None`` (allocate new arrays) or a list of ``k``
+            `numpy.ndarray`'s of length ``n``
+        n : int
+            number of colors
+        k : int
+            number of result arrays
+
+        Returns
+        -------
+        list
+            Returns a list of ``k`` `numpy.ndarray`'s, raises a ValueError
+            if ``out`` does not fulfil the requirements.
+        """
+        if out is None: return [np.empty(n, dtype = self.dtype) for i in range(k)]
+        if self.validate:
+            if not isinstance(out, (list, tuple)) or not len(out) == k or \
+               not np.all([isinstance(x, np.ndarray) and x.shape == (n,) for x in out]):
+                raise ValueError("input out to {:s} has to be a list of ".format(__fname__) + \
+                        "{:d} numpy.ndarray's of length {:d}".format(k, n))
+        return list(out)
+
+    def _matmul_(self, __fname__, M, cols, YN, fun, out):
+        """_matmul_(__fname__, M, cols, YN, fun, out)
+
+        Applies the linear transformation ``M`` (a ``3 x 3`` matrix) on the
+        colors given by ``cols`` and scales the result with the white point
+        (``fun`` is ``numpy.multiply`` or ``numpy.divide``). One matrix
+        multiplication on an ``(n, 3)`` array: no copy is made if the three
+        arrays in ``cols`` (or ``out``) are the columns of one ``(n, 3)`` array
+        (e.g., the coordinates stored on a :py:class:`colorobject`).
+
+        Returns
+        -------
+        list
+            List of three `numpy.ndarray`'s (``out`` if specified).
+        """
+        n = len(cols[0])
+        x = _column_base_(cols)
+        if x is None:
+            x = self._buffer_(__fname__ + ".in", (n, 3))
+            for i,c in enumerate(cols): x[:,i] = c
+
+        # Write directly into 'out' if possible
+        res = None if out is None else _column_base_(out)
+        direct = not res is None
+        if out is None:
+            res = np.empty((n, 3), dtype = self.dtype)
+        elif not direct:
+            res = self._buffer_(__fname__ + ".out", (n, 3))
+        elif np.shares_memory(res, x):
+            tmp = self._buffer_(__fname__ + ".in", (n, 3)); tmp[:] = x; x = tmp
+
+        np.matmul(x, M.T.astype(res.dtype, copy = False), out = res)
+        fun(res, YN.reshape(-1, 1), out = res)
+
+        if out is None: return [res[:,0], res[:,1], res[:,2]]
+        if not direct:
+            for i in range(3): np.copyto(out[i], res[:,i])
+        return list(out)
+
     
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
@@ -220,8 +669,39 @@ class colorlib(object):
     #  gtrans maps linearized sRGB to sRGB.
     #  ftrans provides the inverse map.
     
-    def gtrans(self, u, gamma):
-        """gtrans(u, gamma)
+    def _check_gamma_(self, __fname__, u, gamma):
+        """_check_gamma_(__fname__, u, gamma)
+
+        Prepares the ``gamma`` input for the gamma correction kernels.
+        ``gamma`` can either be a single value (used for all elements of
+        ``u``) or an array with one value per element of ``u``. The
+        gamma value is never expanded to the length of ``u``, the kernels
+        rely on numpy broadcasting.
+
+        Parameters
+        ----------
+        __fname__ : str
+            name of the method who called this check routine.
+            Only used to drop a useful error message if required
+        u : numpy.ndarray
+            the values to be transformed
+        gamma : float or numpy.ndarray
+            gamma value(s)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns ``gamma`` as a float `numpy.ndarray`. Raises a ValueError
+            if the number of gamma values does not match the length of ``u``.
+        """
+        gamma = np.asarray(gamma, dtype = "float")
+        if not gamma.size == 1 and not gamma.shape == np.shape(u):
+            raise ValueError("input gamma to {:s} has to be a single ".format(__fname__) + \
+                    "value or of the same length as the data to be transformed")
+        return gamma.reshape(()) if gamma.size == 1 else gamma
+
+    def gtrans(self, u, gamma, out = None):
+        """gtrans(u, gamma, out = None)
         
         Gamma Correction.
 
@@ -240,6 +720,10 @@ class colorlib(object):
         gamma : float or numpy.ndarray
             gamma value. If float or `numpy.ndarray` of length one
             gamma will be recycled (if length ``u > 1``)
+        out : None or numpy.ndarray
+            optional float array of the same length as ``u`` to store
+            the result. Can be ``u`` itself for an in-place transformation.
+            If ``None`` (default) a new array is allocated
 
         Returns
         -------
@@ -247,25 +731,24 @@ class colorlib(object):
             Same length as input ``u``.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-    
         # Input check
-        if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(u):
-            gamma = np.repeat(gamma, len(u))
-
-        # Checking inputs
-        self._check_input_arrays_(__fname__, u = u, gamma = gamma)
-
-        # Transform
-        for i,val in np.ndenumerate(u):
-            if val > 0.00304: u[i] = 1.055 * np.power(val, (1. / gamma[i])) - 0.055
-            else:             u[i] = 12.92 * val
-    
-        return u
-    
-    def ftrans(self, u, gamma):
-        """ftrans(u, gamma)
+        u     = np.asarray(u, dtype = self.dtype)
+        gamma = self._check_gamma_("gtrans", u, gamma)
+        if out is None: out = np.empty_like(u)
+
+        # Transform; the masks have to be evaluated before writing
+        # to 'out' as 'out' may be 'u' itself.
+        idx  = np.greater(u, 0.00304, out = self._buffer_("gtrans.idx", u.shape, "bool"))
+        nidx = np.logical_not(idx, out = self._buffer_("gtrans.nidx", u.shape, "bool"))
+        np.multiply(u, 12.92, out = out, where = nidx)
+        np.power(u, 1. / gamma, out = out, where = idx)
+        np.multiply(out, 1.055, out = out, where = idx)
+        np.subtract(out, 0.055, out = out, where = idx)
+    
+        return out
+    
+    def ftrans(self, u, gamma, out = None):
+        """ftrans(u, gamma, out = None)
         
         Gamma Correction.
 
@@ -286,6 +769,10 @@ class colorlib(object):
         gamma : float or numpy.ndarray
             gamma value. If float or `numpy.ndarray` of length one
             gamma will be recycled (if length ``u > 1``)
+        out : None or numpy.ndarray
+            optional float array of the same length as ``u`` to store
+            the result. Can be ``u`` itself for an in-place transformation.
+            If ``None`` (default) a new array is allocated
 
         Returns
         -------
@@ -293,25 +780,95 @@ class colorlib(object):
             Same length as input ``u``.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
         # Input check
-        if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(u):
-            gamma = np.repeat(gamma, len(u))
+        u     = np.asarray(u, dtype = self.dtype)
+        gamma = self._check_gamma_("ftrans", u, gamma)
+        if out is None: out = np.empty_like(u)
+
+        # Transform; the masks have to be evaluated before writing
+        # to 'out' as 'out' may be 'u' itself.
+        idx  = np.greater(u, 0.03928, out = self._buffer_("ftrans.idx", u.shape, "bool"))
+        nidx = np.logical_not(idx, out = self._buffer_("ftrans.nidx", u.shape, "bool"))
+        np.divide(u, 12.92, out = out, where = nidx)
+        np.add(u, 0.055, out = out, where = idx)
+        np.divide(out, 1.055, out = out, where = idx)
+        np.power(out, gamma, out = out, where = idx)
+    
+        return out
+    
+    # Cache for the 8-bit tables, see _srgb8_tables_
+    _SRGB8_ = {}
+
+    def _srgb8_tables_(self, gamma):
+        """_srgb8_tables_(gamma)
+
+        Tables for colors with 8-bit sRGB coordinates (hex colors, ``uint8``
+        images). The linearization table contains :py:func:`ftrans` of the
+        256 values ``k / 255``. The quantization table contains the smallest
+        linear (RGB) value mapped onto the 8-bit sRGB value ``k`` for
+        ``k = 1, ..., 255`` by :py:func:`gtrans` and the rounding used for
+        the hex colors (``int(x * 255 + .5)``), found by bisection on the
+        floating point numbers. Both give exactly the same results as the
+        gamma correction. The tables are computed once per gamma and
+        floating point precision and cached on the class.
 
-        # Checking inputs
-        self._check_input_arrays_(__fname__, u = u, gamma = gamma)
-    
-        # Transform 
-        for i,val in np.ndenumerate(u):
-            if val > 0.03928: u[i] = np.power((val + 0.055) / 1.055, gamma[i])
-            else:             u[i] = val / 12.92
-    
-        return u
-    
-    def DEVRGB_to_RGB(self, R, G, B, gamma = 2.4):
-        """DEVRGB_to_RGB(R, G, B, gamma = 2.4)
+        Parameters
+        ----------
+        gamma : float or numpy.ndarray
+            gamma value
+
+        Returns
+        -------
+        list or None
+            Returns a list ``[lut, thresholds, over]``: the linearization table
+            (length ``257``, the last element is ``nan`` for invalid colors),
+            the quantization table (length ``255``), and the smallest linear
+            value with an sRGB value above one. ``None`` if gamma is specified
+            per color or if the gamma correction is not monotonic (the
+            constants of the linear part are those of gamma ``2.4``).
+        """
+        gamma = np.asarray(gamma, dtype = "float")
+        if not gamma.size == 1: return None
+        key = (float(gamma.flatten()[0]), self.dtype.str)
+        if key in self._SRGB8_: return self._SRGB8_[key]
+
+        clib  = colorlib(validate = False, dtype = self.dtype)
+        gamma = key[0]
+        def codes(u):
+            return np.asarray(np.asarray(clib.gtrans(u, gamma), dtype = "float") * 255. + .5,
+                              dtype = "int")
+
+        lut = clib.ftrans(np.arange(256) / 255., gamma)
+        lut = np.append(lut, np.asarray(np.nan, dtype = self.dtype))
+
+        # Bisection on the (ordered) bit patterns of the non-negative floats:
+        # smallest u with codes(u) >= k, and smallest u with gtrans(u) > 1.
+        itype = "int{:d}".format(8 * self.dtype.itemsize)
+        k     = np.arange(1, 257)
+        lo    = np.zeros(256, dtype = itype)
+        hi    = np.full(256, np.asarray(2., dtype = self.dtype).view(itype))
+        while np.any(lo < hi):
+            mid = lo + (hi - lo) // 2
+            u   = mid.view(self.dtype)
+            ge  = np.append(codes(u[:-1]) >= k[:-1], clib.gtrans(u[-1:], gamma) > 1.)
+            hi  = np.where(ge, mid, hi)
+            lo  = np.where(ge, lo, mid + 1)
+        thresholds = lo[:-1].view(self.dtype)
+        over       = lo[-1:].view(self.dtype)[0]
+
+        # The bisection relies on gtrans being monotonic; checked on a
+        # dense grid and next to all thresholds, else no tables are used.
+        u = np.concatenate([np.linspace(0., 1., 100001, dtype = self.dtype),
+                            thresholds, np.nextafter(thresholds, self.dtype.type(0))])
+        if np.array_equal(codes(u), np.searchsorted(thresholds, u, side = "right")):
+            res = [lut, thresholds, over]
+        else:
+            res = None
+        self._SRGB8_[key] = res
+        return res
+
+    def DEVRGB_to_RGB(self, R, G, B, gamma = 2.4, out = None):
+        """DEVRGB_to_RGB(R, G, B, gamma = 2.4, out = None)
 
         Device dependent sRGB to device independent RGB.
 
@@ -323,8 +880,13 @@ class colorlib(object):
             indensities for green (``[0.,1.]``)
         B : numpy.ndarray
             indensities for blue  (``[0.,1.]``)
-        gamma : float
-            gamma adjustment.
+        gamma : float or numpy.ndarray
+            gamma adjustment, a single value or one value per color.
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results. Can be the inputs themselves
+            for an in-place transformation. If ``None`` (default) new arrays
+            are allocated.
 
         Returns
         -------
@@ -332,21 +894,16 @@ class colorlib(object):
             Returns a list of `numpy.ndarrays` with adjusted R, G, and B values.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Input check
-        if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(R):
-            gamma = np.repeat(gamma, len(R))
-
         # Checking inputs
-        self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        self._check_input_arrays_("DEVRGB_to_RGB", R = R, G = G, B = B)
+        gamma = self._check_gamma_("DEVRGB_to_RGB", R, gamma)
+        out   = self._out_("DEVRGB_to_RGB", out, len(R))
     
         # Apply gamma correction
-        return [self.ftrans(x, gamma) for x in [R, G, B]]
+        return [self.ftrans(x, gamma, out = o) for x,o in zip([R, G, B], out)]
     
-    def RGB_to_DEVRGB(self, R, G, B, gamma = 2.4):
-        """DEVRGB_to_RGB(R, G, B, gamma = 2.4)
+    def RGB_to_DEVRGB(self, R, G, B, gamma = 2.4, out = None):
+        """RGB_to_DEVRGB(R, G, B, gamma = 2.4, out = None)
 
         Device independent RGB to device dependent sRGB.
 
@@ -358,8 +915,13 @@ class colorlib(object):
             indensities for green (``[0.,1.]``).
         B : numpy.ndarray
             indensities for blue  (``[0.,1.]``).
-        gamma : float
-            gamma adjustment.
+        gamma : float or numpy.ndarray
+            gamma adjustment, a single value or one value per color.
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results. Can be the inputs themselves
+            for an in-place transformation. If ``None`` (default) new arrays
+            are allocated.
 
         Returns
         -------
@@ -367,18 +929,13 @@ class colorlib(object):
             Returns a list of `numpy.ndarrays` with adjusted R, G, and B values.
         """
     
-        __fname__ = inspect.stack()[0][3] # Name of this method
-
-        # Input check
-        if isinstance(gamma, float): gamma = np.asarray([gamma])
-        if len(gamma) == 1 and not len(gamma) == len(R):
-            gamma = np.repeat(gamma, len(R))
-
         # Checking inputs
-        self._check_input_arrays_(__fname__, R = R, G = G, B = B, gamma = gamma)
+        self._check_input_arrays_("RGB_to_DEVRGB", R = R, G = G, B = B)
+        gamma = self._check_gamma_("RGB_to_DEVRGB", R, gamma)
+        out   = self._out_("RGB_to_DEVRGB", out, len(R))
     
         # Apply gamma correction
-        return [self.gtrans(x, gamma) for x in [R, G, B]]
+        return [self.gtrans(x, gamma, out = o) for x,o in zip([R, G, B], out)]
     
     
     # -------------------------------------------------------------------
@@ -390,8 +947,8 @@ class colorlib(object):
     ## R, G, and B give the levels of red, green and blue as values
     ## in the interval [0,1].  X, Y and Z give the CIE chromaticies.
     ## XN, YN, ZN gives the chromaticity of the white point.
-    def RGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None):
-        """RGB_to_XYZ(R, G, B, XN = None, YN = None, ZN = None)
+    def RGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None, out = None):
+        """RGB_to_XYZ(R, G, B, XN = None, YN = None, ZN = None, out = None)
         
         Device independent RGB to XYZ.
 
@@ -410,6 +967,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three ``None``) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -418,7 +979,7 @@ class colorlib(object):
             a list of `numpy.ndarray`'s of the same length as the inputs (``[X, Y, Z]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_XYZ" # Name of this method
         n = len(R) # Number of colors
 
         # Loading definition of white
@@ -426,15 +987,14 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, R = R, G = G, B = B)
+        out = self._out_(__fname__, out, n) if not out is None else None
     
         # TODO only YN is used as in the original code. Is this correct, or
         # correct by accident?
-        return [YN * (0.412453 * R + 0.357580 * G + 0.180423 * B),   # X
-                YN * (0.212671 * R + 0.715160 * G + 0.072169 * B),   # Y
-                YN * (0.019334 * R + 0.119193 * G + 0.950227 * B)]   # Z
+        return self._matmul_(__fname__, self._RGB_TO_XYZ_, [R, G, B], YN, np.multiply, out)
     
-    def XYZ_to_RGB(self, X, Y, Z, XN = None, YN = None, ZN = None):
-        """XYZ_to_RGB(X, Y, Z, XN = None, YN = None, ZN = None)
+    def XYZ_to_RGB(self, X, Y, Z, XN = None, YN = None, ZN = None, out = None):
+        """XYZ_to_RGB(X, Y, Z, XN = None, YN = None, ZN = None, out = None)
         
         CIEXYZ to device independent RGB.
 
@@ -453,6 +1013,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three ``None``) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -462,7 +1026,7 @@ class colorlib(object):
             B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_RGB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -470,12 +1034,11 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        out = self._out_(__fname__, out, n) if not out is None else None
     
         # TODO only YN is used as in the original code. Is this correct, or
         # correct by accident?
-        return [( 3.240479 * X - 1.537150 * Y - 0.498535 * Z) / YN,   # R
-                (-0.969256 * X + 1.875992 * Y + 0.041556 * Z) / YN,   # G
-                ( 0.055648 * X - 0.204043 * Y + 1.057311 * Z) / YN]   # B
+        return self._matmul_(__fname__, self._XYZ_TO_RGB_, [X, Y, Z], YN, np.divide, out)
     
     
     # -------------------------------------------------------------------
@@ -488,8 +1051,8 @@ class colorlib(object):
     ## R, G, and B give the levels of red, green and blue as values
     ## in the interval [0,1].  X, Y and Z give the CIE chromaticies.
     ## XN, YN, ZN gives the chromaticity of the white point.
-    def sRGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None):
-        """sRGB_to_XYZ(R, G, B, XN = None, YN = None, ZN = None)
+    def sRGB_to_XYZ(self, R, G, B, XN = None, YN = None, ZN = None, out = None):
+        """sRGB_to_XYZ(R, G, B, XN = None, YN = None, ZN = None, out = None)
         
         sRGB to CIEXYZ.
         
@@ -508,6 +1071,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three ``None``) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -517,7 +1084,7 @@ class colorlib(object):
             Z]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_XYZ" # Name of this method
         n = len(R) # Number of colors
 
         # Loading definition of white
@@ -525,19 +1092,17 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, R = R, G = G, B = B)
+        out = self._out_(__fname__, out, n) if not out is None else None
     
         # Transform R/G/B
-        R = self.ftrans(R, 2.4)
-        G = self.ftrans(G, 2.4)
-        B = self.ftrans(B, 2.4)
+        rgb = self._columns_("sRGB_to_XYZ.rgb", n)
+        for x,o in zip([R, G, B], rgb): self.ftrans(x, 2.4, out = o)
 
         # Convert to X/Y/Z coordinates
-        return[YN * (0.412453 * R + 0.357580 * G + 0.180423 * B),   # X
-               YN * (0.212671 * R + 0.715160 * G + 0.072169 * B),   # Y
-               YN * (0.019334 * R + 0.119193 * G + 0.950227 * B)]   # Z
+        return self._matmul_(__fname__, self._RGB_TO_XYZ_, rgb, YN, np.multiply, out)
     
-    def XYZ_to_sRGB(self, X, Y, Z, XN = None, YN = None, ZN = None):
-        """XYZ_to_sRGB(X, Y, Z, XN = None, YN = None, ZN = None)
+    def XYZ_to_sRGB(self, X, Y, Z, XN = None, YN = None, ZN = None, out = None):
+        """XYZ_to_sRGB(X, Y, Z, XN = None, YN = None, ZN = None, out = None)
         
         CIEXYZ to sRGB.
 
@@ -556,6 +1121,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -565,7 +1134,7 @@ class colorlib(object):
             B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_sRGB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -573,11 +1142,11 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        out = self._out_(__fname__, out, n) if not out is None else None
     
-        # Transform and return
-        return [self.gtrans(( 3.240479 * X - 1.537150 * Y - 0.498535 * Z) / YN, 2.4),   # R
-                self.gtrans((-0.969256 * X + 1.875992 * Y + 0.041556 * Z) / YN, 2.4),   # G
-                self.gtrans(( 0.055648 * X - 0.204043 * Y + 1.057311 * Z) / YN, 2.4)]   # B
+        # Transform (gamma correction in-place) and return
+        rgb = self._matmul_(__fname__, self._XYZ_TO_RGB_, [X, Y, Z], YN, np.divide, out)
+        return [self.gtrans(x, 2.4, out = x) for x in rgb]
     
     
     
@@ -589,8 +1158,62 @@ class colorlib(object):
     ## ----- CIE-XYZ <-> CIE-LAB ----- */
     
     
-    def LAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None):
-        """LAB_to_XYZ(L, A, B, XN = None, YN = None, ZN = None)
+    def _lab_f_(self, t, out = None):
+        """_lab_f_(t, out = None)
+
+        Piecewise function used for the CIELAB transformation,
+        ``f(t) = t^(1/3)`` for ``t > EPSILON``, ``(KAPPA / 116) * t + 16 / 116``
+        else.
+
+        Parameters
+        ----------
+        t : numpy.ndarray
+            scaled X, Y, or Z coordinates (e.g., ``X / XN``)
+        out : None or numpy.ndarray
+            array to store the result, can be ``t`` itself
+
+        Returns
+        -------
+        numpy.ndarray
+            Same length as input ``t``.
+        """
+        if out is None: out = np.empty_like(t)
+        idx  = np.greater(t, self.EPSILON, out = self._buffer_("_lab_f_.idx", t.shape, "bool"))
+        nidx = np.logical_not(idx, out = self._buffer_("_lab_f_.nidx", t.shape, "bool"))
+        np.cbrt(t, out = out, where = idx)
+        np.multiply(t, self.KAPPA / 116., out = out, where = nidx)
+        np.add(out, 16. / 116., out = out, where = nidx)
+        return out
+
+    def _lab_finv_(self, f, out = None):
+        """_lab_finv_(f, out = None)
+
+        Inverse of :py:func:`_lab_f_`, ``t = f^3`` for ``f^3 > EPSILON``,
+        ``(f - 16 / 116) / (KAPPA / 116)`` else.
+
+        Parameters
+        ----------
+        f : numpy.ndarray
+            values of ``f(t)``
+        out : None or numpy.ndarray
+            array to store the result, can be ``f`` itself
+
+        Returns
+        -------
+        numpy.ndarray
+            Same length as input ``f``.
+        """
+        if out is None: out = np.empty_like(f)
+        cube = np.power(f, 3., out = self._buffer_("_lab_finv_.cube", f.shape))
+        idx  = np.less_equal(cube, self.EPSILON, out = self._buffer_("_lab_finv_.idx", f.shape, "bool"))
+        nidx = np.logical_not(idx, out = self._buffer_("_lab_finv_.nidx", f.shape, "bool"))
+        np.subtract(f, 16. / 116., out = out, where = idx)
+        np.divide(out, self.KAPPA / 116., out = out, where = idx)
+        np.copyto(out, cube, where = nidx)
+        return out
+
+    def LAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None, out = None):
+        """LAB_to_XYZ(L, A, B, XN = None, YN = None, ZN = None, out = None)
         
         CIELAB to CIEXYZ.
 
@@ -606,6 +1229,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -614,7 +1241,7 @@ class colorlib(object):
             of `numpy.ndarray`'s of the same length as the inputs (``[X, Y, Z]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_XYZ" # Name of this method
         n = len(L) # Number of colors
 
         # Loading definition of white
@@ -622,46 +1249,42 @@ class colorlib(object):
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
-    
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
-    
-        # Calculate Y
-        for i,val in np.ndenumerate(L):
-            if   val <= 0:    Y[i] = 0.
-            elif val <= 8.0:  Y[i] = val * YN[i] / self.KAPPA
-            elif val <= 100.: Y[i] = YN[i] * np.power((val + 16.) / 116., 3.)
-            else:             Y[i] = YN[i]
-    
-        fy = np.ndarray(len(Y), dtype = "float")
-        for i,val in np.ndenumerate(Y):
-            if val <= (self.EPSILON * YN[i]):
-                fy[i] = (self.KAPPA / 116.) * val / YN[i] + 16. / 116.
-            else:
-                fy[i] = np.power(val / YN[i], 1. / 3.)
-        
-        # Calculate X
-        fx = fy + (A / 500.)
-        for i,val in np.ndenumerate(fx):
-            if np.power(val, 3.) <= self.EPSILON:
-                X[i] = XN[i] * (val - 16. / 116.) / (self.KAPPA / 116.)
-            else:
-                X[i] = XN[i] * np.power(val, 3.)
-        
-        # Calculate Z
-        fz = fy - (B / 200.)
-        for i,val in np.ndenumerate(fz):
-            if np.power(val, 3.) <= self.EPSILON:
-                Z[i] = ZN[i] * (val - 16. / 116.) / (self.KAPPA / 116.)
-            else:
-                Z[i] = ZN[i] * np.power(val, 3)
+        [L, A, B] = [np.asarray(x, dtype = self.dtype) for x in [L, A, B]]
+        [X, Y, Z] = self._out_(__fname__, out, n)
+        idx       = self._buffer_("LAB_to_XYZ.idx", n, "bool")
+
+        # Calculate Y; piecewise, the conditions are applied in reverse order:
+        #   L <=   0: Y = 0
+        #   L <=   8: Y = YN * L / KAPPA
+        #   L <= 100: Y = YN * ((L + 16) / 116)^3
+        #   else:     Y = YN (also used for missing values)
+        np.add(L, 16., out = Y); Y /= 116.
+        np.power(Y, 3., out = Y)
+        np.logical_not(np.less_equal(L, 100., out = idx), out = idx)
+        np.copyto(Y, 1., where = idx)
+        np.divide(L, self.KAPPA, out = Y, where = np.less_equal(L, 8., out = idx))
+        np.copyto(Y, 0., where = np.less_equal(L, 0., out = idx))
+        Y *= YN
+
+        fy = np.divide(Y, YN, out = self._buffer_("LAB_to_XYZ.fy", n))
+        self._lab_f_(fy, out = fy)
+
+        # Calculate X; fx = fy + A / 500
+        np.divide(A, 500., out = X)
+        X += fy
+        self._lab_finv_(X, out = X)
+        X *= XN
+
+        # Calculate Z; fz = fy - B / 200
+        np.divide(B, -200., out = Z)
+        Z += fy
+        self._lab_finv_(Z, out = Z)
+        Z *= ZN
     
         return [X, Y, Z]
     
-    def XYZ_to_LAB(self, X, Y, Z, XN = None, YN = None, ZN = None):
-        """XYZ_to_LAB(X, Y, Z, XN = None, YN = None, ZN = None)
+    def XYZ_to_LAB(self, X, Y, Z, XN = None, YN = None, ZN = None, out = None):
+        """XYZ_to_LAB(X, Y, Z, XN = None, YN = None, ZN = None, out = None)
         
         CIEXYZ to CIELAB.
 
@@ -677,6 +1300,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -685,7 +1312,7 @@ class colorlib(object):
             `numpy.ndarray`'s of the same length as the inputs (``[L, A, B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LAB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -693,41 +1320,27 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
-    
-        # Support function
-        def f(t, KAPPA, EPSILON):
-            for i,val in np.ndenumerate(t):
-                if val > EPSILON:
-                    t[i] = np.power(val, 1./3.)
-                else:
-                    t[i] = (KAPPA / 116.) * val + 16. / 116.
-            return t
-    
-        # Scaling
-        xr = X / XN;
-        yr = Y / YN;
-        zr = Z / ZN;
-    
-        # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
-        for i,val in np.ndenumerate(yr):
-            if val > self.EPSILON:
-                L[i] = 116. * np.power(val, 1./3.) - 16.
-            else:
-                L[i] = self.KAPPA * val
-    
-        xt = f(xr, self.KAPPA, self.EPSILON);
-        yt = f(yr, self.KAPPA, self.EPSILON);
-        zt = f(zr, self.KAPPA, self.EPSILON);
-        return [L, 500. * (xt - yt), 200. * (yt - zt)]  # [L, A, B]
+        [L, A, B] = self._out_(__fname__, out, n)
+    
+        # Scaling and applying f(t) directly on the output arrays,
+        # A = f(x), L = f(y), B = f(z).
+        self._lab_f_(np.divide(X, XN, out = A), out = A)
+        self._lab_f_(np.divide(Y, YN, out = L), out = L)
+        self._lab_f_(np.divide(Z, ZN, out = B), out = B)
+
+        # A = 500 * (f(x) - f(y)), B = 200 * (f(y) - f(z)), L = 116 * f(y) - 16
+        np.subtract(A, L, out = A); A *= 500.
+        np.subtract(L, B, out = B); B *= 200.
+        L *= 116.; L -= 16.
+        return [L, A, B]
     
     
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
-    def XYZ_to_HLAB(self, X, Y, Z, XN = None, YN = None, ZN = None):
-        """XYZ_to_HLAB(X, Y, Z, XN = None, YN = None, ZN = None)
+    def XYZ_to_HLAB(self, X, Y, Z, XN = None, YN = None, ZN = None, out = None):
+        """XYZ_to_HLAB(X, Y, Z, XN = None, YN = None, ZN = None, out = None)
         
         CIE-XYZ to Hunter LAB.
 
@@ -747,6 +1360,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three ``None``) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -755,7 +1372,7 @@ class colorlib(object):
             `numpy.ndarray`'s of the same length as the inputs (``[L, A, B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_HLAB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -763,15 +1380,20 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        [L, A, B] = self._out_(__fname__, out, n)
     
         # Transform
-        X = X / XN; Y = Y / YN; Z = Z / ZN;
-        l = np.sqrt(Y);
-        return [10. * l, 17.5 * (((1.02 * X) - Y) / l), 7. * ((Y - (0.847 * Z)) / l)] # [L, A, B]
+        [x, y, z] = self._columns_("XYZ_to_HLAB.xyz", n)
+        np.divide(X, XN, out = x); np.divide(Y, YN, out = y); np.divide(Z, ZN, out = z)
+        np.sqrt(y, out = L)
+        np.multiply(x, 1.02, out = A); A -= y; A /= L; A *= 17.5
+        np.multiply(z, -0.847, out = B); B += y; B /= L; B *= 7.
+        L *= 10.
+        return [L, A, B]
     
     
-    def HLAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None):
-        """HLAB_to_XYZ(L, A, B, XN = None, YN = None, ZN = None)
+    def HLAB_to_XYZ(self, L, A, B, XN = None, YN = None, ZN = None, out = None):
+        """HLAB_to_XYZ(L, A, B, XN = None, YN = None, ZN = None, out = None)
 
         Hunter LAB to CIE-XYZ.
 
@@ -791,6 +1413,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -799,7 +1425,7 @@ class colorlib(object):
             `numpy.ndarray`'s of the same length as the inputs (``[X, Y, Z]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HLAB_to_XYZ" # Name of this method
         n = len(L) # Number of colors
 
         # Loading definition of white
@@ -807,16 +1433,17 @@ class colorlib(object):
     
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
+        [X, Y, Z] = self._out_(__fname__, out, n)
     
         # Transform
-        vY = L / 10.;
-        vX = (A / 17.5) * (L / 10);
-        vZ = (B / 7) * (L / 10);
-        vY = vY * vY;
-    
-        Y = vY * XN
-        X = (vX + vY) / 1.02 * YN
-        Z = - (vZ - vY) / 0.847 * ZN
+        l = np.divide(L, 10., out = self._buffer_("HLAB_to_XYZ.l", n))
+        np.multiply(l, l, out = Y)          # vY
+        np.divide(A, 17.5, out = X); X *= l # vX
+        np.divide(B, 7., out = Z);   Z *= l # vZ
+
+        X += Y; X /= 1.02; X *= YN
+        np.subtract(Y, Z, out = Z); Z /= 0.847; Z *= ZN
+        Y *= XN
     
         return [X, Y, Z]
     
@@ -826,8 +1453,8 @@ class colorlib(object):
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     
-    def LAB_to_polarLAB(self, L, A, B):
-        """LAB_to_polarLAB(L, A, B)
+    def LAB_to_polarLAB(self, L, A, B, out = None):
+        """LAB_to_polarLAB(L, A, B, out = None)
 
         Convert from CIELAB to the polar representation polarLAB.
 
@@ -839,6 +1466,10 @@ class colorlib(object):
             values for the A dimension of the CIELAB color space
         B : numpy.ndarray
             values for the B dimension of the CIELAB color space
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -847,24 +1478,24 @@ class colorlib(object):
             `numpy.ndarray`'s of the same length as the inputs (``[L, A, B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_polarLAB" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
+        [Lo, C, H] = self._out_(__fname__, out, len(L))
     
-        # Compute H
-        H = self.RAD2DEG(np.arctan2(B, A))
-        for i,val in np.ndenumerate(H):
-            while val > 360.:   val -= 360.
-            while val <   0.:   val += 360.
-            H[i] = val
+        # Compute H, wrapped to [0., 360.)
+        np.arctan2(B, A, out = H)
+        H *= 180. / np.pi
+        np.mod(H, 360., out = H)
         # Compute C
-        C = np.sqrt(A * A + B * B)
+        np.hypot(A, B, out = C)
+        np.copyto(Lo, L)
     
-        return [L, C, H]
+        return [Lo, C, H]
     
-    def polarLAB_to_LAB(self, L, C, H):
-        """polarLAB_to_LAB(L, A, B)
+    def polarLAB_to_LAB(self, L, C, H, out = None):
+        """polarLAB_to_LAB(L, C, H, out = None)
 
         Convert form polarLAB to onvert CIELAB.
 
@@ -876,6 +1507,10 @@ class colorlib(object):
             values for the A dimension of the polar LAB color space
         B : numpy.ndarray
             values for the B dimension of the polar LAB color space
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -884,23 +1519,28 @@ class colorlib(object):
             `numpy.ndarray`'s of the same length as the inputs (``[L, A, B]``).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLAB_to_LAB" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, L = L, C = C, H = H)
+        [Lo, A, B] = self._out_(__fname__, out, len(L))
     
-        A = np.cos(self.DEG2RAD(H)) * C
-        B = np.sin(self.DEG2RAD(H)) * C
+        # Trigonometric functions evaluated on contiguous buffers, see polarLUV_to_LUV
+        H   = np.multiply(H, np.pi / 180., out = self._buffer_("polarLAB_to_LAB.H", len(L)))
+        tmp = self._buffer_("polarLAB_to_LAB.tmp", len(L))
+        np.multiply(np.cos(H, out = tmp), C, out = A)
+        np.multiply(np.sin(H, out = tmp), C, out = B)
+        np.copyto(Lo, L)
     
-        return [L, A, B]
+        return [Lo, A, B]
     
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     
-    def RGB_to_HSV(self, r, g, b):
-        """RGB_to_HSV(r, g, b)
+    def RGB_to_HSV(self, r, g, b, out = None):
+        """RGB_to_HSV(r, g, b, out = None)
         
         Convert RGB to HSV.
 
@@ -912,6 +1552,10 @@ class colorlib(object):
             intensities for green (``[0.,1.]``)
         b : numpy.ndarray
             intensities for blue (``[0.,1.]``)
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -920,50 +1564,57 @@ class colorlib(object):
             HSV color space (``[h, s, v]``). Same length as the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_HSV" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
-    
-        # Support function
-        def gethsv(r, g, b):
-            x = np.min([r, g, b])
-            y = np.max([r, g, b])
-            if y != x:
-                f = g - b if r == x else b - r if g == x else r - g
-                i = 3. if r == x else 5. if g == x else 1.
-                h = 60. * (i - f /(y - x))
-                s = (y - x)/y
-                v = y
-            else:
-                ####ifdef MONO
-                ### *h = NA_REAL; *s = 0; *v = y;
-                ####else
-                ### *h = 0; *s = 0; *v = y;
-                ####endif
-                h = 0.
-                s = 0.
-                v = y
-            return [h, s, v]
-    
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-        v = np.ndarray(len(r), dtype = "float"); v[:] = 0.
-    
-        # Calculate h/s/v
-        for i in range(0, len(r)):
-            tmp = gethsv(r[i], g[i], b[i])
-            h[i] = tmp[0]; s[i] = tmp[1]; v[i] = tmp[2]
+        [r, g, b] = [np.asarray(x, dtype = self.dtype) for x in [r, g, b]]
+        n = len(r)
+        [h, s, v] = self._out_(__fname__, out, n)
+        [x, d, i] = self._columns_("RGB_to_HSV.tmp", n)
+        idx       = self._buffer_("RGB_to_HSV.idx", n, "bool")
+        grey      = self._buffer_("RGB_to_HSV.grey", n, "bool")
+
+        np.minimum(r, g, out = x); np.minimum(x, b, out = x)
+        np.maximum(r, g, out = v); np.maximum(v, b, out = v)
+        np.subtract(v, x, out = d)
+
+        # Sector selection: the minimum decides which difference
+        # is used, the order of the conditions matters (ties; r wins).
+        #   r == min: h = 60 * (3 - (g - b) / d)
+        #   g == min: h = 60 * (5 - (b - r) / d)
+        #   else:     h = 60 * (1 - (r - g) / d)
+        np.subtract(r, g, out = h); i[:] = 1.
+        np.subtract(b, r, out = h, where = np.equal(g, x, out = idx))
+        np.copyto(i, 5., where = idx)
+        np.subtract(g, b, out = h, where = np.equal(r, x, out = idx))
+        np.copyto(i, 3., where = idx)
+
+        # Grey colors (max == min): h = 0, s = 0. Avoids division by zero.
+        ###ifdef MONO
+        ### *h = NA_REAL; *s = 0; *v = y;
+        ###else
+        ### *h = 0; *s = 0; *v = y;
+        ###endif
+        np.equal(d, 0., out = grey)
+        np.divide(h, d, out = h, where = np.logical_not(grey, out = idx))
+        np.subtract(i, h, out = h); h *= 60.
+        np.copyto(s, d)
+        np.divide(d, v, out = s, where = np.not_equal(v, 0., out = idx))
+        np.copyto(h, 0., where = grey)
+        np.copyto(s, 0., where = grey)
     
         return [h, s, v]
     
     
-    def HSV_to_RGB(self, h, s, v):
-        """HSV_to_RGB(r, g, b)
+    def HSV_to_RGB(self, h, s, v, out = None):
+        """HSV_to_RGB(h, s, v, out = None)
         
         Convert RGB to HSV.
 
+        Hues are wrapped to ``[0., 360.)``. If the hue is not defined
+        (``numpy.nan``) a grey (``r = g = b = v``) is returned.
+
         Parameters
         ----------
         h : nympy.ndarray
@@ -972,6 +1623,10 @@ class colorlib(object):
             saturation
         v : numpy.ndarray
             value (the value-dimension of HSV)
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -980,45 +1635,46 @@ class colorlib(object):
             RGB color space (``[r, g, b]``). Same length as the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HSV_to_RGB" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, h = h, s = s, v = v)
-    
-        # Support function
-        def getrgb(h, s, v):
-    
-            # If Hue is not defined:
-            if h == np.nan: return np.repeat(v, 3)
-    
-            # Convert to [0-6]
-            h = h / 60.
-            i = np.floor(h)
-            f = h - i
-    
-            if (i % 2) == 0:  # if i is even 
-                f = 1 - f
-    
-            m = v * (1 - s)
-            n = v * (1 - s * f)
-            if i in [0,6]:     return [v, n, m]
-            elif i == 1:       return [n, v, m]
-            elif i == 2:       return [m, v, n]
-            elif i == 3:       return [m, n, v]
-            elif i == 4:       return [n, m, v]
-            elif i == 5:       return [v, m, n]
-            else:
-                import sys;
-                sys.exit("Ended up in a non-defined ifelse with i = %d".format(i))
-    
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
-    
-        for i in range(0,len(h)):
-           tmp = getrgb(h[i], s[i], v[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
+        [h, s, v] = [np.asarray(x, dtype = self.dtype) for x in [h, s, v]]
+        n = len(h)
+        [r, g, b] = self._out_(__fname__, out, n)
+        [f, i, m] = self._columns_("HSV_to_RGB.tmp", n)
+        k         = self._buffer_("HSV_to_RGB.k", n)
+        idx       = self._buffer_("HSV_to_RGB.idx", n, "bool")
+        nohue     = self._buffer_("HSV_to_RGB.nohue", n, "bool")
+
+        # Hue not defined: handled as h = 0 first, set to v afterwards
+        np.isnan(h, out = nohue)
+
+        # Convert to [0-6], sector i and position f within the sector
+        np.copyto(f, h); np.copyto(f, 0., where = nohue)
+        np.mod(f, 360., out = f); f /= 60.
+        np.floor(f, out = i)
+        f -= i
+        np.mod(i, 2., out = k)
+        np.subtract(1., f, out = f, where = np.equal(k, 0., out = idx)) # If i is even
+
+        np.subtract(1., s, out = m); m *= v              # m = v * (1 - s)
+        np.multiply(s, f, out = f); np.subtract(1., f, out = f)
+        f *= v                                           # n = v * (1 - s * f)
+
+        # Picking [r, g, b] from [v, n, m] depending on the sector
+        #   0: [v, n, m]   1: [n, v, m]   2: [m, v, n]
+        #   3: [m, n, v]   4: [n, m, v]   5: [v, m, n]
+        # With k = (i - offset) mod 6 (offset 5, 1, 3 for r, g, b)
+        # all channels follow the same pattern: k in [0, 1] gives v,
+        # k in [2, 5] gives n, k in [3, 4] gives m.
+        for x,offset in zip([r, g, b], [5., 1., 3.]):
+            np.subtract(i, offset, out = k); np.mod(k, 6., out = k)
+            np.copyto(x, m)
+            np.copyto(x, v, where = np.less(k, 2., out = idx))
+            np.mod(k, 3., out = k)
+            np.copyto(x, f, where = np.equal(k, 2., out = idx))
+            np.copyto(x, v, where = nohue)
     
         return [r, g, b]
     
@@ -1028,8 +1684,8 @@ class colorlib(object):
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     
-    def RGB_to_HLS(self, r, g, b):
-        """RGB_to_HLS(r, g, b)
+    def RGB_to_HLS(self, r, g, b, out = None):
+        """RGB_to_HLS(r, g, b, out = None)
         
         Convert RGB to HLS.
     
@@ -1044,6 +1700,10 @@ class colorlib(object):
             intensities for green (``[0.,1.]``)
         b : numpy.ndarray
             intensities for blue (``[0.,1.]``)
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1052,59 +1712,68 @@ class colorlib(object):
             HLS color space (``[h, l, s]``). Same length as the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_HLS" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
-    
-        # Support function
-        def gethls(r, g, b):
-            min = np.min([r, g, b])
-            max = np.max([r, g, b])
-    
-            l = (max + min)/2.;
-    
-            if max != min:
-                if   l <  0.5: s = (max - min) / (max + min)
-                elif l >= 0.5: s = (max - min) / (2. - max - min)
-    
-                if r == max:  h = (g - b) / (max - min);
-                if g == max:  h = 2. + (b - r) / (max - min);
-                if b == max:  h = 4. + (r - g) / (max - min);
-    
-                h = h * 60.;
-                if h < 0.:    h = h + 360.;
-                if h > 360.:  h = h - 360.;
-            else:
-                s = 0
-                ####ifdef MONO
-                ### *h = NA_REAL; 
-                ####else
-                ### *h = 0;
-                ####endif
-                h = 0;
-    
-            return [h, l, s]
-    
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        l = np.ndarray(len(r), dtype = "float"); l[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-    
-        for i in range(0,len(h)):
-           tmp = gethls(r[i], g[i], b[i])
-           h[i] = tmp[0]; l[i] = tmp[1]; s[i] = tmp[2]
-    
+        [r, g, b] = [np.asarray(x, dtype = self.dtype) for x in [r, g, b]]
+        n = len(r)
+        [h, l, s] = self._out_(__fname__, out, n)
+        [cmin, cmax, d] = self._columns_("RGB_to_HLS.tmp", n)
+        off       = self._buffer_("RGB_to_HLS.off", n)
+        idx       = self._buffer_("RGB_to_HLS.idx", n, "bool")
+        grey      = self._buffer_("RGB_to_HLS.grey", n, "bool")
+
+        np.minimum(r, g, out = cmin); np.minimum(cmin, b, out = cmin)
+        np.maximum(r, g, out = cmax); np.maximum(cmax, b, out = cmax)
+        np.subtract(cmax, cmin, out = d)
+    
+        np.add(cmax, cmin, out = l); l /= 2.
+
+        # Grey colors (max == min): h = 0, s = 0. Avoids division by zero.
+        ###ifdef MONO
+        ### *h = NA_REAL; 
+        ###else
+        ### *h = 0;
+        ###endif
+        np.equal(d, 0., out = grey)
+
+        # s = d / (max + min) if l < 0.5, d / (2 - max - min) else
+        np.subtract(2., cmax, out = s); s -= cmin
+        np.add(cmax, cmin, out = s, where = np.less(l, 0.5, out = idx))
+        np.copyto(s, 1., where = grey)
+        np.divide(d, s, out = s)
+
+        # If several channels are equal to max the last one wins (b, g, r)
+        #   r == max: h = (g - b) / d, g == max: h = 2 + (b - r) / d,
+        #   b == max: h = 4 + (r - g) / d, else (missing values) h = 0.
+        h[:] = 0.; off[:] = 0.
+        np.subtract(g, b, out = h, where = np.equal(r, cmax, out = idx))
+        np.subtract(b, r, out = h, where = np.equal(g, cmax, out = idx))
+        np.copyto(off, 2., where = idx)
+        np.subtract(r, g, out = h, where = np.equal(b, cmax, out = idx))
+        np.copyto(off, 4., where = idx)
+        np.divide(h, d, out = h, where = np.logical_not(grey, out = idx))
+        np.copyto(h, 0., where = np.isnan(d, out = idx))
+        h += off
+        h *= 60.
+        np.add(h, 360., out = h, where = np.less(h, 0., out = idx))
+        np.subtract(h, 360., out = h, where = np.greater(h, 360., out = idx))
+
+        np.copyto(h, 0., where = grey)
+        np.copyto(s, 0., where = grey)
         return [h, l, s]
     
     
-    def HLS_to_RGB(self, h, l, s):
-        """HLS_to_RGB(h, l, s)
+    def HLS_to_RGB(self, h, l, s, out = None):
+        """HLS_to_RGB(h, l, s, out = None)
 
         Convert RLS to HLS.
     
         All r/g/b values in ``[0.,1.]``, h in ``[[0., 360.]``, l and s in ``[0., 1.]``.
         From: http://wiki.beyondunreal.com/wiki/RGB_To_HLS_Conversion.
+        If the saturation is zero or the hue is not defined (``numpy.nan``)
+        a grey (``r = g = b = l``) is returned.
 
         Parameters
         ----------
@@ -1114,6 +1783,10 @@ class colorlib(object):
             lightness
         s : numpy.ndarray
             saturation
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1122,42 +1795,53 @@ class colorlib(object):
             RGB color space (``[r, g, b]``). Same length as the inputs.
         """
     
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HLS_to_RGB" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, h = h, l = l, s = s)
-    
-        # Support function qtrans
-        def qtrans(q1, q2, hue):
-            if hue > 360.:   hue = hue - 360.
-            if hue < 0:      hue = hue + 360.
-        
-            if hue < 60.:    return q1 + (q2 - q1) * hue / 60.
-            elif hue < 180.: return q2
-            elif hue < 240.: return q1 + (q2 - q1) * (240. - hue) / 60.
-            else:            return q1
-        
-        # Support function
-        def getrgb(h, l, s):
-            p2 = l * (1. + s) if l <= 0.5 else 1 + s - (l * s)
-            p1 = 2 * l - p2
-    
-            # If saturation is zero
-            if (s == 0):    return np.repeat(l, 3)
-            # Else
-            return [qtrans(p1, p2, h + 120.),   # r
-                    qtrans(p1, p2, h),          # g
-                    qtrans(p1, p2, h - 120.)]   # b
-    
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
-    
-        for i in range(0,len(r)):
-           tmp = getrgb(h[i], l[i], s[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
-    
+        [h, l, s] = [np.asarray(x, dtype = self.dtype) for x in [h, l, s]]
+        n = len(h)
+        [r, g, b]    = self._out_(__fname__, out, n)
+        [p1, p2, dp] = self._columns_("HLS_to_RGB.tmp", n)
+        hue          = self._buffer_("HLS_to_RGB.hue", n)
+        idx          = self._buffer_("HLS_to_RGB.idx", n, "bool")
+        grey         = self._buffer_("HLS_to_RGB.grey", n, "bool")
+
+        # p2 = l * (1 + s) if l <= 0.5, l + s - l * s else; p1 = 2 * l - p2
+        np.multiply(l, s, out = dp)
+        np.add(l, s, out = p2); p2 -= dp
+        np.less_equal(l, 0.5, out = idx)
+        np.add(1., s, out = p2, where = idx)
+        np.multiply(p2, l, out = p2, where = idx)
+        np.multiply(l, 2., out = p1); p1 -= p2
+        np.subtract(p2, p1, out = dp)
+
+        # Zero saturation or hue not defined: grey
+        np.logical_or(np.equal(s, 0., out = grey), np.isnan(h, out = idx), out = grey)
+
+        # Support function qtrans (q1 = p1, q2 = p2), conditions
+        # applied in reverse order:
+        #   hue <  60: q1 + (q2 - q1) * hue / 60
+        #   hue < 180: q2
+        #   hue < 240: q1 + (q2 - q1) * (240 - hue) / 60
+        #   else:      q1
+        for x,offset in zip([r, g, b], [120., 0., -120.]):
+            np.add(h, offset, out = hue)
+            np.subtract(hue, 360., out = hue, where = np.greater(hue, 360., out = idx))
+            np.add(hue, 360., out = hue, where = np.less(hue, 0., out = idx))
+            np.copyto(x, p1)
+            np.less(hue, 240., out = idx)
+            np.subtract(240., hue, out = x, where = idx)
+            np.multiply(dp, x, out = x, where = idx)
+            np.divide(x, 60., out = x, where = idx)
+            np.add(p1, x, out = x, where = idx)
+            np.copyto(x, p2, where = np.less(hue, 180., out = idx))
+            np.less(hue, 60., out = idx)
+            np.multiply(dp, hue, out = x, where = idx)
+            np.divide(x, 60., out = x, where = idx)
+            np.add(p1, x, out = x, where = idx)
+            np.copyto(x, l, where = grey)
+
         return [r, g, b]
     
     # -------------------------------------------------------------------
@@ -1165,8 +1849,8 @@ class colorlib(object):
     # -------------------------------------------------------------------
     # -------------------------------------------------------------------
     
-    def XYZ_to_uv(self, X, Y, Z):
-        """XYZ_to_uv(X, Y, Z)
+    def XYZ_to_uv(self, X, Y, Z, out = None):
+        """XYZ_to_uv(X, Y, Z, out = None)
         
         CIE-XYZ to u and v.
 
@@ -1178,6 +1862,10 @@ class colorlib(object):
             values for the Y dimension.
         Z : numpy.ndarray
             values for the Z dimension.
+        out : None or list
+            optional list of two float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1185,25 +1873,64 @@ class colorlib(object):
             Returns a list of `numpy.ndarrays` containing u and v (``[u, v]``). 
         """
     
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_uv" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        [X, Y, Z] = [np.asarray(x, dtype = self.dtype) for x in [X, Y, Z]]
+        n = len(X)
+        [u, v] = self._out_(__fname__, out, n, 2)
+    
+        # Chromaticity coordinates x and y (zero if X + Y + Z == 0)
+        t   = np.add(X, Y, out = self._buffer_("XYZ_to_uv.t", n)); t += Z
+        idx = np.not_equal(t, 0., out = self._buffer_("XYZ_to_uv.idx", n, "bool"))
+        u[:] = 0.; np.divide(X, t, out = u, where = idx)
+        v[:] = 0.; np.divide(Y, t, out = v, where = idx)
+
+        # Denominator 6y - x + 1.5, re-using the buffer of t
+        np.multiply(v, 6., out = t); t -= u; t += 1.5
+        u *= 2.0; u /= t    # u
+        v *= 4.5; v /= t    # v
+        return [u, v]
+
+    # Cache for the u/v chromaticities of the white points, see _white_uv_
+    _WHITE_UV_ = {}
+
+    def _white_uv_(self, XN = None, YN = None, ZN = None):
+        """_white_uv_(XN = None, YN = None, ZN = None)
+
+        Returns the chromaticities ``uN`` and ``vN`` of the white point
+        as used by the CIELUV transformations. For a single white point
+        (the default) the values are computed once and cached on the class,
+        only white points specified for each color separately
+        (``numpy.ndarray`` of length ``n``) are transformed every call.
+
+        Parameters
+        ----------
+        XN, YN, ZN : None, float, or numpy.ndarray
+            chromaticity of the white point. If ``None`` the
+            defaults are used (see :py:func:`_get_white_`)
+
+        Returns
+        -------
+        list
+            Returns a list ``[uN, vN]``, either two floats or two
+            `numpy.ndarray`'s if a white point per color was specified.
+        """
+        white = [np.asarray(self.XN if XN is None else XN, dtype = "float"),
+                 np.asarray(self.YN if YN is None else YN, dtype = "float"),
+                 np.asarray(self.ZN if ZN is None else ZN, dtype = "float")]
+        if not np.all([x.size == 1 for x in white]):
+            return self.XYZ_to_uv(*[x.flatten() for x in white])
+
+        key = tuple(float(x.flatten()[0]) for x in white)
+        if not key in self._WHITE_UV_:
+            [uN, vN] = self.XYZ_to_uv(*[np.asarray([x]) for x in key])
+            self._WHITE_UV_[key] = [float(uN[0]), float(vN[0])]
+        return self._WHITE_UV_[key]
     
-        # Result array
-        x = np.ndarray(len(X), dtype = "float"); x[:] = 0.
-        y = np.ndarray(len(X), dtype = "float"); y[:] = 0.
-    
-        t = X + Y + Z
-        idx = np.where(t != 0)
-        x[idx] = X[idx] / t[idx];
-        y[idx] = Y[idx] / t[idx];
-        
-        return [2.0 * x / (6. * y - x + 1.5),    # u
-                4.5 * y / (6. * y - x + 1.5)]    # v
-    
-    def XYZ_to_LUV(self, X, Y, Z, XN = None, YN = None, ZN = None):
-        """XYZ_to_LUV(X, Y, Z, XN = None, YN = None, ZN = None)
+    def XYZ_to_LUV(self, X, Y, Z, XN = None, YN = None, ZN = None, out = None):
+        """XYZ_to_LUV(X, Y, Z, XN = None, YN = None, ZN = None, out = None)
 
         CIE-XYZ to CIE-LUV.
 
@@ -1219,6 +1946,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used.
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1227,30 +1958,34 @@ class colorlib(object):
             length as the input arrays.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LUV" # Name of this method
         n = len(X) # Number of colors
 
+        # White point chromaticities (computed once per white point)
+        [uN, vN] = self._white_uv_(XN, YN, ZN)
+
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
     
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
+        [L, U, V] = self._out_(__fname__, out, n)
     
-        # Convert X/Y/Z and XN/YN/ZN to uv
-        [u,  v]  = self.XYZ_to_uv(X,  Y,  Z )
-        [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
+        # Convert X/Y/Z to uv, stored on U and V
+        self.XYZ_to_uv(X, Y, Z, out = [U, V])
     
-        # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
-        y = Y / YN
-        for i,val in np.ndenumerate(y):
-            L[i] = 116. * np.power(val, 1./3.) - 16. if val > self.EPSILON else self.KAPPA * val
+        # Calculate L; L = 116 * f(Y / YN) - 16, same as for CIELAB
+        np.divide(Y, YN, out = L)
+        self._lab_f_(L, out = L)
+        L *= 116.; L -= 16.
     
         # Calculate U/V
-        return [L, 13. * L * (u - uN), 13. * L * (v - vN)]  # [L, U, V]
+        U -= uN; U *= L; U *= 13.
+        V -= vN; V *= L; V *= 13.
+        return [L, U, V]
     
-    def LUV_to_XYZ(self, L, U, V, XN = None, YN = None, ZN = None):
-        """LUV_to_XYZ(L, U, V, XN = None, YN = None, ZN = None)
+    def LUV_to_XYZ(self, L, U, V, XN = None, YN = None, ZN = None, out = None):
+        """LUV_to_XYZ(L, U, V, XN = None, YN = None, ZN = None, out = None)
 
         CIE-LUV to CIE-XYZ.
 
@@ -1266,6 +2001,10 @@ class colorlib(object):
             chromaticity of the white point. If of length 1 the white point
             specification will be recycled if length of R/G/B is larger than
             one. If not specified (all three NA) default values will be used
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1274,49 +2013,52 @@ class colorlib(object):
             length as the input arrays.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_XYZ" # Name of this method
         n = len(L) # Number of colors
 
+        # White point chromaticities (computed once per white point)
+        [uN, vN] = self._white_uv_(XN, YN, ZN)
+
         # Loading definition of white
         [XN, YN, ZN] = self._get_white_(__fname__, n, XN, YN, ZN)
     
         # Checking input
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
-    
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
-    
-        # Check for which values we do have to do the transformation
-        def fun(L, U, V):
-            return False if L <= 0. and U == 0. and V == 0. else True
-        idx = np.where([fun(L[i], U[i], V[i]) for i in range(0, len(L))])[0]
-        if len(idx) == 0: return [X, Y, Z]
-
-        # Compute Y
-        for i in idx:
-            Y[i] = YN[i] * (np.power((L[i] + 16.)/116., 3.) if L[i] > 8. else L[i] / self.KAPPA)
-    
-        # Calculate X/Z
-        from numpy import finfo, fmax
-
-        # Avoiding division by zero
-        eps = np.finfo(float).eps*10
-        L = fmax(eps, L)
-
-        [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
-        u = U / (13. * L) + uN
-        v = V / (13. * L) + vN
-        X =  9.0 * Y * u / (4 * v)
-        Z =  -X / 3. - 5. * Y + 3. * Y / v
+        [L, U, V] = [np.asarray(x, dtype = self.dtype) for x in [L, U, V]]
+        [X, Y, Z] = self._out_(__fname__, out, n)
+        idx       = self._buffer_("LUV_to_XYZ.idx", n, "bool")
+        tmp       = self._buffer_("LUV_to_XYZ.tmp", n, "bool")
+        l         = self._buffer_("LUV_to_XYZ.l", n)
+    
+        # Compute Y; Y = YN * finv((L + 16) / 116), same as for CIELAB.
+        # Y is zero for all colors with L <= 0 and U == V == 0 (black).
+        np.add(L, 16., out = Y); Y /= 116.
+        self._lab_finv_(Y, out = Y)
+        Y *= YN
+        np.less_equal(L, 0., out = idx)
+        idx &= np.equal(U, 0., out = tmp)
+        idx &= np.equal(V, 0., out = tmp)
+        np.copyto(Y, 0., where = idx)
+    
+        # Calculate u (stored on X) and v (stored on Z),
+        # avoiding division by zero
+        np.fmax(L, np.finfo(float).eps * 10, out = l)
+        l *= 13.
+        np.divide(U, l, out = X); X += uN
+        np.divide(V, l, out = Z); Z += vN
+
+        # X = 9 * Y * u / (4 * v), Z = -X / 3 - 5 * Y + 3 * Y / v
+        np.multiply(Y, X, out = X); X *= 9.; X /= 4.; X /= Z
+        np.divide(Y, Z, out = Z); Z *= 3.
+        Z -= np.multiply(Y, 5., out = l)
+        Z -= np.divide(X, 3., out = l)
     
         return [X, Y, Z]
     
     
     ## ----- LUV <-> polarLUV ----- */
-    def LUV_to_polarLUV(self, L, U, V):
-        """LUV_to_polarLUV(L, U, V)
+    def LUV_to_polarLUV(self, L, U, V, out = None):
+        """LUV_to_polarLUV(L, U, V, out = None)
         
         LUV to polarLUV (HCL).
 
@@ -1328,6 +2070,10 @@ class colorlib(object):
             values for the Y dimension
         V : numpy.ndarray
             values for the Z dimension
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1337,22 +2083,22 @@ class colorlib(object):
             polar representation of the CIE-LUV color space.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_polarLUV" # Name of this method
     
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
+        [Lo, C, H] = self._out_(__fname__, out, len(L))
     
-        # Calculate polarLUV coordinates
-        C = np.sqrt(U * U + V * V)
-        H = self.RAD2DEG(np.arctan2(V, U))
-        for i,val in np.ndenumerate(H):
-            while val > 360: val -= 360.
-            while val < 0.:  val += 360.
-            H[i] = val
+        # Calculate polarLUV coordinates, hue wrapped to [0., 360.)
+        np.hypot(U, V, out = C)
+        np.arctan2(V, U, out = H)
+        H *= 180. / np.pi
+        np.mod(H, 360., out = H)
+        np.copyto(Lo, L)
     
-        return [L, C, H]
+        return [Lo, C, H]
     
-    def polarLUV_to_LUV(self, L, C, H):
-        """polarLUV_to_LUV(L, C, H)
+    def polarLUV_to_LUV(self, L, C, H, out = None):
+        """polarLUV_to_LUV(L, C, H, out = None)
         
         polarLUV (HCL) to LUV.
 
@@ -1364,6 +2110,10 @@ class colorlib(object):
             values for the C or chroma dimension
         H : numpy.ndarray
             values for the H or hue dimension
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
@@ -1372,98 +2122,412 @@ class colorlib(object):
             same length as the input arrays.
         """
     
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLUV_to_LUV" # Name of this method
     
         # Checking input
         self._check_input_arrays_(__fname__, L = L, C = C, H = H)
+        [Lo, U, V] = self._out_(__fname__, out, len(L))
     
-        H = self.DEG2RAD(H)
-        return [L, C * np.cos(H), C * np.sin(H)] # [L, U, V]
+        # The trigonometric functions are evaluated on two contiguous buffers:
+        # numpy falls back to a different (scalar) implementation if the
+        # output is strided (e.g., a column of an (n, 3) array) and close
+        # to the input in memory; the results would depend on the layout.
+        H   = np.multiply(H, np.pi / 180., out = self._buffer_("polarLUV_to_LUV.H", len(L)))
+        tmp = self._buffer_("polarLUV_to_LUV.tmp", len(L))
+        np.multiply(np.cos(H, out = tmp), C, out = U)
+        np.multiply(np.sin(H, out = tmp), C, out = V)
+        np.copyto(Lo, L)
+        return [Lo, U, V]
     
     
-    def sRGB_to_hex(self, r, g, b, fixup = True):
-        """sRGB_to_hex(r, g, , fixup = True)
+    def polarLUV_to_sRGB(self, L, C, H, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        """polarLUV_to_sRGB(L, C, H, XN = None, YN = None, ZN = None, gamma = 2.4, out = None)
 
-        sRGB colors to hex colors.
+        polarLUV (HCL) to sRGB.
+
+        Fused transformation from polarLUV via CIELUV, CIEXYZ and RGB to sRGB.
+        Calls the kernels of the individual steps directly (no intermediate
+        color objects) and applies the gamma correction in-place. Gives the
+        same results as converting a :py:class:`polarLUV` object to sRGB step
+        by step.
 
         Parameters
         ----------
-        r : numpy.ndarray
-            intensities for red (``[0.,1.,]``)
-        g : numpy.ndarray
-            intensities for green (``[0.,1.,]``)
-        b : numpy.ndarray
-            intensities for blue (``[0.,1.,]``)
-        fixup : bool
-            whether or not the rgb values should be corrected if
-            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+        L : numpy.ndarray
+            values for the L or luminance dimension
+        C : numpy.ndarray
+            values for the C or chroma dimension
+        H : numpy.ndarray
+            values for the H or hue dimension
+        XN, YN, ZN : None or numpy.ndarray
+            chromaticity of the white point. If of length 1 the white point
+            specification will be recycled if length of L/C/H is larger than
+            one. If not specified (all three ``None``) default values will be used
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`gtrans`.
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
 
         Returns
         -------
         list
-            A list with hex colors as strings.
-        """
-
-        # Color fixup: limit r/g/b to [0-1]
-        def rgbfixup(r, g, b):
-            def fun(x):
-                return np.asarray([np.max([0, np.min([1, e])]) \
-                       if np.isfinite(e) else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
-
-        def rgbcleanup(r, g, b):
-            def fun(x):
-                return np.asarray([e if np.logical_and(e >= 0., e <= 1.)
-                       else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
-
-        # Checking which r/g/b values are outside limits.
-        # This only happens if fixup = FALSE.
-        def validrgb(r, g, b):
-            idxr = np.isfinite(r)
-            idxg = np.isfinite(g)
-            idxb = np.isfinite(b)
-            return np.where(idxr * idxg * idxb)[0]
-
-        # Support function to create hex coded colors
-        def gethex(r, g, b):
-
-            # Converts integers to hex string
-            def applyfun(x):
-                x = np.asarray(x * 255. + .5, dtype = np.int)
-                return "#{:02x}{:02x}{:02x}".format(x[0], x[1], x[2]).upper()
-
-            h = np.vstack([r,g,b]).transpose().flatten().reshape([len(r),3])
-            return np.apply_along_axis(applyfun, 1, h)
-
-        # Let's do the conversion!
-        if fixup: [r, g, b] = rgbfixup(r, g, b)
-        else:     [r, g, b] = rgbcleanup(r, g, b)
-
-        # Create return array
-        res = np.ndarray(len(r), dtype = "|S7"); res[:] = ""
-
-        # Check valid r/g/b coordinates
-        valid = validrgb(r,g,b)
-        if len(valid) > 0:
-            # Convert valid colors to hex
-            res[valid] = gethex(r[valid], g[valid], b[valid])
-
-        # Create return list with NAN's for invalid colors
-        res = [np.nan if len(x) == 0 else x.decode() for x in res]
-        return res;
+            Returns a list of `numpy.ndarrays` with the sRGB coordinates
+            (``[R, G, B]``) with the same length as the input arrays.
+        """
 
-    # RETO RETO RETO
-    def hex_to_sRGB(self, hex_, gamma = 2.4):
-        """hex_to_sRGB(hex_, gamma = 2.4)
+        n   = len(L)
+        luv = self._columns_("polarLUV_to_sRGB.LUV", n)
+        xyz = self._columns_("polarLUV_to_sRGB.XYZ", n)
+        self.polarLUV_to_LUV(L, C, H, out = luv)
+        self.LUV_to_XYZ(*luv, XN = XN, YN = YN, ZN = ZN, out = xyz)
+        rgb = self.XYZ_to_RGB(*xyz, XN = XN, YN = YN, ZN = ZN, out = out)
+        return [self.gtrans(x, gamma, out = x) for x in rgb]
 
-        Convert hex colors to sRGB.
+    def polarLUV_to_hex(self, L, C, H, XN = None, YN = None, ZN = None,
+                        gamma = 2.4, fixup = True, dtype = None):
+        """polarLUV_to_hex(L, C, H, XN = None, YN = None, ZN = None, gamma = 2.4, fixup = True, dtype = None)
+
+        polarLUV (HCL) to hex colors.
+
+        Fused transformation used to create the hex colors of the
+        HCL based color palettes, see :py:func:`polarLUV_to_sRGB`
+        and :py:func:`RGB_to_hex` (no gamma correction needed).
+
+        Parameters
+        ----------
+        L : numpy.ndarray
+            values for the L or luminance dimension
+        C : numpy.ndarray
+            values for the C or chroma dimension
+        H : numpy.ndarray
+            values for the H or hue dimension
+        XN, YN, ZN : None or numpy.ndarray
+            chromaticity of the white point. If of length 1 the white point
+            specification will be recycled if length of L/C/H is larger than
+            one. If not specified (all three ``None``) default values will be used
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`gtrans`.
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+        dtype : None or str
+            type of the result, see :py:func:`sRGB_to_hex`
+
+        Returns
+        -------
+        list or numpy.ndarray
+            A list with hex colors as strings, or an array if ``dtype`` is set.
+        """
+
+        rgb = self._polarLUV_to_RGB_(L, C, H, XN, YN, ZN)
+        return self.RGB_to_hex(*rgb, gamma = gamma, fixup = fixup, dtype = dtype)
+
+    def polarLUV_to_packed(self, L, C, H, XN = None, YN = None, ZN = None,
+                           gamma = 2.4, fixup = True):
+        """polarLUV_to_packed(L, C, H, XN = None, YN = None, ZN = None, gamma = 2.4, fixup = True)
+
+        polarLUV (HCL) to packed 32-bit colors, same as :py:func:`polarLUV_to_hex`
+        followed by :py:func:`hex_to_packed`.
+
+        Parameters
+        ----------
+        L, C, H : numpy.ndarray
+            luminance, chroma, and hue
+        XN, YN, ZN : None or numpy.ndarray
+            chromaticity of the white point, see :py:func:`polarLUV_to_hex`
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`gtrans`.
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint32`` array, see :py:class:`packedRGBA`.
+        """
+        rgb = self._polarLUV_to_RGB_(L, C, H, XN, YN, ZN)
+        return _pack_(*self._RGB_codes_(*rgb, gamma = gamma, fixup = fixup))
+
+    def _polarLUV_to_RGB_(self, L, C, H, XN, YN, ZN):
+        """_polarLUV_to_RGB_(L, C, H, XN, YN, ZN)
+
+        polarLUV (HCL) to device independent RGB, the first steps of
+        :py:func:`polarLUV_to_hex` (results on the workspace, if set).
+
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays (``[R, G, B]``).
+        """
+        n   = len(L)
+        luv = self._columns_("polarLUV_to_hex.LUV", n)
+        xyz = self._columns_("polarLUV_to_hex.XYZ", n)
+        rgb = self._columns_("polarLUV_to_hex.RGB", n)
+        self.polarLUV_to_LUV(L, C, H, out = luv)
+        self.LUV_to_XYZ(*luv, XN = XN, YN = YN, ZN = ZN, out = xyz)
+        self.XYZ_to_RGB(*xyz, XN = XN, YN = YN, ZN = ZN, out = rgb)
+        return rgb
+
+    def sRGB_to_polarLUV(self, R, G, B, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        """sRGB_to_polarLUV(R, G, B, XN = None, YN = None, ZN = None, gamma = 2.4, out = None)
+
+        sRGB to polarLUV (HCL).
+
+        Fused transformation from sRGB via RGB, CIEXYZ, and CIELUV to polarLUV,
+        the inverse of :py:func:`polarLUV_to_sRGB`. Calls the kernels of the
+        individual steps directly (no intermediate color objects).
+
+        Parameters
+        ----------
+        R : numpy.ndarray
+            indensities for red (``[0.,1.]``)
+        G : numpy.ndarray
+            indensities for green (``[0.,1.]``)
+        B : numpy.ndarray
+            indensities for blue  (``[0.,1.]``)
+        XN, YN, ZN : None or numpy.ndarray
+            chromaticity of the white point. If of length 1 the white point
+            specification will be recycled if length of R/G/B is larger than
+            one. If not specified (all three ``None``) default values will be used
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`ftrans`.
+        out : None or list
+            optional list of three float `numpy.ndarray`'s of the same length
+            as the inputs to store the results (must not overlap with the
+            inputs). If ``None`` (default) new arrays are allocated.
+
+        Returns
+        -------
+        list
+            Returns a list of polarLUV or HCL coordinates (``[L, C, H]``) with the
+            same length as the input arrays.
+        """
+
+        n   = len(R)
+        rgb = self._columns_("sRGB_to_polarLUV.RGB", n)
+        xyz = self._columns_("sRGB_to_polarLUV.XYZ", n)
+        luv = self._columns_("sRGB_to_polarLUV.LUV", n)
+        self.DEVRGB_to_RGB(R, G, B, gamma, out = rgb)
+        self.RGB_to_XYZ(*rgb, XN = XN, YN = YN, ZN = ZN, out = xyz)
+        self.XYZ_to_LUV(*xyz, XN = XN, YN = YN, ZN = ZN, out = luv)
+        return self.LUV_to_polarLUV(*luv, out = out)
+
+    def image_to_HCL(self, img, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        """image_to_HCL(img, XN = None, YN = None, ZN = None, gamma = 2.4, out = None)
+
+        Pixel image to HCL (polarLUV).
+
+        Converts the sRGB colors of a pixel image of shape ``(height, width, 3)``
+        or ``(height, width, 4)`` (the alpha channel is ignored) into hue,
+        chroma, and luminance planes of shape ``(height, width)``.  The image
+        is copied once into a planar float array (including the scaling of
+        integer images), all further steps (see :py:func:`sRGB_to_polarLUV`)
+        work on contiguous views of this array without flattening or
+        reshaping the data again. For ``uint8`` images the linearized
+        RGB values are taken from a lookup table (see :py:func:`hex_to_RGB`).
+
+        Parameters
+        ----------
+        img : numpy.ndarray
+            the image. Either an unsigned integer array (e.g., ``uint8``
+            as returned by ``imageio.imread``; scaled by the maximum of the
+            data type) or a float array with intensities in ``[0., 1.]``.
+        XN, YN, ZN : None or numpy.ndarray
+            chromaticity of the white point. If not specified (all three
+            ``None``) default values will be used
+        gamma : float
+            gamma adjustment, see :py:func:`ftrans`.
+        out : None or list
+            optional list of three C-contiguous float `numpy.ndarray`'s of
+            shape ``(height, width)`` to store the results (``[H, C, L]``).
+            If ``None`` (default) new arrays are allocated.
+
+        Returns
+        -------
+        list
+            Returns a list of `numpy.ndarrays` (``[H, C, L]``), each of
+            shape ``(height, width)``.
+
+        Examples
+        --------
+        >>> import imageio
+        >>> from colorspace import colorlib
+        >>> img = imageio.imread("colorful.png")
+        >>> [H, C, L] = colorlib().image_to_HCL(img)
+        """
+
+        img = np.asarray(img)
+        if not img.ndim == 3 or not img.shape[2] in [3, 4]:
+            raise ValueError("input img to image_to_HCL has to be of shape " + \
+                    "(height, width, 3) or (height, width, 4)")
+        shape = img.shape[0:2]
+        n     = shape[0] * shape[1]
+        if out is None:
+            out = [np.empty(shape, dtype = self.dtype) for i in range(3)]
+        elif not np.all([isinstance(x, np.ndarray) and x.shape == shape and \
+                         x.flags.c_contiguous for x in out]) or not len(out) == 3:
+            raise ValueError("input out to image_to_HCL has to be a list of three " + \
+                    "C-contiguous numpy.ndarray's of shape (height, width)")
+
+        # Results written directly into the (flat views of the) output planes
+        res    = [out[2].reshape(-1), out[1].reshape(-1), out[0].reshape(-1)]
+        tables = self._srgb8_tables_(gamma) if img.dtype == np.uint8 else None
+
+        # 8-bit images: planar (n, 3) copy of the linearized channels taken
+        # from the lookup table (no gamma correction), see _srgb8_tables_.
+        if not tables is None:
+            rgb = self._buffer_("image_to_HCL.RGB", (n, 3))
+            np.take(tables[0], img.reshape((-1, img.shape[2]))[:,0:3], out = rgb)
+            xyz = self._columns_("image_to_HCL.XYZ", n)
+            luv = self._columns_("image_to_HCL.LUV", n)
+            self.RGB_to_XYZ(rgb[:,0], rgb[:,1], rgb[:,2], XN, YN, ZN, out = xyz)
+            self.XYZ_to_LUV(*xyz, XN = XN, YN = YN, ZN = ZN, out = luv)
+            self.LUV_to_polarLUV(*luv, out = res)
+            return list(out)
+
+        # Planar copy of the red, green, and blue channel
+        rgb = self._buffer_("image_to_HCL.rgb", (3, n))
+        rgb[:] = img.reshape((-1, img.shape[2]))[:,0:3].transpose()
+        if np.issubdtype(img.dtype, np.integer):
+            rgb /= float(np.iinfo(img.dtype).max)
+
+        self.sRGB_to_polarLUV(rgb[0], rgb[1], rgb[2], XN, YN, ZN, gamma, out = res)
+        return list(out)
+
+    def sRGB_to_hex(self, r, g, b, fixup = True, dtype = None):
+        """sRGB_to_hex(r, g, b, fixup = True, dtype = None)
+
+        sRGB colors to hex colors.
+
+        Parameters
+        ----------
+        r : numpy.ndarray
+            intensities for red (``[0.,1.,]``)
+        g : numpy.ndarray
+            intensities for green (``[0.,1.,]``)
+        b : numpy.ndarray
+            intensities for blue (``[0.,1.,]``)
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+        dtype : None or str
+            ``None`` (default) to return a list, ``"U7"`` or ``"S7"`` to
+            return a `numpy.ndarray` of this type (invalid colors are
+            stored as ``"nan"``).
+
+        Returns
+        -------
+        list or numpy.ndarray
+            A list with hex colors as strings (``nan`` for invalid
+            colors), or an array if ``dtype`` is set.
+        """
+
+        return _encode_hex_(*self._sRGB_codes_(r, g, b, fixup), dtype = dtype)
+
+    def _sRGB_codes_(self, r, g, b, fixup = True):
+        """_sRGB_codes_(r, g, b, fixup = True)
+
+        Quantizes sRGB colors to 8-bit integers (see :py:func:`sRGB_to_hex`).
+
+        Returns
+        -------
+        list
+            Returns a list with an integer array of shape ``(n, 3)`` (the red,
+            green, and blue values, ``0`` for invalid colors) and a
+            boolean array of length ``n`` (``False`` for invalid colors).
+        """
+
+        # Not finite: invalid. Outside [0., 1.]: limited to [0., 1.]
+        # (fixup) or invalid. Quantized in double precision.
+        rgb   = np.stack([r, g, b], axis = 1).astype("float")
+        valid = np.all(np.isfinite(rgb), axis = 1)
+        if fixup:
+            np.clip(rgb, 0., 1., out = rgb)
+        else:
+            valid &= np.all((rgb >= 0.) & (rgb <= 1.), axis = 1)
+
+        rgb *= 255.; rgb += .5
+        rgb[~valid] = 0.
+        return [rgb.astype("int"), valid]
+
+    # RETO RETO RETO
+    def hex_to_sRGB(self, hex_, gamma = 2.4):
+        """hex_to_sRGB(hex_, gamma = 2.4)
+
+        Convert hex colors to sRGB.
+
+        Parameters
+        ----------
+        hex_ : str, list of str, or numpy.ndarray
+            hex strings (unicode or bytes, e.g., ``"|S7"``). Invalid hex
+            colors give ``nan``, the alpha values of eight digit hex
+            colors are ignored.
+        gamma : float
+            gamma correction factor.
+
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays with the corresponding
+            red, green, and blue intensities (``[0.,1.]``).
+        """
+
+        return self._codes_to_sRGB_(self._hex_to_codes_(hex_))
+
+    def _codes_to_sRGB_(self, codes):
+        """_codes_to_sRGB_(codes)
+
+        8-bit integers (see :py:func:`_hex_to_codes_`) to sRGB.
+
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays (``[R, G, B]``), ``nan``
+            for invalid colors (``-1``).
+        """
+        # Result array, nan for invalid hex colors
+        res = np.empty(codes.shape, dtype = self.dtype)
+        np.divide(codes, 255., out = res)
+        res[codes[:,0] < 0] = np.nan
+
+        return [res[:,0], res[:,1], res[:,2]]
+
+    def _hex_to_codes_(self, hex_):
+        """_hex_to_codes_(hex_)
+
+        Decodes hex colors into 8-bit integers (see :py:func:`_decode_hex_`).
+
+        Parameters
+        ----------
+        hex_ : str, list of str, or numpy.ndarray
+            hex strings.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer array of shape ``(n, 3)`` with the red, green, and blue
+            values (``0`` to ``255``), ``-1`` for invalid hex colors.
+        """
+        return _decode_hex_(hex_)[0]
+
+    def hex_to_RGB(self, hex_, gamma = 2.4):
+        """hex_to_RGB(hex_, gamma = 2.4)
+
+        Convert hex colors to device independent RGB.
+
+        Same as :py:func:`hex_to_sRGB` followed by :py:func:`DEVRGB_to_RGB`.
+        Hex colors have 8-bit sRGB coordinates, the gamma correction is
+        replaced by a lookup table with 256 entries (see :py:func:`ftrans`),
+        giving identical results.
 
         Parameters
         ----------
         hex_ : str, list of str
             hex strings.
-        gamma : float
+        gamma : float or numpy.ndarray
             gamma correction factor.
 
         Returns
@@ -1472,40 +2536,261 @@ class colorlib(object):
             Returns a list of numpy.ndarrays with the corresponding
             red, green, and blue intensities (``[0.,1.]``).
         """
+        return self._codes_to_RGB_(self._hex_to_codes_(hex_), gamma)
 
-        if isinstance(hex_,str): hex_ = [hex_]
-        hex_ = np.asarray(hex_)
+    def _codes_to_RGB_(self, codes, gamma = 2.4):
+        """_codes_to_RGB_(codes, gamma = 2.4)
 
-        # Check for valid hex colors
-        def validhex(hex_):
-            from re import match
-            ##return np.where([match("^#[A-Za-z0-9]{6}([0-9]{2})?$", x) is not None for x in hex_])[0]
-            return np.where([match("^#[0-9A-Fa-f]{6}(o-9]{2})?$$", x) is not None for x in hex_])[0]
+        8-bit integers (see :py:func:`_hex_to_codes_`) to device independent
+        RGB using the lookup table of :py:func:`_srgb8_tables_` if possible.
 
-        # Convert hex to rgb
-        def getrgb(x):
-            def applyfun(x):
-                return np.asarray([int(x[i:i+2], 16) for i in (1, 3 ,5)])
-            rgb = [applyfun(e) for e in x]
-            rgb = np.vstack(rgb).transpose().flatten().reshape([3,len(x)])
-            return [rgb[0] / 255., rgb[1] / 255., rgb[2] / 255.]
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays (``[R, G, B]``), ``nan``
+            for invalid colors (``-1``).
+        """
+        tables = self._srgb8_tables_(gamma)
+        if tables is None:
+            return self.DEVRGB_to_RGB(*self._codes_to_sRGB_(codes), gamma = gamma)
 
-        # Result arrays
-        r = np.ndarray(len(hex_), dtype = "float"); r[:] = np.nan 
-        g = np.ndarray(len(hex_), dtype = "float"); g[:] = np.nan 
-        b = np.ndarray(len(hex_), dtype = "float"); b[:] = np.nan 
+        # Invalid colors (-1) take the last element of the table (nan)
+        res = np.take(tables[0], codes)
+        return [res[:,0], res[:,1], res[:,2]]
 
-        # Check valid hex colors
-        valid = validhex(hex_)
-        if not len(valid) == 0:
+    def RGB_to_hex(self, R, G, B, gamma = 2.4, fixup = True, dtype = None):
+        """RGB_to_hex(R, G, B, gamma = 2.4, fixup = True, dtype = None)
 
-            # Decode valid hex strings
-            rgb = getrgb(hex_[valid])
-            r[valid] = rgb[0]
-            g[valid] = rgb[1]
-            b[valid] = rgb[2]
+        Device independent RGB to hex colors.
 
-        return [r, g, b]
+        Same as :py:func:`RGB_to_DEVRGB` followed by :py:func:`sRGB_to_hex`.
+        The 8-bit sRGB values of the hex colors are looked up in a table of
+        quantization thresholds on the linear RGB values (no gamma correction),
+        giving identical results.
+
+        Parameters
+        ----------
+        R : numpy.ndarray
+            indensities for red (``[0.,1.]``)
+        G : numpy.ndarray
+            indensities for green (``[0.,1.]``)
+        B : numpy.ndarray
+            indensities for blue  (``[0.,1.]``)
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`gtrans`.
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+        dtype : None or str
+            type of the result, see :py:func:`sRGB_to_hex`
+
+        Returns
+        -------
+        list or numpy.ndarray
+            A list with hex colors as strings, or an array if ``dtype`` is set.
+        """
+        return _encode_hex_(*self._RGB_codes_(R, G, B, gamma, fixup), dtype = dtype)
+
+    def _RGB_codes_(self, R, G, B, gamma = 2.4, fixup = True):
+        """_RGB_codes_(R, G, B, gamma = 2.4, fixup = True)
+
+        Quantizes device independent RGB colors to 8-bit sRGB integers
+        (see :py:func:`RGB_to_hex`), using the quantization thresholds of
+        :py:func:`_srgb8_tables_` if possible.
+
+        Returns
+        -------
+        list
+            Returns a list with an integer array of shape ``(n, 3)`` and a
+            boolean array of length ``n``, see :py:func:`_sRGB_codes_`.
+        """
+        tables = self._srgb8_tables_(gamma)
+        if tables is None:
+            return self._sRGB_codes_(*self.RGB_to_DEVRGB(R, G, B, gamma = gamma), fixup = fixup)
+
+        [R, G, B] = [np.asarray(x, dtype = self.dtype) for x in [R, G, B]]
+        [lut, thresholds, over] = tables
+
+        # Invalid: not finite, or outside [0., 1.] in sRGB if not fixup
+        valid = np.isfinite(R) & np.isfinite(G) & np.isfinite(B)
+        if not fixup:
+            for x in [R, G, B]: valid &= (x >= 0.) & (x < over)
+
+        codes = np.stack([np.searchsorted(thresholds, x, side = "right") for x in [R, G, B]], axis = 1)
+        return [codes, valid]
+
+    def sRGB_to_packed(self, r, g, b, fixup = True):
+        """sRGB_to_packed(r, g, b, fixup = True)
+
+        sRGB colors to packed 32-bit colors (``0xRRGGBBAA``, opaque), see
+        :py:class:`packedRGBA`. Quantized as in :py:func:`sRGB_to_hex`,
+        invalid colors are packed as transparent black (``0``).
+
+        Parameters
+        ----------
+        r, g, b : numpy.ndarray
+            intensities for red, green, and blue (``[0.,1.,]``)
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint32`` array.
+        """
+        return _pack_(*self._sRGB_codes_(r, g, b, fixup))
+
+    def packed_to_sRGB(self, x):
+        """packed_to_sRGB(x)
+
+        Packed 32-bit colors (see :py:class:`packedRGBA`) to sRGB,
+        the alpha byte is ignored.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            ``uint32`` array with the packed colors
+
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays with the corresponding
+            red, green, and blue intensities (``[0.,1.]``).
+        """
+        return self._codes_to_sRGB_(_unpack_(x)[:,0:3])
+
+    def RGB_to_packed(self, R, G, B, gamma = 2.4, fixup = True):
+        """RGB_to_packed(R, G, B, gamma = 2.4, fixup = True)
+
+        Device independent RGB to packed 32-bit colors, same as
+        :py:func:`RGB_to_DEVRGB` followed by :py:func:`sRGB_to_packed`
+        (quantization thresholds as in :py:func:`RGB_to_hex`).
+
+        Parameters
+        ----------
+        R, G, B : numpy.ndarray
+            indensities for red, green, and blue (``[0.,1.]``)
+        gamma : float or numpy.ndarray
+            gamma adjustment, see :py:func:`gtrans`.
+        fixup : bool
+            whether or not the rgb values should be corrected if
+            they lie outside the defined RGB space (outside ``[0.,1.,]``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint32`` array.
+        """
+        return _pack_(*self._RGB_codes_(R, G, B, gamma, fixup))
+
+    def packed_to_RGB(self, x, gamma = 2.4):
+        """packed_to_RGB(x, gamma = 2.4)
+
+        Packed 32-bit colors to device independent RGB, same as
+        :py:func:`packed_to_sRGB` followed by :py:func:`DEVRGB_to_RGB`
+        (lookup table as in :py:func:`hex_to_RGB`).
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            ``uint32`` array with the packed colors
+        gamma : float or numpy.ndarray
+            gamma correction factor.
+
+        Returns
+        -------
+        list
+            Returns a list of numpy.ndarrays with the corresponding
+            red, green, and blue intensities (``[0.,1.]``).
+        """
+        return self._codes_to_RGB_(_unpack_(x)[:,0:3], gamma)
+
+    def hex_to_packed(self, hex_):
+        """hex_to_packed(hex_)
+
+        Hex colors to packed 32-bit colors (``0xRRGGBBAA``, opaque), the
+        alpha values of eight digit hex colors are ignored. Invalid hex
+        colors are packed as transparent black (``0``).
+
+        Parameters
+        ----------
+        hex_ : str, list of str, or numpy.ndarray
+            hex strings.
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint32`` array.
+        """
+        codes = self._hex_to_codes_(hex_)
+        return _pack_(codes, codes[:,0] >= 0)
+
+    def packed_to_hex(self, x, dtype = None):
+        """packed_to_hex(x, dtype = None)
+
+        Packed 32-bit colors to (six digit) hex colors, the alpha
+        byte is ignored.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            ``uint32`` array with the packed colors
+        dtype : None or str
+            type of the result, see :py:func:`sRGB_to_hex`
+
+        Returns
+        -------
+        list or numpy.ndarray
+            A list with hex colors as strings, or an array if ``dtype`` is set.
+        """
+        codes = _unpack_(x)[:,0:3]
+        return _encode_hex_(codes, np.ones(len(codes), dtype = bool), dtype)
+
+    def image_to_packed(self, img):
+        """image_to_packed(img)
+
+        ``uint8`` pixel image to packed 32-bit colors (``0xRRGGBBAA``).
+
+        Parameters
+        ----------
+        img : numpy.ndarray
+            ``uint8`` image of shape ``(height, width, 3)`` or
+            ``(height, width, 4)`` (with alpha channel; else opaque)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint32`` array of shape ``(height, width)``.
+        """
+        img = np.asarray(img)
+        if not img.dtype == np.uint8 or not img.ndim == 3 or not img.shape[2] in [3, 4]:
+            raise ValueError("input img to image_to_packed has to be an uint8 array of " + \
+                    "shape (height, width, 3) or (height, width, 4)")
+        res  = img[:,:,0].astype("uint32") << np.uint32(24)
+        res |= img[:,:,1].astype("uint32") << np.uint32(16)
+        res |= img[:,:,2].astype("uint32") << np.uint32(8)
+        res |= img[:,:,3] if img.shape[2] == 4 else np.uint32(255)
+        return res
+
+    def packed_to_image(self, x):
+        """packed_to_image(x)
+
+        Packed 32-bit colors to an ``uint8`` pixel image.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            ``uint32`` array of any shape (e.g., ``(height, width)``)
+
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint8`` array of shape ``x.shape + (4,)`` (red,
+            green, blue, and alpha).
+        """
+        x = np.asarray(x, dtype = "uint32")
+        return _unpack_(x.reshape(-1)).reshape(x.shape + (4,))
 
 
 # -------------------------------------------------------------------
@@ -1516,12 +2801,32 @@ class colorobject(object):
     """
     This is the base class of all color objects and provides some
     default methods.
+
+    The coordinates are copy-on-write: copies of an object (``copy``,
+    ``deepcopy``) share the coordinate arrays with the original until
+    one of them is modified (see :py:func:`set`), :py:func:`get` returns
+    read-only views. The state of the objects is stored in ``__slots__``.
+
+    The objects keep the coordinates of the color spaces they have been
+    converted from and into (see :py:func:`to` and :py:func:`as_`): converting
+    back into one of these color spaces restores the coordinates without
+    converting the colors again (e.g., the original HCL coordinates
+    after converting into CIELUV and back). Conversions losing information
+    (into hex colors or packed colors, see :py:func:`conversiongraph.lossy`)
+    clear the cache: converting back gives the same coordinates as
+    converting the quantized colors of a new object. The cache is cleared if the
+    colors are modified (:py:func:`set`, :py:func:`set_whitepoint`,
+    :py:func:`dropalpha`, :py:func:`set_dtype`) and limited to ``CACHEBYTES``
+    bytes per object; ``colorobject.CACHEBYTES = 0`` (all objects) or
+    ``obj.CACHEBYTES = 0`` (one object, e.g., a large image) disables it.
     """
 
-    # Allowed/defined color spaces
-    ALLOWED = ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "polarLAB",
-               "RGB", "sRGB", "HCL",
-               "HSV", "HLS", "hex"]
+    # Coordinates (see below), copy-on-write flag (True if the coordinates
+    # may be shared with another object or the cache), the cached coordinates
+    # in other color spaces, and the white point. The __dict__ takes per-object
+    # settings (GAMMA, DTYPE, CACHEBYTES).
+    __slots__ = ("_coords_", "_dims_", "_alpha_", "_shared_", "_reprs_",
+                 "WHITEX", "WHITEY", "WHITEZ", "__dict__", "__weakref__")
 
     # Used to store alpha if needed. Will only be used for some of
     # the colorobject objects as only few color spaces allow alpha
@@ -1531,6 +2836,295 @@ class colorobject(object):
     # GAMMA
     GAMMA = 2.4 # Used to adjust RGB (DEVRGB_to_RGB and back).
 
+    # Floating point precision used to store the coordinates and to
+    # convert the colors. Global default, can be changed for all objects
+    # (colorobject.DTYPE = "float32") or per object (see set_dtype).
+    DTYPE = "float64"
+
+    # Maximum number of bytes of the coordinates cached per object
+    # (coordinates in other color spaces), 0 disables the cache.
+    CACHEBYTES = 2**24
+
+    # Storage of the coordinates: one C-contiguous (n, 3) float array
+    # (one column per dimension; a one-dimensional array for hexcols),
+    # the names of the dimensions, and an optional alpha vector.
+    def __new__(cls, *args, **kwargs):
+        obj = object.__new__(cls)
+        obj._coords_ = None
+        obj._dims_   = ()
+        obj._alpha_  = None
+        obj._shared_ = False
+        obj._reprs_  = {}
+        return obj
+
+    def __copy__(self):
+        """__copy__()
+
+        Returns a copy of the object sharing the coordinates (copy-on-write).
+        """
+        obj = self.__class__.__new__(self.__class__)
+        for x in ["_coords_", "_dims_", "_alpha_", "_reprs_",
+                  "WHITEX", "WHITEY", "WHITEZ"]:
+            if hasattr(self, x): setattr(obj, x, getattr(self, x))
+        obj.__dict__.update(self.__dict__)
+        obj._shared_ = self._shared_ = True
+        return obj
+
+    def __deepcopy__(self, memo):
+        """__deepcopy__(memo)
+
+        Same as ``copy``: the coordinates are only copied if
+        modified (copy-on-write).
+        """
+        return self.__copy__()
+
+    def __len__(self):
+        """__len__()
+
+        Returns
+        -------
+        int
+            Returns the number of colors.
+        """
+        return 0 if self._coords_ is None else self._coords_.shape[0]
+
+    def __getitem__(self, idx):
+        """__getitem__(idx)
+
+        Subset of the colors. Slices (with step ``1``) and single integers
+        return objects sharing the coordinates (copy-on-write, see
+        :py:func:`set`) including the coordinates cached in other color
+        spaces, boolean masks and arrays of indices (fancy indexing) copy
+        the selected colors. White point, settings, and alpha values are
+        taken over.
+
+        Parameters
+        ----------
+        idx : int, slice, list, or numpy.ndarray
+            index of the colors, a boolean mask of length ``len(self)``,
+            or integer indices
+
+        Returns
+        -------
+        colorobject
+            Returns a new object of the same class.
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import hexcols
+        >>> c = hexcols(["#ff0000", "#00ff00", "#0000ff"])
+        >>> c[0]
+        >>> c[1:]
+        >>> c[[True, False, True]]
+        """
+        n = len(self)
+        if isinstance(idx, (int, np.integer)):
+            i = int(idx) + n if idx < 0 else int(idx)
+            if not 0 <= i < n:
+                raise IndexError("index {:d} out of range for {:s} with {:d} colors".format(
+                                 int(idx), self.__class__.__name__, n))
+            idx = slice(i, i + 1)
+        elif not isinstance(idx, slice):
+            idx = np.asarray(idx)
+            if idx.size == 0: idx = idx.astype("int")
+            if not idx.ndim == 1 or not idx.dtype.kind in "biu":
+                raise IndexError("index to {:s} has to be an integer, ".format(self.__class__.__name__) + \
+                                 "a slice, a boolean mask, or an array of integer indices")
+            if idx.dtype.kind == "b" and not len(idx) == n:
+                raise IndexError("boolean mask of length {:d} for {:s} with {:d} colors".format(
+                                 len(idx), self.__class__.__name__, n))
+
+        # Views for slices (copies if not contiguous, i.e., step != 1)
+        def take(x):
+            return None if x is None else np.ascontiguousarray(x[idx])
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        for x in ["WHITEX", "WHITEY", "WHITEZ"]:
+            if hasattr(self, x): setattr(obj, x, getattr(self, x))
+        obj._dims_   = self._dims_
+        obj._coords_ = take(self._coords_)
+        obj._alpha_  = take(self._alpha_)
+        if np.shares_memory(obj._coords_, self._coords_):
+            obj._reprs_  = dict([(k, (v[0], take(v[1]))) for k,v in self._reprs_.items()])
+            obj._shared_ = self._shared_ = True
+        return obj
+
+    @classmethod
+    def concat(cls, objs, fixup = True):
+        """concat(objs, fixup = True)
+
+        Concatenates color objects, the coordinates are copied once
+        into the new object.
+
+        Parameters
+        ----------
+        objs : list
+            list of color objects. If called on a color class (e.g.,
+            ``polarLUV.concat(...)``) objects in other color spaces are
+            converted (see :py:func:`as_`), if called on
+            :py:class:`colorobject` all objects have to be in the same
+            color space. All objects need the same white point.
+        fixup : bool
+            passed to :py:func:`as_` when converting objects
+
+        Returns
+        -------
+        colorobject
+            Returns a new object containing the colors of all objects;
+            white point and settings are taken from the first object. If one
+            of the objects has alpha values the new object has alpha values
+            (``1`` for the colors of objects without alpha).
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import colorobject, polarLUV, hexcols
+        >>> a = polarLUV(H = [0., 120.], C = [50., 50.], L = [60., 60.])
+        >>> b = hexcols(["#ff0000", "#00ff00"])
+        >>> c = polarLUV.concat([a, b])
+        >>> c = colorobject.concat([a, a[:1]])
+        """
+        objs = list(objs)
+        if len(objs) == 0:
+            raise ValueError("no color objects to concatenate")
+        if not np.all([isinstance(x, colorobject) for x in objs]):
+            raise ValueError("objects to concatenate have to be color objects")
+        if cls is colorobject:
+            cls = objs[0].__class__
+            if not np.all([x.__class__ is cls for x in objs]):
+                raise ValueError("objects to concatenate have to be of the same class, " + \
+                        "got {:s}".format(", ".join(sorted(set([x.__class__.__name__ for x in objs])))))
+        objs = [x if x.__class__ is cls else x.as_(cls.__name__, fixup = fixup) for x in objs]
+
+        white = [(x.WHITEX, x.WHITEY, x.WHITEZ) for x in objs]
+        if not np.all([x == white[0] for x in white]):
+            raise ValueError("objects to concatenate have different white points")
+
+        # Allocating the coordinates (and alpha) once
+        first = objs[0]
+        n     = np.sum([len(x) for x in objs], dtype = "int")
+        dtype = np.result_type(*[x._coords_ for x in objs]) if len(first._dims_) == 1 \
+                else first.DTYPE
+        coords = np.empty((n,) + first._coords_.shape[1:], dtype = dtype)
+        alpha  = None if np.all([x._alpha_ is None for x in objs]) else np.ones(n, dtype = first.DTYPE)
+        i = 0
+        for x in objs:
+            # Columns in the order of the first object (the order depends on
+            # how the object was created, e.g., constructor or conversion)
+            if len(first._dims_) == 1:
+                coords[i:i + len(x)] = x._coords_
+            else:
+                for k,d in enumerate(first._dims_):
+                    coords[i:i + len(x), k] = x._coords_[:, x._dims_.index(d)]
+            if not x._alpha_ is None: alpha[i:i + len(x)] = x._alpha_
+            i += len(x)
+
+        obj = cls.__new__(cls)
+        obj.__dict__.update(first.__dict__)
+        for x in ["WHITEX", "WHITEY", "WHITEZ"]:
+            if hasattr(first, x): setattr(obj, x, getattr(first, x))
+        obj._dims_   = first._dims_
+        obj._coords_ = coords
+        obj._alpha_  = alpha
+        return obj
+
+    def _cached_(self, name, fixup):
+        """_cached_(name, fixup)
+
+        Returns the cached coordinates in the color space ``name``: the
+        coordinates of the same colors (cached with ``fixup = None``, the
+        coordinates the object had or converted without loss of information),
+        or the result of a lossy conversion of the current coordinates with
+        the same ``fixup``.
+
+        Returns
+        -------
+        tuple or None
+            Returns a tuple ``(dims, coords)``, ``None`` if not cached.
+        """
+        if not self.CACHEBYTES > 0: return None
+        for key in [(name, None), (name, bool(fixup))]:
+            if key in self._reprs_: return self._reprs_[key]
+        return None
+
+    def _remember_(self, name, fixup, dims, coords):
+        """_remember_(name, fixup, dims, coords)
+
+        Adds coordinates to the cache (see :py:func:`_cached_`). The oldest
+        coordinates are removed if the cache exceeds ``CACHEBYTES`` bytes.
+
+        Returns
+        -------
+        dict
+            Returns the new cache (the cache of the object is not modified,
+            caches are replaced as a whole).
+        """
+        limit = int(self.CACHEBYTES)
+        if coords is None or coords.dtype.kind == "O" or coords.nbytes > limit: return self._reprs_
+        reprs = dict(self._reprs_)
+        reprs.pop((name, fixup), None)
+        reprs[(name, fixup)] = (tuple(dims), coords)
+        while np.sum([x[1].nbytes for x in reprs.values()]) > limit:
+            del reprs[next(iter(reprs))]
+        return reprs
+
+    def _set_coords_(self, dims, cols, alpha = None, adopt = False):
+        """_set_coords_(dims, cols, alpha = None, adopt = False)
+
+        Stores the coordinates on the object.
+
+        Parameters
+        ----------
+        dims : list of str
+            names of the dimensions (e.g., ``["H", "C", "L"]``)
+        cols : list
+            list of `numpy.ndarray`'s of the same length, one for each
+            dimension in ``dims``
+        alpha : None or numpy.ndarray
+            alpha values, ``None`` if there is no alpha channel
+        adopt : bool
+            if ``True`` and all ``cols`` are the columns of one C-contiguous
+            ``(n, len(dims))`` array of the object's floating point precision
+            (``DTYPE``, e.g., the result of :py:func:`colorlib.RGB_to_XYZ`)
+            the array is stored without copying the data
+        """
+        self._dims_ = tuple(dims)
+        if len(dims) == 1:
+            # Non-numeric coordinates (hexcols)
+            self._coords_ = np.asarray(cols[0])
+        else:
+            base = _column_base_(cols) if adopt else None
+            if base is None or not base.dtype == np.dtype(self.DTYPE):
+                base = np.empty((len(cols[0]), len(dims)), dtype = self.DTYPE)
+                for i,x in enumerate(cols): base[:,i] = x
+            self._coords_ = base
+        self._alpha_  = None if alpha is None else np.asarray(alpha, dtype = self.DTYPE)
+        self._shared_ = False
+        self._reprs_  = {}
+
+    @property
+    def _data_(self):
+        """Dictionary with the coordinates of all dimensions.
+
+        The entries are read-only (zero-copy) column views of the underlying
+        ``(n, 3)`` array plus ``"alpha"`` if an alpha channel is defined.
+        Assigning a dictionary stores the coordinates
+        (see :py:func:`_set_coords_`).
+        """
+        def view(x):
+            x = x.view(); x.flags.writeable = False
+            return x
+        if len(self._dims_) == 1:
+            res = {self._dims_[0]: view(self._coords_)}
+        else:
+            res = dict([(d, view(self._coords_[:,i])) for i,d in enumerate(self._dims_)])
+        if not self._alpha_ is None: res["alpha"] = view(self._alpha_)
+        return res
+
+    @_data_.setter
+    def _data_(self, data):
+        dims = [x for x in data.keys() if not x == "alpha"]
+        self._set_coords_(dims, [data[x] for x in dims], data.get("alpha"))
+
     # Standard representation of colorspace colorobject objects.
     def __repr__(self, digits = 2):
         """__repr__(digits = 2)
@@ -1543,7 +3137,8 @@ class colorobject(object):
             Returns a string of the colors/coordinates of the current
             object.
         """
-        dims = list(self._data_.keys())    # Dimensions
+        data = self._data_
+        dims = list(data.keys())    # Dimensions
 
         # Sorting the dimensions
         from re import match
@@ -1554,6 +3149,7 @@ class colorobject(object):
         elif match("^(X|Y|Z|alpha){3,4}$", "".join(dims)): dims = ["X", "Y", "Z"]
         elif match("^(H|S|V|alpha){3,4}$", "".join(dims)): dims = ["H", "S", "V"]
         elif match("^(H|L|S|alpha){3,4}$", "".join(dims)): dims = ["H", "L", "S"]
+        elif match("^(rgba|alpha){1,2}$",  "".join(dims)): dims = ["rgba"]
         if self.hasalpha():
             dims.append("alpha")
         elif "alpha" in dims:
@@ -1561,33 +3157,39 @@ class colorobject(object):
 
 
         # Number of colors
-        ncol = len(self._data_[dims[0]])
+        ncol = len(data[dims[0]])
 
         # Start creating the string:
         res = ["{:s} color object ({:d} colors)".format(self.__class__.__name__, ncol)]
 
-        # Show header
-        fmt = "".join(["{:>", "{:d}".format(digits+6), "s}"])
+        # Show header (packed colors are shown as 0xRRGGBBAA)
+        width = digits + (10 if self.__class__.__name__ == "packedRGBA" else 6)
+        fmt = "".join(["{:>", "{:d}".format(width), "s}"])
         res.append("    " + "".join([fmt.format(x) for x in dims]))
 
         # Show data
         # In case of a hexcols object: string formatting and
         # nan-replacement beforehand.
         if self.__class__.__name__ == "hexcols":
-            data = {}
+            coords = data; data = {}
             fmt = "".join(["{:", "{:d}.{:d}".format(6+digits, 3), "f}"])
             for d in dims: ##self._data_.keys():
                 data[d] = np.ndarray(ncol, dtype = "|S7")
                 for n in range(0, ncol):
-                    x = self._data_[d][n]
+                    x = coords[d][n]
                     if isinstance(x, float):
                         data[d][n] = fmt.format(x)
                     else:
                         data[d][n] = x[0:7]
             fmt = "{:>8s}"
+        elif self.__class__.__name__ == "packedRGBA":
+            fmt  = "".join(["{:>", "{:d}".format(width), "s}"])
+            data = {"rgba": ["0x{:08X}".format(x) for x in data["rgba"].tolist()],
+                    "alpha": data.get("alpha")}
+            if self.hasalpha():
+                data["alpha"] = ["{:.{:d}f}".format(x, digits) for x in data["alpha"].tolist()]
         else:
             fmt = "".join(["{:", "{:d}.{:d}".format(6+digits, digits), "f}"])
-            data = self._data_
 
         # Print object content
         count = 0
@@ -1652,6 +3254,7 @@ class colorobject(object):
 
         No return, stores the new definition on the object.
         :py:func:`get_whitepoint` can be used to get the current specification.
+        Clears the coordinates cached in other color spaces.
 
         Parameters
         ----------
@@ -1669,6 +3272,7 @@ class colorobject(object):
         >>> c.set_whitepoint(X = 100., Y = 100., Z = 101.)
         >>> c.get_whitepoint()
         """
+        self._reprs_ = {}
         for key,arg in kwargs.items():
             if   key == "X":  self.WHITEX = float(arg)
             elif key == "Y":  self.WHITEY = float(arg)
@@ -1678,6 +3282,59 @@ class colorobject(object):
                         "argument \"{:s}\" not recognized.".format(key))
 
 
+    def get_dtype(self):
+        """get_dtype()
+
+        Returns the floating point precision used to store the coordinates
+        of the colors and to convert them into other color spaces.
+
+        Returns
+        -------
+        numpy.dtype
+            Returns ``float64`` (default) or ``float32``.
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import hexcols
+        >>> c = hexcols("#ff0000")
+        >>> c.get_dtype()
+        """
+        return np.dtype(self.DTYPE)
+
+
+    def set_dtype(self, dtype):
+        """set_dtype(dtype)
+
+        Sets the floating point precision used to store the coordinates of
+        the colors and for all subsequent conversions (see :py:func:`to`).
+        Single precision (``"float32"``) halves the memory needed for large
+        sets of colors (e.g., images) and is accurate to the 8-bit resolution
+        of the hex colors; the default is double precision (``"float64"``).
+        The default for all objects can be set via ``colorobject.DTYPE``.
+
+        No return, converts the coordinates (if needed) and stores the new
+        definition on the object.
+
+        Parameters
+        ----------
+        dtype : str or numpy.dtype
+            ``"float32"`` or ``"float64"``
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import sRGB
+        >>> c = sRGB([1., 0.5], [0.3, 0.1], [0., 0.])
+        >>> c.set_dtype("float32")
+        >>> c.to("hex")
+        """
+        self.DTYPE = _check_dtype_(dtype).name
+        self._reprs_ = {}
+        if len(self._dims_) > 1:
+            self._coords_ = self._coords_.astype(self.DTYPE, copy = False)
+        if not self._alpha_ is None:
+            self._alpha_ = self._alpha_.astype(self.DTYPE, copy = False)
+
+
     def _check_if_allowed_(self, x):
         """_check_if_allowed_(x)
 
@@ -1694,34 +3351,102 @@ class colorobject(object):
         x : str
             name of the target color space
         """
-        if not x in self.ALLOWED:
+        allowed = conversions.spaces()
+        if not x in allowed:
             raise Exception("transformation from {:s}".format(self.__class__.__name__) + \
                     " to \"{:s}\" is unknown (not implemented).".format(x) + \
-                    "The following are allowed: {:s}".format(", ".join(self.ALLOWED)))
+                    "The following are allowed: {:s}".format(", ".join(allowed)))
         return
 
 
-    def _transform_via_path_(self, via, fixup):
-        """_transform_via_path_(via, fixup)
+    def to(self, to, fixup = True, workers = None, chunksize = None, backend = None):
+        """to(to, fixup = True, workers = None, chunksize = None, backend = None)
+
+        Transforms the colors into a new color space, if possible.
+
+        No return, converts the object into a new color space and modifies
+        the underlying object. After calling this method the original
+        object will be of a different type.
 
-        Helper function to transform a colorobject into a new color
-        space. Calls the .to method one or several times along 'a path'
-        as specified by ``via``.
+        The transformation is planned and executed by the
+        :py:class:`conversiongraph` (see ``colorlib.conversions``),
+        conversions along a path of several color spaces are performed
+        in one call.
 
-        No return, converts the current color space object (see method
-        :py:func:`to`.
+        Parameters
+        ----------
+        to : str
+            name of the color space into which the colors should be
+            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
+        fixup : bool
+            whether or not colors outside the defined rgb color space
+            should be corrected if necessary
+        workers : None or int
+            number of threads or processes used to convert large sets of
+            colors in chunks of ``chunksize`` colors. If ``None`` the
+            default of the :py:class:`conversiongraph` is used (serial)
+        chunksize : None or int
+            number of colors per chunk if ``workers > 1``
+        backend : None or str
+            ``"thread"``, ``"process"``, or ``"auto"`` (processes if
+            the conversion holds the GIL, e.g., into hex colors), see
+            :py:func:`conversiongraph.transform`
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import sRGB
+        >>> import numpy as np
+        >>> c = sRGB(*np.random.uniform(0, 1, (3, 10**6)))
+        >>> c.to("HCL", workers = 8)
+        >>> c.to("hex", workers = 8)
+        """
+        self._check_if_allowed_(to)
+        conversions.convert(self, to, fixup = fixup, workers = workers, chunksize = chunksize,
+                            backend = backend)
+
+    def as_(self, to, fixup = True, workers = None, chunksize = None, backend = None):
+        """as_(to, fixup = True, workers = None, chunksize = None, backend = None)
+
+        Returns the colors converted into a new color space, same as
+        :py:func:`to` but the object itself is not modified (also available
+        as ``converted``).
+
+        The new object is created directly from the converted coordinates
+        (see :py:func:`conversiongraph.converted`), there is no need to copy
+        the object first. Safe to be called by several threads on the
+        same object (e.g., a palette shared by a web server).
+
+        Parameters
+        ----------
+        to : str
+            name of the color space into which the colors should be
+            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
+        fixup : bool
+            whether or not colors outside the defined rgb color space
+            should be corrected if necessary
+        workers, chunksize : None or int
+            parallel execution in chunks, see :py:func:`to`
+        backend : None or str
+            parallel backend, see :py:func:`to`
+
+        Returns
+        -------
+        colorobject
+            Returns a new color object of the target color space.
 
-        Parameters
-        ----------
-        via : list of strings
-            the path via which the current color object should be transformed.
-            an example: a :py:class:`hexcols` object can be transformed into
-            CIEXYZ by specifying ``via = ["sRGB", "RGB", "CIEXYZ"]``
-        fixup : bool
-            whether or not to correct invalid rgb values outside ``[0.,1.]`` if
-            necessary
+        Examples
+        --------
+        >>> from colorspace.colorlib import HCL
+        >>> cols = HCL([260, 80, 30], [80, 0, 80], [30, 90, 30])
+        >>> cols.as_("hex")
+        >>> cols.converted("sRGB")
+        >>> cols
         """
-        for v in via:   self.to(v, fixup = fixup)
+        self._check_if_allowed_(to)
+        return conversions.converted(self, to, fixup = fixup, workers = workers,
+                                     chunksize = chunksize, backend = backend)
+
+    converted = as_
 
     def _colorobject_check_input_arrays_(self, **kwargs):
         """_colorobject_check_input_arrays_(**kwargs)
@@ -1784,7 +3509,7 @@ class colorobject(object):
         # Check if all do have the same length
         if not np.all([x == lengths[0] for x in lengths]):
             msg += "Arguments of different lengths: {:s}".format(
-                   ", ".join(["{:s} = {:d}".format(kwargs.keys()[i],lengths[i]) \
+                   ", ".join(["{:s} = {:d}".format(list(kwargs.keys())[i],lengths[i]) \
                     for i in range(0,len(kwargs))]))
             raise ValueError(msg)
 
@@ -1801,21 +3526,18 @@ class colorobject(object):
         bool
             Returns ``True`` if alpha values are present, ``False`` if not.
         """
-        if not "alpha" in self._data_.keys():
-            return False
-        elif self._data_["alpha"] is None:
-            return False
-        else:
-            return True
+        return not self._alpha_ is None
 
 
     def dropalpha(self):
         """dropalpha()
 
         Remove alpha information from the color object, if defined.
+        Clears the coordinates cached in other color spaces.
         """
         if self.hasalpha():
-            del self._data_["alpha"]
+            self._alpha_  = None
+            self._reprs_  = {}
 
         return
 
@@ -1840,9 +3562,7 @@ class colorobject(object):
         >>> cols.specplot()
         >>> cols.specplot(rgb = False)
         """
-        from copy import copy
-        cols = copy(self)
-        cols.to("hex")
+        cols = self.as_("hex")
 
         if isinstance(cols, colorobject):
             from .specplot import specplot
@@ -1899,19 +3619,17 @@ class colorobject(object):
         >>> cols.colors()
         """
 
-        from copy import copy
-        x = copy(self)
-        x.to("hex", fixup = fixup)
+        x = self.as_("hex", fixup = fixup)
         if x.hasalpha():
-            res = x.get("hex_")
-            # Appending alpha if alpha < 1.0
+            res = [str(h) for h in x.get("hex_")]
+            # Appending alpha if alpha < 1.0 (unless already given)
             for i in range(0, len(res)):
-                if self._data_["alpha"][i] < 1.0:
-                    res[i] += "{:02d}".format(int(self._data_["alpha"][i] * 100.))
+                if self._alpha_[i] < 1.0 and len(res[i]) == 7:
+                    res[i] += "{:02d}".format(int(self._alpha_[i] * 100.))
             # Return hex with alpha
             colors = res
         else:
-            colors = x.get("hex_")
+            colors = list(x.get("hex_"))
 
         if rev: colors.reverse()
         return [str(x) for x in colors]
@@ -1935,7 +3653,9 @@ class colorobject(object):
         dict or numpy.ndarray
             Either a dictionary or a single numpy.ndarray if input ``dimname``
             was not specified. If a specific dimension is requested bu the
-            dimension does not exist a ValueError is raised.
+            dimension does not exist a ValueError is raised. The arrays are
+            read-only views on the coordinates stored on the object (no copy),
+            use :py:func:`set` to modify the coordinates.
 
         Examples
         --------
@@ -1946,9 +3666,8 @@ class colorobject(object):
         """
 
         # Return all coordinates
-        from copy import copy
         if dimname is None:
-            return copy(self._data_)
+            return self._data_
         # No string?
         elif not isinstance(dimname, str):
             raise ValueError("input dimname to {:s} ".format(self.__class__.__name__) + \
@@ -1961,7 +3680,7 @@ class colorobject(object):
                 return None
             else:
                 raise ValueError("{:s} has no dimension {:s}".format(self.__class__.__name__, dimname))
-        return copy(self._data_[dimname])
+        return self._data_[dimname]
 
     def set(self, **kwargs):
         """set(kwargs)
@@ -1973,7 +3692,9 @@ class colorobject(object):
         The dimension has to exist, and the new data have to be of the same
         type and of the same length to be accepted.
 
-        No return, modifies the current object.
+        No return, modifies the current object. Coordinates shared with
+        copies of the object are copied first (copy-on-write), the
+        coordinates cached in other color spaces are cleared.
 
         Parameters
         ----------
@@ -1991,6 +3712,7 @@ class colorobject(object):
         >>> print cols
         """
         # Looping over inputs
+        self._reprs_ = {}
         for key,vals in kwargs.items():
             key.upper()
             # Return all coordinates
@@ -2009,7 +3731,16 @@ class colorobject(object):
             if not len(vals) == n:
                 raise ValueError("number of values to be stored on the object " + \
                     "{:s} have to match the current dimension".format(self.__class__.__name__))
-            self._data_[key] = vals
+            if key == "alpha":
+                self._alpha_ = vals
+            elif len(self._dims_) == 1:
+                self._coords_ = vals
+            else:
+                # Copy-on-write: coordinates shared with a copy of the object
+                if self._shared_ or not self._coords_.flags.writeable:
+                    self._coords_ = self._coords_.copy()
+                    self._shared_ = False
+                self._coords_[:,self._dims_.index(key)] = vals
 
 
     def _cannot(self, from_, to):
@@ -2050,7 +3781,7 @@ class colorobject(object):
 # PolarLUV or HCL object
 # -------------------------------------------------------------------
 class polarLUV(colorobject):
-    """polarLUV(H, C, L, alpha = None)
+    """polarLUV(H, C, L, alpha = None, dtype = None)
     
     polarLUV or HCL color object. The polar representation of the CIELUV
     (:class:`colorspace.CIELUV`) color space is also known as
@@ -2070,7 +3801,10 @@ class polarLUV(colorobject):
         single value or vector of numerics in ``[0.,1.]`` for the alpha channel
         (``0.`` means transparent, ``1.`` opaque). If ``None`` no
         transparency is added
-        
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
@@ -2088,77 +3822,17 @@ class polarLUV(colorobject):
         whitepoint.
     """
 
-    def __init__(self, H, C, L, alpha = None):
+    __slots__ = ()
+
+    def __init__(self, H, C, L, alpha = None, dtype = None):
 
         # Checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
+        if not dtype is None: self.set_dtype(dtype)
         tmp = self._colorobject_check_input_arrays_(H = H, C = C, L = L, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = tmp
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
-
-        Transforms the colors into a new color space, if possible.
-
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
-
-        Parameters
-        ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary
-        """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to in ["HCL", self.__class__.__name__]:
-            return
-
-        # This is the only transformation from polarLUV -> LUV
-        elif to == "CIELUV":
-            [L, U, V] = clib.polarLUV_to_LUV(self.get("L"), self.get("C"), self.get("H"))
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = CIELUV
-
-        # The rest are transformations along a path
-        elif to == "CIEXYZ":
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "CIELAB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIELUV", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIELUV", "CIEXYZ", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
-
 # polarLUV is HCL, make copy
 HCL = polarLUV
 
@@ -2167,7 +3841,7 @@ HCL = polarLUV
 # CIELUV color object
 # -------------------------------------------------------------------
 class CIELUV(colorobject):
-    """CIELUV(L, U, V, alpha = None)
+    """CIELUV(L, U, V, alpha = None, dtype = None)
     
     CIELUV color object.
 
@@ -2186,6 +3860,10 @@ class CIELUV(colorobject):
         single value or vector of numerics in ``[0.,1.]`` for the alpha channel
         (``0.`` means transparent, ``1.`` opaque). If ``None`` no
         transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
@@ -2200,85 +3878,23 @@ class CIELUV(colorobject):
         provides some methods to e.g., extract color or to modify the
         whitepoint.
     """
-    def __init__(self, L, U, V, alpha = None):
+
+    __slots__ = ()
+    def __init__(self, L, U, V, alpha = None, dtype = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
+        if not dtype is None: self.set_dtype(dtype)
         tmp = self._colorobject_check_input_arrays_(L = L, U = U, V = V, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = tmp
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
-
-        Transforms the colors into a new color space, if possible.
-
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
-
-        Parameters
-        ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary
-        """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-        # Transformation from CIELUV -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LUV_to_XYZ(self.get("L"), self.get("U"), self.get("V"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
-
-        # Transformation from CIELUV -> polarLUV (HCL)
-        elif to in ["HCL","polarLUV"]:
-            [L, C, H] = clib.LUV_to_polarLUV(self.get("L"), self.get("U"), self.get("V"))
-            self._data_ = {"L" : L, "C" : C, "H" : H, "alpha" : self.get("alpha")}
-            self.__class__ = polarLUV
-
-        # The rest are transformations along a path
-        elif to == "CIELAB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
-
 # -------------------------------------------------------------------
 # CIEXYZ color object
 # -------------------------------------------------------------------
 class CIEXYZ(colorobject):
-    """CIEXYZ(X, Y, Z, alpha = None)
+    """CIEXYZ(X, Y, Z, alpha = None, dtype = None)
     
     CIEXYZ color object.
 
@@ -2299,6 +3915,10 @@ class CIEXYZ(colorobject):
         single value or vector of numerics in ``[0.,1.]`` for the alpha channel
         (``0.`` means transparent, ``1.`` opaque). If ``None`` no
         transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
@@ -2314,118 +3934,262 @@ class CIEXYZ(colorobject):
         whitepoint.
     """
 
-    def __init__(self, X, Y, Z, alpha = None):
+    __slots__ = ()
+
+    def __init__(self, X, Y, Z, alpha = None, dtype = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
+        if not dtype is None: self.set_dtype(dtype)
         tmp = self._colorobject_check_input_arrays_(X = X, Y = Y, Z = Z, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = tmp
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
+class RGB(colorobject):
+    """RGB(R, G, B, alpha = None, dtype = None)
 
-        Transforms the colors into a new color space, if possible.
+    Device independent RGB color object.
 
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
+    :py:class:`CIELAB`, :py:class:`sRGB`, :py:class:`HSV`, :py:class:`HLS`,
+    :py:class:`polarLUV`, :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).
+    Allows additional alpha input. Note that the alpha channel will not be
+    modified but preserved.
 
-        Parameters
-        ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary
-        """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
+    Parameters
+    ----------
+    R : numeric
+        intensity of red ``[0.,1.]``
+    G : numeric
+        intensity of green ``[0.,1.]``
+    B : numeric
+        intensity of blue ``[0.,1.]``
+    alpha : None or numeric
+        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
+        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
+        transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
+
+    Examples
+    --------
+    >>> from colorspace.colorlib import sRGB
+    >>> c = sRGB(1., 0.3, 0.5)
+    >>> c = sRGB([1.,0.8], [0.5,0.5], [0.0,0.2])
+    >>> 
+    >>> from numpy import asarray
+    >>> c = sRGB(asarray([1.,0.8]), asarray([0.5,0.5]), asarray([0.0,0.2]))
+
+    .. seealso::
+        This object extens the :py:class:`colorlib.colorobject` which
+        provides some methods to e.g., extract color or to modify the
+        whitepoint.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, R, G, B, alpha = None, dtype = None):
+
+        # checking inputs, save inputs on object
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
+        self._data_ = tmp
+        # White spot definition (the default)
+        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+
+
+class sRGB(colorobject):
+    """sRGB(R, G, B, alpha = None, gamma = None, dtype = None)
+    
+    sRGB (device dependent RGB) color object.
+
+    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
+    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`HSV`, :py:class:`HLS`,
+    :py:class:`polarLUV`, :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).
+    Allows additional alpha input. Note that the alpha channel will not be
+    modified but preserved.  R, G, and B have to be within ``[0., 1.]``.
 
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
+    Parameters
+    ----------
+    R : float, list of floats, numpy.ndarray
+        intensity of red ``[0.,1.]``
+    G : float, list of floats, numpy.ndarray
+        intensity of green ``[0.,1]``
+    B : float, list of floats, numpy.ndarray
+        intensity of blue ``[0.,1]``
+    alpha : None or numeric
+        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
+        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
+        transparency is added
+    gamma : None, float
+        gamma parameter. Used to convert from device dependent sRGB
+        to RGB. If not set the default of 2.4 is used
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
-        # Transformation from CIEXYZ -> CIELUV
-        elif to == "CIELUV":
-            [L, U, V] = clib.XYZ_to_LUV(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = CIELUV
+    Examples
+    --------
+    >>> from colorspace.colorlib import sRGB
+    >>> c = sRGB(1., 0.3, 0.5)
+    >>> c = sRGB([1.,0.8], [0.5,0.5], [0.0,0.2])
+    >>> 
+    >>> from numpy import asarray
+    >>> c = sRGB(asarray([1.,0.8]), asarray([0.5,0.5]), asarray([0.0,0.2]))
 
-        # Transformation from CIEXYZ -> CIELAB
-        elif to == "CIELAB":
-            [L, A, B] = clib.XYZ_to_LAB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = CIELAB
+    .. seealso::
+        This object extens the :py:class:`colorlib.colorobject` which
+        provides some methods to e.g., extract color or to modify the
+        whitepoint.
+    """
 
-        # Transformation from CIEXYZ -> RGB
-        elif to == "RGB":
-            [R, G, B] = clib.XYZ_to_RGB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
+    __slots__ = ()
 
-        # The rest are transformations along a path
-        elif to == "polarLAB":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def __init__(self, R, G, B, alpha = None, gamma = None, dtype = None):
 
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
+        # checking inputs, save inputs on object
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
+        self._data_ = tmp
+        # White spot definition (the default)
+        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
-        elif to == "sRGB":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        if isinstance(gamma, float): self.GAMMA = gamma
 
-        elif to == "hex":
-            via = ["RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
 
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
+class CIELAB(colorobject):
+    """CIELAB(L, A, B, alpha = None, dtype = None)
+    
+    CIELAB color object.
 
-        else: self._cannot(self.__class__.__name__, to)
+    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
+    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`polarLUV`,
+    :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).  Not possible are
+    conversions to (ambiguous): :py:class:`HSV`, :py:class:`HLS`.
 
+    Parameters
+    ----------
+    L : numeric
+        single value or multiple values for L dimension
+    A : numeric
+        single value or multiple values for A dimension
+    B : numeric
+        single value or multiple values for B dimension
+    alpha : None or numeric
+        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
+        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
+        transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
-class RGB(colorobject):
-    """RGB(R, G, B, alpha = None)
+    Examples
+    --------
+    >>> from colorspace.colorlib import CIELAB
+    >>> c = CIELAB(-30, 10, 10)
+    >>> c = CIELAB([-30, 30], [20, 80], [40, 40])
+    >>> from numpy import asarray
+    >>> c = CIELAB(asarray([-30, 30]), asarray([20, 80]), asarray([40, 40]))
 
-    Device independent RGB color object.
+    .. seealso::
+        This object extens the :py:class:`colorlib.colorobject` which
+        provides some methods to e.g., extract color or to modify the
+        whitepoint.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, L, A, B, alpha = None, dtype = None):
+
+        # checking inputs, save inputs on object
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
+        self._data_ = tmp
+        # White spot definition (the default)
+        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+
+
+class polarLAB(colorobject):
+    """polarLAB(L, A, B, alpha = None, dtype = None)
+    
+    polarLAB color object.
 
     Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
-    :py:class:`CIELAB`, :py:class:`sRGB`, :py:class:`HSV`, :py:class:`HLS`,
-    :py:class:`polarLUV`, :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).
-    Allows additional alpha input. Note that the alpha channel will not be
-    modified but preserved.
+    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`polarLUV`,
+    :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).  Not possible are
+    conversions to (ambiguous): :py:class:`HSV`, :py:class:`HLS`.
 
     Parameters
     ----------
-    R : numeric
-        intensity of red ``[0.,1.]``
-    G : numeric
-        intensity of green ``[0.,1.]``
+    L : numeric
+        single value or multiple values for L dimension
+    A : numeric
+        single value or multiple values for A dimension
     B : numeric
-        intensity of blue ``[0.,1.]``
+        single value or multiple values for B dimension
+    alpha : None or numeric
+        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
+        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
+        transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
+
+    .. seealso::
+        This object extens the :py:class:`colorlib.colorobject` which
+        provides some methods to e.g., extract color or to modify the
+        whitepoint.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, L, A, B, alpha = None, dtype = None):
+
+        # checking inputs, save inputs on object
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
+        self._data_ = tmp
+        # White spot definition (the default)
+        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+
+
+class HSV(colorobject):
+    """HSV(H, S, V, alpha = None, dtype = None)
+    
+    HSV (Hue-Saturation-Value) color object.
+
+    Allowes conversions to: :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`,
+    and `"hex"` (:py:class:`hexcols`).  Not possible are conversions to
+    (ambiguous): :py:class:`CIEXYZ`, :py:class:`CIELUV`, :py:class:`CIELAB`,
+    :py:class:`polarLUV`, :py:class:`polarLAB`,
+
+    Parameters
+    ----------
+    H : numeric
+        single value or multiple values for the hue dimension
+    S : numeric
+        single value or multiple values for the saturation dimension
+    V : numeric
+        single value or multiple values for the value dimension
     alpha : None or numeric
         single value or vector of numerics in ``[0.,1.]`` for the alpha channel
         (``0.`` means transparent, ``1.`` opaque). If ``None`` no
         transparency is added
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
-    >>> from colorspace.colorlib import sRGB
-    >>> c = sRGB(1., 0.3, 0.5)
-    >>> c = sRGB([1.,0.8], [0.5,0.5], [0.0,0.2])
-    >>> 
-    >>> from numpy import asarray
-    >>> c = sRGB(asarray([1.,0.8]), asarray([0.5,0.5]), asarray([0.0,0.2]))
+    >>> from colorspace.colorlib import HSV
+    >>> cols = HSV([150, 150, 10], [1.5, 0, 1.5], [0.1, 0.7, 0.1])
 
     .. seealso::
         This object extens the :py:class:`colorlib.colorobject` which
@@ -2433,124 +4197,49 @@ class RGB(colorobject):
         whitepoint.
     """
 
-    def __init__(self, R, G, B, alpha = None):
+    __slots__ = ()
 
-        # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
+    def __init__(self, H, S, V, alpha = None, dtype = None):
 
-        tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        # checking inputs, save inputs on object
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(H = H, S = S, V = V, alpha = alpha)
+        self._data_ = tmp
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
-
-        Transforms the colors into a new color space, if possible.
-
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
-
-        Parameters
-        ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary.
-        """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transform from RGB -> HLS
-        elif to == "HLS":
-            [H, L, S] = clib.RGB_to_HLS(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self.get("alpha")}
-            self.__class__ = HLS
-
-        # Transform from RGB -> HSV
-        elif to == "HSV":
-            [H, S, V] = clib.RGB_to_HSV(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = HSV
-
-        # Transform from RGB -> sRGB
-        elif to == "sRGB":
-            [R, G, B] = clib.RGB_to_DEVRGB(self.get("R"), self.get("G"), self.get("B"),
-                                           self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = sRGB
-
-        # Transform from RGB -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.RGB_to_XYZ(self.get("R"), self.get("G"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
-
-        # The rest are transformations along a path
-        elif to in ["CIELUV", "CIELAB"]: 
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        else: self._cannot(self.__class__.__name__, to)
-
-
-class sRGB(colorobject):
-    """sRGB(R, G, B, alpha = None, gamma = None)
+class HLS(colorobject):
+    """HLS(H, L, S, alpha = None, dtype = None)
     
-    sRGB (device dependent RGB) color object.
+    HLS (Hue-Lightness-Saturation) color space.
 
-    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
-    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`HSV`, :py:class:`HLS`,
-    :py:class:`polarLUV`, :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).
-    Allows additional alpha input. Note that the alpha channel will not be
-    modified but preserved.  R, G, and B have to be within ``[0., 1.]``.
+    Allowes conversions to: :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`,
+    and `"hex"` (:py:class:`hexcols`).  Not possible are conversions to
+    (ambiguous): :py:class:`CIEXYZ`, :py:class:`CIELUV`, :py:class:`CIELAB`,
+    :py:class:`polarLUV`, :py:class:`polarLAB`,
 
     Parameters
     ----------
-    R : float, list of floats, numpy.ndarray
-        intensity of red ``[0.,1.]``
-    G : float, list of floats, numpy.ndarray
-        intensity of green ``[0.,1]``
-    B : float, list of floats, numpy.ndarray
-        intensity of blue ``[0.,1]``
+    H : numeric
+        single value or multiple values for the hue dimension
+    L : numeric
+        single value or multiple values for the lightness dimension
+    S : numeric
+        single value or multiple values for the saturation dimension
     alpha : None or numeric
         single value or vector of numerics in ``[0.,1.]`` for the alpha channel
         (``0.`` means transparent, ``1.`` opaque). If ``None`` no
         transparency is added
-    gamma : None, float
-        gamma parameter. Used to convert from device dependent sRGB
-        to RGB. If not set the default of 2.4 is used
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
-    >>> from colorspace.colorlib import sRGB
-    >>> c = sRGB(1., 0.3, 0.5)
-    >>> c = sRGB([1.,0.8], [0.5,0.5], [0.0,0.2])
-    >>> 
-    >>> from numpy import asarray
-    >>> c = sRGB(asarray([1.,0.8]), asarray([0.5,0.5]), asarray([0.0,0.2]))
+    >>> from colorspace.colorlib import HLS
+    >>> cols = HLS([150, 0, 10], [0.1, 0.7, 0.1], [3, 0, 3])
 
     .. seealso::
         This object extens the :py:class:`colorlib.colorobject` which
@@ -2558,107 +4247,51 @@ class sRGB(colorobject):
         whitepoint.
     """
 
-    def __init__(self, R, G, B, alpha = None, gamma = None):
+    __slots__ = ()
+
+    def __init__(self, H, L, S, alpha = None, dtype = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(H = H, L = L, S = S, alpha = None)
+        self._data_ = tmp
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
-        if isinstance(gamma, float): self.GAMMA = gamma
-
-
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
-
-        Transforms the colors into a new color space, if possible.
-
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
-
-        Parameters
-        ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary.
-        """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transformation sRGB -> RGB
-        elif to == "RGB":
-            [R, G, B] = clib.DEVRGB_to_RGB(self.get("R"), self.get("G"), self.get("B"),
-                                           gamma = self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
 
-        # Transformation sRGB -> hex
-        elif to == "hex":
-            hex_ = clib.sRGB_to_hex(self.get("R"), self.get("G"), self.get("B"), fixup)
-            self._data_ = {"hex_" : hex_, "alpha" : self.get("alpha")}
-            self.__class__ = hexcols
-
-        # The rest are transformations along a path
-        elif to in ["HSV", "HLS", "CIEXYZ"]:
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["RGB", "CIEXYZ", "CIELAB", to] 
-            self._transform_via_path_(via, fixup = fixup)
-
-        else: self._cannot(self.__class__.__name__, to)
-
-
-class CIELAB(colorobject):
-    """CIELAB(L, A, B, alpha = None)
+class hexcols(colorobject):
+    """hexcols(hex_, dtype = None)
     
-    CIELAB color object.
+    Color object for hex colors.
 
-    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
-    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`polarLUV`,
-    :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).  Not possible are
-    conversions to (ambiguous): :py:class:`HSV`, :py:class:`HLS`.
+    Takes up a set of hex colors. Can be converted to all other color spaces
+    including :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`, and `"hex"`
+    (:py:class:`hexcols`), :py:class:`CIEXYZ`, :py:class:`CIELUV`,
+    :py:class:`CIELAB`, :py:class:`polarLUV`, :py:class:`polarLAB`,
 
     Parameters
     ----------
-    L : numeric
-        single value or multiple values for L dimension
-    A : numeric
-        single value or multiple values for A dimension
-    B : numeric
-        single value or multiple values for B dimension
-    alpha : None or numeric
-        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
-        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
-        transparency is added
+    hex_ : str, list of str, or numpy.ndarray of type str
+        hex colors. Only six and eight digit hex colors are allowed (e.g.,
+        ``#000000`` or ``#00000050`` if with alpha value). If invalid hex
+        colors are provided the object will raise a ValueError.  Input can be a
+        single string, a list of strings, or a `numpy.ndarray` containing a set
+        of hex colors. Invalid hex colors will be handled as `numpy.nan`, alpha
+        values can be provided but will be ignored
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the coordinates and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
 
     Examples
     --------
-    >>> from colorspace.colorlib import CIELAB
-    >>> c = CIELAB(-30, 10, 10)
-    >>> c = CIELAB([-30, 30], [20, 80], [40, 40])
+    >>> from colorspace.colorlib import hexcols
+    >>> c = hexcols("#cecece")
+    >>> c = hexcols(["#ff0000", "#00ff00"])
     >>> from numpy import asarray
-    >>> c = CIELAB(asarray([-30, 30]), asarray([20, 80]), asarray([40, 40]))
+    >>> c = hexcols(asarray(["#ff000030", "#00ff0030"], dtype = "|S9"))
+    >>> #Convert hex colors to another color space (CIEXYZ for example):
+    >>> c.to("CIEXYZ")
 
     .. seealso::
         This object extens the :py:class:`colorlib.colorobject` which
@@ -2666,104 +4299,302 @@ class CIELAB(colorobject):
         whitepoint.
     """
 
-    def __init__(self, L, A, B, alpha = None):
+    __slots__ = ()
 
+    def __init__(self, hex_, dtype = None):
+
+        if isinstance(hex_,str): hex_ = np.asarray([hex_])
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        if not dtype is None: self.set_dtype(dtype)
+        tmp = self._colorobject_check_input_arrays_(hex_ = hex_)
+
+        # Checking for valid hex colors and alpha values
+        self._data_ = self._check_hex_(tmp["hex_"])
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
+    def _check_hex_(self, hex_):
+        """_check_hex_(hex_)
 
-        Transforms the colors into a new color space, if possible.
+        Checking hex colors for validity. Only 6 and 8 digit
+        hex colors with or without alpha (e.g., "#000000", "#00000050")
+        are allowed. The method raises a ValueError if invalid hex colors
+        are found.
 
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+        Parameters
+        ----------
+        hex_ : numpy.ndarray
+            (hopefully) valid hex colors, unicode or byte strings
+
+        Returns
+        -------
+        dict
+            Returns a dict with two elements named hex_ and alpha. The hex_
+            element contains the hex strings (unicode), the alpha element
+            an array of the same length with alpha values (only if at least
+            one color has an alpha value). For all hex colors with no alpha
+            an alpha value of ``1.0`` is set.
+        """
+
+        [codes, alpha, nan] = _decode_hex_(hex_)
+        if not np.all((codes[:,0] >= 0) | nan):
+            raise ValueError("invalid hex colors provided while " + \
+                    "initializing class {:s}".format(self.__class__.__name__))
+
+        if hex_.dtype.kind == "S": hex_ = hex_.astype("U")
+        # No colors with alpha
+        if np.all(np.isnan(alpha)):
+            return {"hex_": hex_}
+        # Else extracting alpha colors
+        else:
+            return {"hex_": hex_, "alpha": np.where(np.isnan(alpha), 1., alpha)}
+
+    @classmethod
+    def from_iter(cls, iterable, chunksize = 65536, to = None, fixup = True, dtype = None):
+        """from_iter(iterable, chunksize = 65536, to = None, fixup = True, dtype = None)
+
+        Creates a color object from an iterable of hex colors (e.g., a
+        generator) without creating a list of all colors first.
+
+        The colors are taken from the iterable and validated in chunks of
+        ``chunksize`` colors. If ``to`` is ``None`` the chunks are copied
+        into preallocated arrays (grown if needed) and one
+        :py:class:`hexcols` object is returned. Else a generator is returned
+        which yields one color object per chunk, converted into the color
+        space ``to`` (see :py:func:`colorobject.to`): only one chunk is held
+        in memory at a time.
 
         Parameters
         ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
+        iterable : iterable
+            hex colors (str or bytes), see :py:class:`hexcols`. Raises a
+            ValueError if invalid hex colors are found
+        chunksize : int
+            number of colors per chunk
+        to : None or str
+            name of the color space the chunks are converted into
+            (e.g., ``"HCL"``), see above
         fixup : bool
             whether or not colors outside the defined rgb color space
-            should be corrected if necessary
+            should be corrected if necessary, used if ``to`` is set
+        dtype : None or str
+            floating point precision, see :py:class:`hexcols`
+
+        Returns
+        -------
+        hexcols or generator
+            Returns a new :py:class:`hexcols` object or, if ``to`` is set,
+            a generator of color objects.
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import hexcols
+        >>> c = hexcols.from_iter(x.strip() for x in open("colors.txt"))
+        >>> for hcl in hexcols.from_iter(x.strip() for x in open("colors.txt"), to = "HCL"):
+        >>>     print(hcl.get("L").mean())
         """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
+        from itertools import islice
+        if int(chunksize) < 1:
+            raise ValueError("chunksize has to be a positive integer")
 
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
+        def chunks():
+            it = iter(iterable)
+            while True:
+                x = list(islice(it, int(chunksize)))
+                if len(x) == 0: break
+                yield np.asarray(x)
 
-        # Transformations CIELAB -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LAB_to_XYZ(self.get("L"), self.get("A"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
+        return cls._from_chunks_(chunks(), to, fixup, dtype)
 
-        # Transformation CIELAB -> polarLAB
-        elif to == "polarLAB":
-            [L, A, B] = clib.LAB_to_polarLAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = polarLAB
+    @classmethod
+    def from_file(cls, path, chunksize = 65536, to = None, fixup = True, dtype = None):
+        """from_file(path, chunksize = 65536, to = None, fixup = True, dtype = None)
 
-        # The rest are transformations along a path
-        elif to == "CIELUV":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Creates a color object from a (large) file of hex colors separated
+        by white space or commas (e.g., one color per line).
 
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
+        The file is read in blocks and split into chunks of ``chunksize``
+        colors without reading the whole file or creating a list of all
+        colors, see :py:func:`from_iter` (the arrays are preallocated
+        based on the size of the file).
 
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Parameters
+        ----------
+        path : str or file
+            name of the file or a file object opened for reading
+        chunksize : int
+            number of colors per chunk
+        to : None or str
+            name of the color space the chunks are converted into
+            (e.g., ``"HCL"``), see :py:func:`from_iter`
+        fixup : bool
+            whether or not colors outside the defined rgb color space
+            should be corrected if necessary, used if ``to`` is set
+        dtype : None or str
+            floating point precision, see :py:class:`hexcols`
 
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Returns
+        -------
+        hexcols or generator
+            Returns a new :py:class:`hexcols` object or, if ``to`` is set,
+            a generator of color objects.
 
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Examples
+        --------
+        >>> from colorspace.colorlib import hexcols
+        >>> c = hexcols.from_file("colors.txt")
+        >>> for hcl in hexcols.from_file("colors.txt", chunksize = 10**6, to = "HCL"):
+        >>>     print(hcl.get("L").mean())
+        """
+        import os
+        if int(chunksize) < 1:
+            raise ValueError("chunksize has to be a positive integer")
 
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
+        # Seven characters and a separator per color
+        n = os.path.getsize(path) // 8 + 1 if isinstance(path, str) else None
 
-        else: self._cannot(self.__class__.__name__, to)
+        def chunks():
+            fid = open(path, "rb") if isinstance(path, str) else path
+            try:
+                for x in _read_hex_tokens_(fid, int(chunksize)): yield x
+            finally:
+                if isinstance(path, str): fid.close()
 
+        return cls._from_chunks_(chunks(), to, fixup, dtype, n)
 
-class polarLAB(colorobject):
-    """polarLAB(L, A, B, alpha = None)
-    
-    polarLAB color object.
+    @classmethod
+    def _from_chunks_(cls, chunks, to, fixup, dtype, n = None):
+        """_from_chunks_(chunks, to, fixup, dtype, n = None)
 
-    Allowes conversions to: :py:class:`CIEXYZ`, :py:class:`CIELUV`,
-    :py:class:`CIELAB`, :py:class:`RGB`, :py:class:`polarLUV`,
-    :py:class:`polarLAB`, `"hex"` (:py:class:`hexcols`).  Not possible are
-    conversions to (ambiguous): :py:class:`HSV`, :py:class:`HLS`.
+        Validates chunks of hex colors (arrays of str or bytes) and creates
+        one :py:class:`hexcols` object (``to = None``, arrays preallocated
+        for ``n`` colors if set) or a generator of converted color objects,
+        see :py:func:`from_iter`.
+        """
+        def create(hex_, alpha):
+            obj = cls.__new__(cls)
+            if not dtype is None: obj.set_dtype(dtype)
+            obj._data_ = {"hex_": hex_} if np.all(np.isnan(alpha)) else \
+                         {"hex_": hex_, "alpha": np.where(np.isnan(alpha), 1., alpha)}
+            obj.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+            return obj
+
+        def parse(offset, hex_):
+            [codes, alpha, nan] = _decode_hex_(hex_)
+            bad = np.where((codes[:,0] < 0) & ~nan)[0]
+            if len(bad) > 0:
+                x = hex_[bad[0]]
+                raise ValueError("invalid hex color \"{:s}\" (color {:d}) provided while ".format(
+                        x.decode("ascii", "replace") if isinstance(x, bytes) else str(x),
+                        offset + bad[0] + 1) + \
+                        "initializing class {:s}".format(cls.__name__))
+            return [hex_.astype("U") if hex_.dtype.kind == "S" else hex_, alpha]
+
+        def converted():
+            offset = 0
+            for x in chunks:
+                [hex_, alpha] = parse(offset, x)
+                offset += len(hex_)
+                obj = create(hex_, alpha)
+                obj.to(to, fixup = fixup)
+                yield obj
+
+        if not to is None:
+            if not to in conversions.spaces():
+                raise ValueError("color space \"{:s}\" is unknown".format(str(to)))
+            return converted()
+
+        # Preallocated arrays, doubled if needed
+        size  = max(1, 1024 if n is None else int(n))
+        hex_  = np.empty(size, dtype = "U9")
+        alpha = np.empty(size, dtype = "float")
+        count = 0; width = 1
+        for x in chunks:
+            [h, a] = parse(count, x)
+            if count + len(h) > len(hex_):
+                size  = max(2 * len(hex_), count + len(h))
+                hex_  = np.concatenate([hex_[:count], np.empty(size - count, dtype = hex_.dtype)])
+                alpha = np.concatenate([alpha[:count], np.empty(size - count, dtype = alpha.dtype)])
+            hex_[count:count + len(h)]  = h
+            alpha[count:count + len(h)] = a
+            width  = max(width, h.dtype.itemsize // 4)
+            count += len(h)
+        return create(hex_[:count].astype("U{:d}".format(width)), alpha[:count])
+
+
+def _read_hex_tokens_(fid, chunksize, blocksize = 2**20):
+    """_read_hex_tokens_(fid, chunksize, blocksize = 2**20)
+
+    Reads a file of hex colors separated by white space or commas in
+    blocks of ``blocksize`` bytes, see :py:func:`hexcols.from_file`.
+
+    Returns
+    -------
+    generator
+        Yields byte string arrays of ``chunksize`` colors (the last
+        one may be shorter).
+    """
+    rest = b""; tokens = []
+    while True:
+        block = fid.read(blocksize)
+        if isinstance(block, str): block = block.encode("ascii", "replace")
+        if len(block) == 0: break
+        block = (rest + block).replace(b",", b" ")
+        x     = block.split()
+        # The last color may continue in the next block
+        rest  = x.pop() if len(x) > 0 and not block[-1:].isspace() else b""
+        tokens.extend(x)
+        while len(tokens) >= chunksize:
+            yield np.asarray(tokens[:chunksize]); del tokens[:chunksize]
+    if len(rest) > 0: tokens.append(rest)
+    while len(tokens) > 0:
+        yield np.asarray(tokens[:chunksize]); del tokens[:chunksize]
+
+
+
+class packedRGBA(colorobject):
+    """packedRGBA(rgba, alpha = None, dtype = None)
+
+    Color object for 8-bit colors packed into 32-bit integers.
+
+    Each color is stored as one ``uint32`` ``0xRRGGBBAA`` (red in the most,
+    alpha in the least significant byte): four bytes per color, and
+    comparing, hashing, sorting, or deduplicating colors (e.g.,
+    ``numpy.unique``) works on integers. Can be converted to all other
+    color spaces, conversions from and to :py:class:`sRGB`,
+    :py:class:`RGB`, `"hex"` (:py:class:`hexcols`), and ``uint8``
+    images (:py:func:`from_image`, :py:func:`to_image`) are bit operations.
+
+    The alpha bytes are the alpha channel of the object: if any
+    alpha byte differs from ``255`` (opaque) the object has alpha values
+    (see :py:func:`colorobject.hasalpha`), and alpha values set on the object
+    are stored in the alpha bytes. Invalid colors (``nan``, e.g.,
+    from :py:class:`hexcols` or converted with ``fixup = False``) cannot
+    be represented and are stored as transparent black (``0x00000000``).
 
     Parameters
     ----------
-    L : numeric
-        single value or multiple values for L dimension
-    A : numeric
-        single value or multiple values for A dimension
-    B : numeric
-        single value or multiple values for B dimension
+    rgba : int, list of int, or numpy.ndarray
+        packed colors, integers in ``[0, 2**32 - 1]``
     alpha : None or numeric
-        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
-        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
-        transparency is added
+        single value or vector of numerics in ``[0.,1.]`` for the alpha
+        channel, replaces the alpha bytes of ``rgba``. If ``None`` the
+        alpha bytes are used
+    dtype : None or str
+        floating point precision (``"float32"`` or ``"float64"``) used
+        to store the alpha values and to convert the colors. If ``None``
+        the default is used (see :py:func:`colorobject.set_dtype`)
+
+    Examples
+    --------
+    >>> from colorspace.colorlib import packedRGBA, hexcols
+    >>> c = packedRGBA([0xFF0000FF, 0x00FF0080])
+    >>> c.to("hex")
+    >>> c = hexcols(["#ff0000", "#00ff00", "#ff0000"])
+    >>> c.to("packedRGBA")
+    >>> import numpy as np
+    >>> np.unique(c.get("rgba"))
 
     .. seealso::
         This object extens the :py:class:`colorlib.colorobject` which
@@ -2771,424 +4602,1257 @@ class polarLAB(colorobject):
         whitepoint.
     """
 
-    def __init__(self, L, A, B, alpha = None):
+    __slots__ = ()
+
+    def __init__(self, rgba, alpha = None, dtype = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        if not dtype is None: self.set_dtype(dtype)
+        tmp  = self._colorobject_check_input_arrays_(rgba = rgba, alpha = alpha)
+        rgba = tmp["rgba"]
+        if not np.issubdtype(rgba.dtype, np.integer) or \
+           (rgba.size > 0 and (np.min(rgba) < 0 or np.max(rgba) > 2**32 - 1)):
+            raise ValueError("input rgba to class {:s} has to ".format(self.__class__.__name__) + \
+                    "contain integers in [0, 2**32 - 1]")
+        self._set_coords_(["rgba"], [rgba], tmp.get("alpha"))
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
+    @classmethod
+    def from_image(cls, img):
+        """from_image(img)
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
-
-        Transforms the colors into a new color space, if possible.
-
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+        Creates a color object from the pixels of an ``uint8`` image
+        (row by row), see :py:func:`colorlib.image_to_packed`.
 
         Parameters
         ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary.
+        img : numpy.ndarray
+            ``uint8`` image of shape ``(height, width, 3)`` or
+            ``(height, width, 4)`` (with alpha channel)
+
+        Returns
+        -------
+        packedRGBA
+            Returns a new :py:class:`packedRGBA` object.
         """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
+        return cls(colorlib().image_to_packed(img).reshape(-1))
+
+    def to_image(self, shape):
+        """to_image(shape)
+
+        Returns the colors as ``uint8`` image, see
+        :py:func:`colorlib.packed_to_image`.
 
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
+        Parameters
+        ----------
+        shape : tuple
+            ``(height, width)`` of the image, ``height * width`` has
+            to match the number of colors
 
-        # The only transformation we need is from polarLAB -> LAB
-        elif to == "CIELAB":
-            [L, A, B] = clib.polarLAB_to_LAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = CIELAB
+        Returns
+        -------
+        numpy.ndarray
+            Returns an ``uint8`` array of shape ``(height, width, 4)``.
+        """
+        return colorlib().packed_to_image(self._coords_.reshape(shape))
 
-        # The rest are transformationas along a path
-        elif to == "CIEXYZ":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def _set_coords_(self, dims, cols, alpha = None, adopt = False):
+        """_set_coords_(dims, cols, alpha = None, adopt = False)
 
-        elif to == "CIELUV":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Stores the packed colors (see :py:func:`colorobject._set_coords_`):
+        ``alpha`` is written into the alpha bytes or, if ``None``, taken
+        from the alpha bytes. If ``adopt = True`` (results of conversions)
+        invalid colors (``0``) stay transparent black, alpha is set to ``0``.
+        """
+        rgba = np.asarray(cols[0]).astype("uint32", copy = not adopt)
+        if alpha is None:
+            bytes_ = rgba & np.uint32(255)
+            if not np.all(bytes_ == 255): alpha = bytes_ / 255.
+        else:
+            alpha = np.asarray(alpha, dtype = self.DTYPE)
+            valid = rgba != 0 if adopt else np.ones(rgba.shape, dtype = bool)
+            alpha = np.where(valid, alpha, 0.).astype(self.DTYPE)
+            rgba &= np.uint32(0xFFFFFF00)
+            rgba |= np.where(valid, (np.clip(alpha, 0., 1.) * 255. + .5), 0.).astype("uint32")
+        colorobject._set_coords_(self, dims, [rgba], alpha)
 
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELAB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def set(self, **kwargs):
+        """set(kwargs)
 
-        elif to == "RGB":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Allows to manipulate the current colors, see :py:func:`colorobject.set`.
+        New alpha values are stored in the alpha bytes (also if the object
+        has no alpha values yet), new packed colors (``rgba``) define the
+        alpha values if ``alpha`` is not set.
+        """
+        alpha = kwargs.pop("alpha", None)
+        if len(kwargs) > 0: colorobject.set(self, **kwargs)
+        if not alpha is None:
+            alpha = np.asarray(alpha, dtype = self.DTYPE).reshape(-1)
+            if not len(alpha) == len(self):
+                raise ValueError("number of values to be stored on the object " + \
+                    "{:s} have to match the current dimension".format(self.__class__.__name__))
+            if np.any(alpha < 0.) or np.any(alpha > 1.):
+                raise ValueError("wrong values specified for dimension alpha in " + \
+                    "{:s}: values have to lie within [0.,1.]".format(self.__class__.__name__))
+        self._reprs_ = {}
+        self._set_coords_(self._dims_, [self._coords_], alpha)
 
-        elif to == "sRGB":
-            via = ["CIELAB", "CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def dropalpha(self):
+        """dropalpha()
 
-        elif to == "hex":
-            via = ["CIELAB", "CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Remove alpha information from the color object, if defined
+        (all alpha bytes are set to ``255``).
+        """
+        if self.hasalpha():
+            self._alpha_  = None
+            self._reprs_  = {}
+            self._coords_ = self._coords_ | np.uint32(255)
 
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
 
-        else: self._cannot(self.__class__.__name__, to)
 
+# -------------------------------------------------------------------
+# Memoization of conversions (optional, see conversiongraph.cache).
+# -------------------------------------------------------------------
+class conversioncache(object):
+    """conversioncache(maxsize = 256, maxbytes = 2**26)
 
-class HSV(colorobject):
-    """HSV(H, S, V, alpha = None)
-    
-    HSV (Hue-Saturation-Value) color object.
+    Least recently used (LRU) cache of converted colors.
 
-    Allowes conversions to: :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`,
-    and `"hex"` (:py:class:`hexcols`).  Not possible are conversions to
-    (ambiguous): :py:class:`CIEXYZ`, :py:class:`CIELUV`, :py:class:`CIELAB`,
-    :py:class:`polarLUV`, :py:class:`polarLAB`,
+    Used by :py:func:`conversiongraph.convert` (and thus
+    :py:func:`colorobject.to`) if set on the graph: conversions are
+    looked up by source and target color space, white point, gamma,
+    fixup, floating point precision, and a digest (BLAKE2) of the
+    coordinates. Repeated conversions of the same colors (e.g., the same
+    palette) are copied from the cache instead of being converted again.
+    The cache holds copies of the results, the objects are never shared.
 
     Parameters
     ----------
-    H : numeric
-        single value or multiple values for the hue dimension
-    S : numeric
-        single value or multiple values for the saturation dimension
-    V : numeric
-        single value or multiple values for the value dimension
-    alpha : None or numeric
-        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
-        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
-        transparency is added
+    maxsize : int
+        maximum number of conversions stored
+    maxbytes : int
+        maximum number of bytes of all stored results. Results larger
+        than ``maxbytes`` and colors with more than ``maxbytes`` bytes of
+        coordinates are not cached
 
     Examples
     --------
-    >>> from colorspace.colorlib import HSV
-    >>> cols = HSV([150, 150, 10], [1.5, 0, 1.5], [0.1, 0.7, 0.1])
-
-    .. seealso::
-        This object extens the :py:class:`colorlib.colorobject` which
-        provides some methods to e.g., extract color or to modify the
-        whitepoint.
+    >>> from colorspace.colorlib import conversions, conversioncache, HCL
+    >>> conversions.cache = conversioncache(maxsize = 128)
+    >>> for i in range(10):
+    >>>     c = HCL([260, 80, 30], [80, 0, 80], [30, 90, 30])
+    >>>     c.to("hex")
+    >>> conversions.cache.stats()
     """
 
-    def __init__(self, H, S, V, alpha = None):
-
-        # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(H = H, S = S, V = V, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
-        # White spot definition (the default)
-        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+    def __init__(self, maxsize = 256, maxbytes = 2**26):
 
+        from collections import OrderedDict
+        import threading
+        if int(maxsize) < 0 or int(maxbytes) < 0:
+            raise ValueError("maxsize and maxbytes have to be non-negative integers")
+        self.maxsize   = int(maxsize)
+        self.maxbytes  = int(maxbytes)
+        self._entries_ = OrderedDict() # Key -> (dims, arrays, bytes)
+        self._lock_    = threading.Lock()
+        self._bytes_   = 0
+        self._hits_    = 0
+        self._misses_  = 0
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
+    def __repr__(self):
+        return "<conversioncache: {:d} hits, {:d} misses, {:d}/{:d} entries, {:d}/{:d} bytes>".format(
+                self._hits_, self._misses_, len(self._entries_), self.maxsize,
+                self._bytes_, self.maxbytes)
 
-        Transforms the colors into a new color space, if possible.
+    def key(self, from_, to, coords, white, gamma, fixup, dtype):
+        """key(from_, to, coords, white, gamma, fixup, dtype)
 
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+        Returns the key of a conversion.
 
         Parameters
         ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
+        from_, to : str
+            names of the source and target color space
+        coords : numpy.ndarray
+            coordinates of the colors (e.g., the ``(n, 3)`` array of a
+            :py:class:`colorobject`)
+        white : list
+            white point definition, ``[XN, YN, ZN]``
+        gamma : float or numpy.ndarray
+            gamma used to convert between RGB and sRGB
         fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary.
+            whether or not colors are corrected
+        dtype : str or numpy.dtype
+            floating point precision of the conversion
+
+        Returns
+        -------
+        tuple or None
+            Returns the key, ``None`` if the coordinates cannot be cached
+            (too large or Python objects).
         """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
+        import hashlib
+        # Python objects cannot be hashed by their bytes
+        coords = np.ascontiguousarray(coords)
+        if coords.dtype.kind == "O" or coords.nbytes > self.maxbytes: return None
 
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
+        def part(x):
+            if isinstance(x, np.ndarray):
+                x = np.ascontiguousarray(x)
+                return (x.dtype.str, x.shape, x.tobytes())
+            return float(x)
 
-        # The only transformation we need is back to RGB
-        elif to == "RGB":
-            [R, G, B] = clib.HSV_to_RGB(self.get("H"), self.get("S"), self.get("V"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
+        digest = hashlib.blake2b(coords.data, digest_size = 20).digest()
+        return (from_, to, tuple([part(x) for x in white]), part(gamma), bool(fixup),
+                np.dtype(dtype).str, coords.dtype.str, coords.shape, digest)
 
-        # The rest are transformations along a path
-        elif to == "sRGB":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def get(self, key):
+        """get(key)
 
-        elif to == "hex":
-            via = ["RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Returns a cached conversion (counted as hit or miss).
 
-        elif to == "HLS":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Parameters
+        ----------
+        key : tuple
+            key of the conversion, see :py:func:`key`
 
-        elif to in ["CIEXYZ","CIELUV","CIELAB","polarLUV", "HCL","polarLAB"]:
-            self._ambiguous(self.__class__.__name__, to)
+        Returns
+        -------
+        dict or None
+            Returns a copy of the converted coordinates (see
+            :py:func:`conversiongraph.transform`), ``None`` if not cached.
+        """
+        with self._lock_:
+            entry = self._entries_.get(key)
+            if entry is None:
+                self._misses_ += 1
+                return None
+            self._entries_.move_to_end(key)
+            self._hits_ += 1
+        [dims, arrays, nbytes] = entry
+        # Coordinates are stored as one (n, k) array
+        if len(arrays) == 1 and arrays[0].ndim == 2:
+            base = arrays[0].copy()
+            return dict([(d, base[:,i]) for i,d in enumerate(dims)])
+        return dict(zip(dims, [x.copy() for x in arrays]))
 
-        else: self._cannot(self.__class__.__name__, to)
+    def put(self, key, data):
+        """put(key, data)
 
+        Stores a copy of a conversion, the least recently used
+        conversions are removed if needed.
 
-class HLS(colorobject):
-    """HLS(H, L, S, alpha = None)
-    
-    HLS (Hue-Lightness-Saturation) color space.
+        Parameters
+        ----------
+        key : tuple
+            key of the conversion, see :py:func:`key`
+        data : dict
+            the converted coordinates (one `numpy.ndarray` per dimension)
+        """
+        dims   = list(data.keys())
+        arrays = [np.asarray(data[d]) for d in dims]
+        if len(arrays) > 1 and np.all([x.dtype.kind == "f" and x.ndim == 1 for x in arrays]):
+            arrays = [np.stack(arrays, axis = 1)]
+        else:
+            arrays = [x.copy() for x in arrays]
+        nbytes = int(np.sum([x.nbytes for x in arrays]))
+        if nbytes > self.maxbytes or self.maxsize == 0: return
+
+        with self._lock_:
+            old = self._entries_.pop(key, None)
+            if not old is None: self._bytes_ -= old[2]
+            self._entries_[key] = (dims, arrays, nbytes)
+            self._bytes_ += nbytes
+            while len(self._entries_) > self.maxsize or self._bytes_ > self.maxbytes:
+                self._bytes_ -= self._entries_.popitem(last = False)[1][2]
+
+    def clear(self):
+        """clear()
+
+        Removes all conversions and resets the statistics.
+        """
+        with self._lock_:
+            self._entries_.clear()
+            self._bytes_ = 0; self._hits_ = 0; self._misses_ = 0
 
-    Allowes conversions to: :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`,
-    and `"hex"` (:py:class:`hexcols`).  Not possible are conversions to
-    (ambiguous): :py:class:`CIEXYZ`, :py:class:`CIELUV`, :py:class:`CIELAB`,
-    :py:class:`polarLUV`, :py:class:`polarLAB`,
+    def stats(self):
+        """stats()
+
+        Returns
+        -------
+        dict
+            Returns a dict with the number of ``hits`` and ``misses``, the
+            number of stored conversions (``size``) and their ``bytes``, and
+            the limits (``maxsize``, ``maxbytes``).
+        """
+        with self._lock_:
+            return {"hits": self._hits_, "misses": self._misses_,
+                    "size": len(self._entries_), "bytes": self._bytes_,
+                    "maxsize": self.maxsize, "maxbytes": self.maxbytes}
 
-    Parameters
-    ----------
-    H : numeric
-        single value or multiple values for the hue dimension
-    L : numeric
-        single value or multiple values for the lightness dimension
-    S : numeric
-        single value or multiple values for the saturation dimension
-    alpha : None or numeric
-        single value or vector of numerics in ``[0.,1.]`` for the alpha channel
-        (``0.`` means transparent, ``1.`` opaque). If ``None`` no
-        transparency is added
+
+# -------------------------------------------------------------------
+# Conversion graph: planning and executing transformations
+# between the color spaces.
+# -------------------------------------------------------------------
+class conversiongraph(object):
+    """conversiongraph()
+
+    Registry of all transformations between the color spaces.
+
+    Each color space (a :py:class:`colorobject` class) is a node of the
+    graph, each direct transformation (an edge kernel calling one or
+    several :py:class:`colorlib` methods) is registered once. The path
+    between two color spaces is planned once (cheapest path) and cached.
+    :py:func:`colorobject.to` uses the graph to convert the color
+    coordinates along the whole path in one call.
+
+    The package registers all its color spaces on the module level
+    instance ``colorlib.conversions``. New color spaces can be plugged in by
+    registering the class (:py:func:`register_space`) and at least one edge
+    to and from an existing color space (:py:func:`register`).
 
     Examples
     --------
-    >>> from colorspace.colorlib import HLS
-    >>> cols = HLS([150, 0, 10], [0.1, 0.7, 0.1], [3, 0, 3])
+    >>> from colorspace.colorlib import conversions
+    >>> conversions.path("hex", "HCL")
+    >>> conversions.path("polarLUV", "hex")
 
-    .. seealso::
-        This object extens the :py:class:`colorlib.colorobject` which
-        provides some methods to e.g., extract color or to modify the
-        whitepoint.
+    Large conversions can be split into chunks which are converted in
+    parallel on a pool of threads (the numpy kernels release the GIL),
+    either for all conversions or per call (see :py:func:`transform`):
+
+    >>> conversions.workers   = 8
+    >>> conversions.chunksize = 2**16
+
+    Paths with kernels holding the GIL (registered with ``vectorized = False``,
+    e.g., the string conversions into hex colors, see :py:func:`register`)
+    do not scale on threads; these are converted on a pool of processes
+    instead, sharing the coordinates via shared memory (``backend = "auto"``,
+    see :py:func:`transform`). The backend can also be set explicitly:
+
+    >>> conversions.backend = "process"
+
+    Repeated conversions of the same colors can be memoized
+    (:py:class:`conversioncache`, not used by default):
+
+    >>> conversions.cache = conversioncache(maxsize = 256)
     """
 
-    def __init__(self, H, L, S, alpha = None):
+    # Number of threads/processes used for large conversions (1: serial), the
+    # number of colors per chunk (the arrays of one chunk fit into the cache),
+    # and the parallel backend ("auto", "thread", or "process")
+    workers   = 1
+    chunksize = 65536
+    backend   = "auto"
 
-        # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(H = H, L = L, S = S, alpha = None)
-        for key,val in tmp.items(): self._data_[key] = val
-        # White spot definition (the default)
-        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+    # Memoization of convert (None or a conversioncache)
+    cache     = None
 
+    def __init__(self):
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
+        self._spaces_    = {} # Name of the color space -> colorobject class
+        self._aliases_   = {} # Alias -> name of the color space
+        self._edges_     = {} # Name -> dict (target name -> (kernel, cost, vectorized, lossy))
+        self._ambiguous_ = set()
+        self._paths_     = {} # Cache for the planned paths
 
-        Transforms the colors into a new color space, if possible.
+    def register_space(self, cls, aliases = []):
+        """register_space(cls, aliases = [])
 
-        No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+        Register a new color space.
 
         Parameters
         ----------
-        to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
-        fixup : bool
-            whether or not colors outside the defined rgb color space
-            should be corrected if necessary.
+        cls : colorobject class
+            the class of the color space, the name of the class
+            is used as the name of the color space.
+        aliases : list of str
+            additional names for the color space (e.g., ``"HCL"``
+            for :py:class:`polarLUV`).
         """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
+        name = cls.__name__
+        self._spaces_[name] = cls
+        self._edges_.setdefault(name, {})
+        for x in aliases: self._aliases_[x] = name
+        self._paths_ = {}
 
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
+    def register(self, from_, to, fun, cost = 1., vectorized = True, lossy = False):
+        """register(from_, to, fun, cost = 1., vectorized = True, lossy = False)
 
-        # The only transformation we need is back to RGB
-        elif to == "RGB":
-            [R, G, B] = clib.HLS_to_RGB(self.get("H"), self.get("L"), self.get("S"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
+        Register a direct transformation (an edge) between two color spaces.
 
-        # The rest are transformations along a path
-        elif to == "sRGB":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Parameters
+        ----------
+        from_ : str
+            name of the source color space
+        to : str
+            name of the target color space
+        fun : function
+            the edge kernel, a function ``fun(clib, data, white, gamma, fixup, out = None)``
+            where ``clib`` is a :py:class:`colorlib` object, ``data`` a dict
+            with the coordinates (one `numpy.ndarray` per dimension, without
+            alpha), ``white`` a list ``[XN, YN, ZN]``, and ``gamma`` and
+            ``fixup`` the settings of the color object. ``out`` is ``None`` or
+            a list of arrays to store the results (see ``out`` of the
+            :py:class:`colorlib` methods). Has to return a dict
+            with the coordinates in the target color space.
+        cost : float
+            cost of the transformation used to plan the path. Fused
+            transformations replacing several steps should be cheaper than
+            the steps they replace.
+        vectorized : bool
+            ``False`` if the kernel holds the GIL for a large part of its
+            work (Python-level work per color or string conversions, e.g.,
+            the kernels into hex colors). Paths containing such kernels are
+            converted on a pool of processes (``backend = "auto"``, see
+            :py:func:`transform`).
+        lossy : bool
+            ``True`` if the transformation loses information (e.g.,
+            quantization to 8-bit hex colors, correction of colors outside
+            the rgb color space), see :py:func:`lossy`
+        """
+        [from_, to] = [self.name(x) for x in [from_, to]]
+        self._edges_[from_][to] = (fun, float(cost), bool(vectorized), bool(lossy))
+        self._paths_ = {}
 
-        elif to == "hex":
-            via = ["RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def register_ambiguous(self, from_, to):
+        """register_ambiguous(from_, to)
 
-        elif to == "HSV":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Mark transformations as ambiguous (not allowed) even if
+        a path exists (e.g., from :py:class:`HSV` to :py:class:`CIEXYZ`).
 
-        elif to in ["CIEXYZ","CIELUV","CIELAB","polarLUV","HCL","polarLAB"]:
-            self._ambiguous(self.__class__.__name__, to)
+        Parameters
+        ----------
+        from_ : list of str
+            names of the source color spaces
+        to : list of str
+            names of the target color spaces
+        """
+        for x in from_:
+            for y in to: self._ambiguous_.add((self.name(x), self.name(y)))
+        self._paths_ = {}
 
-        else: self._cannot(self.__class__.__name__, to)
+    def name(self, x):
+        """name(x)
 
+        Returns the name of the color space ``x`` (resolves aliases).
+        """
+        return self._aliases_.get(x, x)
 
-class hexcols(colorobject):
-    """hexcols(hex_)
-    
-    Color object for hex colors.
+    def spaces(self):
+        """spaces()
 
-    Takes up a set of hex colors. Can be converted to all other color spaces
-    including :py:class:`RGB`, :py:class:`sRGB`, :py:class:`HLS`, and `"hex"`
-    (:py:class:`hexcols`), :py:class:`CIEXYZ`, :py:class:`CIELUV`,
-    :py:class:`CIELAB`, :py:class:`polarLUV`, :py:class:`polarLAB`,
+        Returns
+        -------
+        list
+            Returns a list with the names (including aliases) of all
+            registered color spaces.
+        """
+        return list(self._spaces_.keys()) + list(self._aliases_.keys())
 
-    Parameters
-    ----------
-    hex_ : str, list of str, or numpy.ndarray of type str
-        hex colors. Only six and eight digit hex colors are allowed (e.g.,
-        ``#000000`` or ``#00000050`` if with alpha value). If invalid hex
-        colors are provided the object will raise a ValueError.  Input can be a
-        single string, a list of strings, or a `numpy.ndarray` containing a set
-        of hex colors. Invalid hex colors will be handled as `numpy.nan`, alpha
-        values can be provided but will be ignored
+    def path(self, from_, to):
+        """path(from_, to)
 
-    Examples
-    --------
-    >>> from colorspace.colorlib import hexcols
-    >>> c = hexcols("#cecece")
-    >>> c = hexcols(["#ff0000", "#00ff00"])
-    >>> from numpy import asarray
-    >>> c = hexcols(asarray(["#ff000030", "#00ff0030"], dtype = "|S9"))
-    >>> #Convert hex colors to another color space (CIEXYZ for example):
-    >>> c.to("CIEXYZ")
+        Plans the transformation from color space ``from_`` to ``to``
+        (cheapest path through the graph). The result is cached.
 
-    .. seealso::
-        This object extens the :py:class:`colorlib.colorobject` which
-        provides some methods to e.g., extract color or to modify the
-        whitepoint.
-    """
+        Parameters
+        ----------
+        from_ : str
+            name of the source color space
+        to : str
+            name of the target color space
 
-    def __init__(self, hex_):
+        Returns
+        -------
+        list or None
+            Returns a list with the names of the color spaces along the path
+            (excluding ``from_``), an empty list if ``from_`` and ``to`` are
+            identical. ``None`` if the transformation is not possible or
+            ambiguous.
+        """
+        [from_, to] = [self.name(x) for x in [from_, to]]
+        key = (from_, to)
+        if key in self._paths_:
+            res = self._paths_[key]
+            return None if res is None else list(res)
+
+        if key in self._ambiguous_ or not from_ in self._spaces_ or not to in self._spaces_:
+            res = None
+        else:
+            # Dijkstra, the graph only has a handful of nodes
+            dist = {from_: 0.}; prev = {}; todo = set([from_]); done = set()
+            while todo:
+                node = min(todo, key = lambda x: dist[x])
+                todo.remove(node); done.add(node)
+                if node == to: break
+                for nxt,(fun,cost,vectorized,lossy) in self._edges_[node].items():
+                    if nxt in done: continue
+                    if not nxt in dist or dist[node] + cost < dist[nxt]:
+                        dist[nxt] = dist[node] + cost; prev[nxt] = node
+                        todo.add(nxt)
+            if not to in dist:
+                res = None
+            else:
+                res = [to]
+                while not res[0] == from_: res.insert(0, prev[res[0]])
+                res = res[1:]
 
-        if isinstance(hex_,str): hex_ = np.asarray([hex_])
-        # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-        tmp = self._colorobject_check_input_arrays_(hex_ = hex_)
+        self._paths_[key] = res
+        return None if res is None else list(res)
 
-        # Checking for valid hex colors and alpha values
-        tmp = self._check_hex_(tmp["hex_"])
-        for key,val in tmp.items():
-            self._data_[key] = val
-        # White spot definition (the default)
-        self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
+    def lossy(self, from_, to):
+        """lossy(from_, to)
 
+        Returns
+        -------
+        bool
+            Returns ``True`` if the path from ``from_`` to ``to`` (see
+            :py:func:`path`) contains transformations losing information
+            (registered with ``lossy = True``, e.g., into hex colors),
+            ``False`` if not or if there is no path.
+        """
+        path = self.path(from_, to)
+        if path is None: return False
+        steps = zip([self.name(from_)] + path[:-1], path)
+        return bool(np.any([self._edges_[a][b][3] for a,b in steps]))
 
-    def _check_hex_(self, hex_):
-        """_check_hex_(hex_)
+    def transform(self, from_, to, data, white, gamma = 2.4, fixup = True,
+                  out = None, workspace = None, dtype = "float64",
+                  workers = None, chunksize = None, backend = None):
+        """transform(from_, to, data, white, gamma = 2.4, fixup = True, out = None, workspace = None, dtype = "float64", workers = None, chunksize = None, backend = None)
 
-        Checking hex colors for validity. Only 6 and 8 digit
-        hex colors with or without alpha (e.g., "#000000", "#00000050")
-        are allowed. The method raises a ValueError if invalid hex colors
-        are found.
+        Transforms color coordinates along the planned path.
+        The inputs are not validated, see ``validate`` of
+        :py:class:`colorlib`.
 
         Parameters
         ----------
-        hex_ : list of strings
-            a list of (hopefully) valid hex colors
+        from_ : str
+            name of the source color space
+        to : str
+            name of the target color space
+        data : dict
+            the coordinates, one `numpy.ndarray` per dimension (no alpha)
+        white : list
+            white point definition, ``[XN, YN, ZN]``
+        gamma : float
+            gamma used to convert between RGB and sRGB
+        fixup : bool
+            whether or not colors outside the defined rgb color space
+            should be corrected if necessary
+        out : None or list
+            list of three float `numpy.ndarray`'s to store the coordinates
+            in the target color space, in the order of the results of the
+            corresponding :py:class:`colorlib` method (e.g., ``[L, C, H]``
+            for ``polarLUV``). Must not overlap with the input arrays.
+            Ignored for ``hex``.
+        workspace : None or workspace
+            if set, all intermediate results are stored on the
+            :py:class:`workspace`. Repeated transformations of the same
+            size do not allocate new arrays (if ``out`` is used).
+        dtype : str or numpy.dtype
+            floating point precision of the results and all intermediate
+            arrays, ``"float64"`` (default) or ``"float32"``.
+        workers : None or int
+            number of threads or processes. If larger than one and there
+            are more than ``chunksize`` colors, the colors are converted in
+            chunks in parallel (using one workspace per thread; ``workspace``
+            is not used). The results are identical to the serial conversion.
+            If ``None`` the default of the graph is used (``workers``)
+        chunksize : None or int
+            number of colors per chunk, if ``None`` the default of the
+            graph is used (``chunksize``)
+        backend : None or str
+            parallel backend, ``"thread"`` (pool of threads), ``"process"``
+            (pool of processes, the coordinates are placed in shared memory
+            and only the names of the buffers are sent to the processes),
+            or ``"auto"`` (processes if the path contains kernels holding
+            the GIL, e.g., into hex colors, see ``vectorized`` of
+            :py:func:`register`, else threads).
+            Falls back to the serial conversion if no pool of processes
+            or shared memory is available. If ``None`` the default of the
+            graph is used (``backend``)
 
         Returns
         -------
         dict
-            Returns a dict with two elements named hex_ and alpha. The hex_
-            element contains valid six-digit hex strings, the alpha element
-            a list of the same length with alpha values. For all hex colors
-            with no alpha an alpha value of ``1.0`` is set.
+            Returns the coordinates in the target color space. Raises
+            an exception if the transformation is not possible.
+
+        Examples
+        --------
+        >>> from colorspace.colorlib import conversions, workspace
+        >>> import numpy as np
+        >>> ws  = workspace()
+        >>> hcl = np.empty((3, 100))
+        >>> rgb = {"R": np.random.uniform(0, 1, 100), "G": np.random.uniform(0, 1, 100),
+        >>>        "B": np.random.uniform(0, 1, 100)}
+        >>> for i in range(10):
+        >>>     conversions.transform("sRGB", "HCL", rgb, [95.047, 100.000, 108.883],
+        >>>                           out = [hcl[0], hcl[1], hcl[2]], workspace = ws)
+        >>> # Hex colors on four processes
+        >>> hex_ = conversions.transform("sRGB", "hex", rgb, [95.047, 100.000, 108.883],
+        >>>                              workers = 4, chunksize = 25, backend = "process")
         """
+        path = self.path(from_, to)
+        if path is None:
+            raise Exception("Cannot convert class \"{:s}\" to \"{:s}\".".format(from_, to))
+
+        workers   = self.workers   if workers   is None else int(workers)
+        chunksize = self.chunksize if chunksize is None else int(chunksize)
+        if workers < 1 or chunksize < 1:
+            raise ValueError("workers and chunksize have to be positive integers")
+        backend   = self.backend   if backend   is None else backend
+        if not backend in ["auto", "thread", "process"]:
+            raise ValueError("backend has to be \"auto\", \"thread\", or \"process\", " + \
+                             "got \"{:s}\"".format(str(backend)))
+
+        node = self.name(from_)
+        n    = len(list(data.values())[0])
+        if workers > 1 and n > chunksize and len(path) > 0:
+            if backend == "auto":
+                steps   = zip([node] + path[:-1], path)
+                backend = "thread" if np.all([self._edges_[a][b][2] for a,b in steps]) else "process"
+            if backend == "process":
+                return self._transform_processes_(node, path, data, white, gamma, fixup,
+                                                  out, dtype, workers, chunksize)
+            return self._transform_chunked_(node, path, data, white, gamma, fixup,
+                                            out, dtype, workers, chunksize)
+        return self._run_(node, path, data, white, gamma, fixup, out, workspace, dtype)
+
+    def _chunks_(self, n, chunksize):
+        """_chunks_(n, chunksize)
+
+        Splits ``n`` colors into chunks of (at most) ``chunksize`` colors.
 
-        from re import compile, match
-        from numpy import sum
+        Returns
+        -------
+        list
+            Returns a list of tuples ``(start, end)``.
+        """
+        bounds = [(a, min(a + chunksize, n)) for a in range(0, n, max(2, chunksize))]
+        # Single colors take a different (matrix-vector) path in the
+        # matrix multiplications; append them to the previous chunk.
+        if len(bounds) > 1 and bounds[-1][1] - bounds[-1][0] == 1:
+            bounds[-2:] = [(bounds[-2][0], n)]
+        return bounds
 
-        r = compile("^(nan|#[0-9A-Fa-f]{6}([0-9]{2})?)$")
-        check = [1 if match(r, x) else 0 for x in hex_]
-        if not sum(check) == len(hex_):
-            raise ValueError("invalid hex colors provided while " + \
-                    "initializing class {:s}".format(self.__class__.__name__))
+    def _run_(self, node, path, data, white, gamma, fixup, out, workspace, dtype):
+        """_run_(node, path, data, white, gamma, fixup, out, workspace, dtype)
 
-        r = compile("^#[0-9A-Fa-f]{6}([0-9]{2})$")
-        check = [1 if match(r, x) else 0 for x in hex_]
-        # No colors with alpha
-        if sum(check) == 0:
-            return {"hex_": hex_}
-        # Else extracting alpha colors
+        Performs the transformation along ``path`` (serial), see
+        :py:func:`transform`.
+
+        Returns
+        -------
+        dict
+            Returns the coordinates in the target color space.
+        """
+        # Coordinates stored on the color objects are already validated
+        clib = colorlib(validate = False, workspace = workspace, dtype = dtype)
+        n    = len(list(data.values())[0])
+        for k,nxt in enumerate(path):
+            # Intermediate results on the workspace (if set), the
+            # last step stores its results on 'out'.
+            if k == len(path) - 1:
+                o = out
+            else:
+                o = None if workspace is None else clib._columns_("transform." + nxt, n)
+            data = self._edges_[node][nxt][0](clib, data, white, gamma, fixup, out = o)
+            node = nxt
+        return data
+
+    def _transform_chunked_(self, node, path, data, white, gamma, fixup, out,
+                            dtype, workers, chunksize):
+        """_transform_chunked_(node, path, data, white, gamma, fixup, out, dtype, workers, chunksize)
+
+        Performs the transformation along ``path`` in chunks of ``chunksize``
+        colors on a pool of ``workers`` threads, see :py:func:`transform`.
+        The first chunk is converted first to set up the result arrays,
+        all other chunks write their results directly into (row blocks of)
+        the result arrays. Each thread uses its own :py:class:`workspace`.
+
+        Returns
+        -------
+        dict
+            Returns the coordinates in the target color space.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        import threading
+
+        n      = len(list(data.values())[0])
+        bounds = self._chunks_(n, chunksize)
+
+        # One workspace per thread, reused for all chunks of the thread
+        local = threading.local()
+        def run(a, b, o):
+            if not hasattr(local, "workspace"): local.workspace = workspace()
+            return self._run_(node, path, dict([(k, v[a:b]) for k,v in data.items()]),
+                              [_chunk_of_(x, n, a, b) for x in white], _chunk_of_(gamma, n, a, b),
+                              fixup, o, local.workspace, dtype)
+
+        # First chunk, used to set up the results: a list of ``out`` arrays
+        # or one (n, k) array for the coordinates, or a list of (string) arrays.
+        a, b  = bounds[0]
+        first = run(a, b, None if out is None else [x[a:b] for x in out])
+        dims  = list(first.keys())
+        if not out is None and not dims == ["hex_"]:
+            res = list(out)
+        elif np.all([isinstance(v, np.ndarray) and v.dtype.kind == "f" for v in first.values()]):
+            base = np.empty((n, len(dims)), dtype = first[dims[0]].dtype)
+            res  = [base[:,i] for i in range(len(dims))]
+            for i,d in enumerate(dims): res[i][a:b] = first[d]
         else:
-            alpha = []
-            for h in hex_:
-                m = match(r, h)
-                if not m:
-                    alpha.append(1.)
-                else:
-                    alpha.append(int(m.group(1)) / 100.)
-            return {"hex_": hex_, "alpha": alpha}
+            res = None
 
+        def chunk(ab):
+            o = None if res is None else [x[ab[0]:ab[1]] for x in res]
+            return run(ab[0], ab[1], o)
 
-    def to(self, to, fixup = True):
-        """to(to, fixup = True)
+        with ThreadPoolExecutor(max_workers = workers) as pool:
+            chunks = list(pool.map(chunk, bounds[1:]))
 
-        Transforms the colors into a new color space, if possible.
+        if res is None:
+            return dict([(d, np.concatenate([first[d]] + [x[d] for x in chunks])) for d in dims])
+        return dict(zip(dims, res))
+
+    def _transform_processes_(self, node, path, data, white, gamma, fixup, out,
+                              dtype, workers, chunksize):
+        """_transform_processes_(node, path, data, white, gamma, fixup, out, dtype, workers, chunksize)
+
+        Performs the transformation along ``path`` in chunks of ``chunksize``
+        colors on a pool of ``workers`` processes, see :py:func:`transform`.
+        The coordinates (and white point or gamma if specified per color)
+        are copied into shared memory once, only the names of the buffers
+        are sent to the processes. The processes write their results
+        directly into (disjoint row blocks of) a shared result buffer.
+        The first chunk is converted in this process to set up the result
+        buffer. Falls back to the serial conversion if shared memory or
+        the pool of processes is not available.
+
+        Returns
+        -------
+        dict
+            Returns the coordinates in the target color space.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        import pickle
+
+        def serial():
+            return self._run_(node, path, data, white, gamma, fixup, out, None, dtype)
+
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            return serial()
+
+        # The package graph is available in the processes, others
+        # (and their kernels) have to be pickled.
+        try:
+            graph = None if self is conversions else pickle.dumps(self)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return serial()
+
+        n      = len(list(data.values())[0])
+        bounds = self._chunks_(n, chunksize)
+
+        # First chunk, used to set up the shared result buffer: one (n, k)
+        # array for the coordinates or one fixed-width string array.
+        a, b  = bounds[0]
+        first = self._run_(node, path, dict([(k, v[a:b]) for k,v in data.items()]),
+                           [_chunk_of_(x, n, a, b) for x in white], _chunk_of_(gamma, n, a, b),
+                           fixup, None, None, dtype)
+        dims  = list(first.keys())
+        first = [np.asarray(first[d]) for d in dims]
+        if np.all([x.dtype.kind == "f" for x in first]):
+            shape = (n, len(dims))
+            rtype = first[0].dtype
+        elif len(dims) == 1 and first[0].dtype.kind in "US":
+            # Wide enough for all hex colors (including alpha), narrowed
+            # to the width of the serial conversion below
+            shape = (n,)
+            rtype = np.promote_types(first[0].dtype, first[0].dtype.kind + "9")
+        else:
+            return serial()
+        if np.any([np.asarray(v).dtype.kind == "O" for v in data.values()]):
+            return serial()
+
+        shms = []
+        def alloc(shape, dtype):
+            dtype = np.dtype(dtype)
+            shm   = shared_memory.SharedMemory(create = True,
+                                               size = max(1, int(np.prod(shape)) * dtype.itemsize))
+            shms.append(shm)
+            return ("shm", shm.name, shape, dtype.str), \
+                   np.ndarray(shape, dtype = dtype, buffer = shm.buf)
+        def share(x):
+            x = np.asarray(x)
+            [spec, buf] = alloc(x.shape, x.dtype)
+            buf[...] = x
+            return spec
+        def per_color(x):
+            return isinstance(x, np.ndarray) and x.ndim > 0 and x.size == n
+
+        res = None; buf = None
+        try:
+            task = (graph, node, path,
+                    dict([(k, share(v)) for k,v in data.items()]),
+                    [share(x) if per_color(x) else x for x in white],
+                    share(gamma) if per_color(gamma) else gamma,
+                    fixup, dtype)
+            [spec, buf] = alloc(shape, rtype)
+            if len(shape) == 1:
+                buf[a:b] = first[0]
+            else:
+                for i,x in enumerate(first): buf[a:b,i] = x
+
+            with ProcessPoolExecutor(max_workers = workers) as pool:
+                for x in pool.map(_convert_shared_chunk_,
+                                  [task + (spec, a, b) for a,b in bounds[1:]]): pass
+            res = np.array(buf)
+        except (OSError, BrokenProcessPool):
+            pass
+        finally:
+            buf = None
+            for shm in shms:
+                # Views still referenced by a traceback keep the buffer open
+                try:
+                    shm.close()
+                except BufferError:
+                    pass
+                shm.unlink()
+
+        if res is None:
+            return serial()
+        if len(shape) == 1:
+            width = max(first[0].dtype.itemsize // (4 if rtype.kind == "U" else 1),
+                        int(np.max(np.char.str_len(res))) if n > 0 else 0)
+            return {dims[0] : res.astype("{:s}{:d}".format(rtype.kind, width))}
+        if not out is None:
+            for i,x in enumerate(out): x[...] = res[:,i]
+            return dict(zip(dims, out))
+        return dict([(d, res[:,i]) for i,d in enumerate(dims)])
+
+    def convert(self, obj, to, fixup = True, workers = None, chunksize = None,
+                backend = None):
+        """convert(obj, to, fixup = True, workers = None, chunksize = None, backend = None)
+
+        Converts a color object into a new color space. Used by
+        :py:func:`colorobject.to`. Conversions are looked up in and stored
+        on the ``cache`` of the graph if set (see :py:class:`conversioncache`).
 
         No return, converts the object into a new color space and modifies
-        the underlying object. After calling this method the original
-        object will be of a different type.
+        the underlying object (coordinates and class).
 
         Parameters
         ----------
+        obj : colorobject
+            the color object to be converted
         to : str
-            name of the color space into which the colors should be
-            converted (e.g., ``CIEXYZ``, ``HCL``, ``hex``, ``RGB``, ...)
+            name of the target color space
         fixup : bool
             whether or not colors outside the defined rgb color space
             should be corrected if necessary
+        workers, chunksize : None or int
+            parallel execution in chunks, see :py:func:`transform`
+        backend : None or str
+            parallel backend, see :py:func:`transform`
         """
-        self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to in ["hex", self.__class__.__name__]:
-            return
+        from_ = obj.__class__.__name__
+        name  = self.name(to)
+        if name == from_: return
+
+        # Coordinates cached on the object (see colorobject). The current
+        # coordinates are added to the cache unless the conversion is lossy
+        # (the cached coordinates do not describe the new colors).
+        cached = obj._cached_(name, fixup)
+        if self.lossy(from_, name):
+            reprs = {}
+        else:
+            reprs = dict(obj._remember_(from_, None, obj._dims_, obj._coords_))
+        if cached is None:
+            data = self._convert_data_(obj, to, fixup, workers, chunksize, backend)
+            # Results which are already one (n, 3) array are stored without copy
+            # (by the target class, see packedRGBA._set_coords_)
+            dims = list(data.keys())
+            obj.__class__ = self._spaces_[name]
+            obj._set_coords_(dims, [data[x] for x in dims], obj._alpha_, adopt = True)
+        else:
+            obj.__class__ = self._spaces_[name]
+            [obj._dims_, obj._coords_] = cached
+            obj._shared_ = True
+            for x in [None, True, False]: reprs.pop((name, x), None)
+        obj._reprs_ = reprs
 
-        # The only transformation we need is from hexcols -> sRGB
-        elif to == "sRGB":
-            [R, G, B] = clib.hex_to_sRGB(self.get("hex_"))
-            self._data_ = {"R": R, "G": G, "B": B}
-            self.__class__ = sRGB
+    def converted(self, obj, to, fixup = True, workers = None, chunksize = None,
+                  backend = None):
+        """converted(obj, to, fixup = True, workers = None, chunksize = None, backend = None)
 
-        # The rest are transformations along a path
-        elif to == "RGB":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Converts a color object into a new color space without modifying
+        it. Used by :py:func:`colorobject.as_`.
 
-        elif to in ["CIEXYZ", "HLS", "HSV"]:
-            via = ["sRGB", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
+        The new object is created directly from the converted coordinates,
+        the white point, settings, and alpha values are taken over from
+        ``obj`` (shared, copy-on-write). The object ``obj`` is only read
+        (except for its cache of converted coordinates, which is replaced as
+        a whole), the same object can be converted by several threads at a time.
 
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["sRGB", "RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Parameters
+        ----------
+        obj : colorobject
+            the color object to be converted
+        to : str
+            name of the target color space
+        fixup : bool
+            whether or not colors outside the defined rgb color space
+            should be corrected if necessary
+        workers, chunksize : None or int
+            parallel execution in chunks, see :py:func:`transform`
+        backend : None or str
+            parallel backend, see :py:func:`transform`
 
-        elif to in ["HCL", "polarLUV"]:
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
+        Returns
+        -------
+        colorobject
+            Returns a new color object of the target color space (a
+            copy of ``obj`` if already in the target color space).
+        """
+        from copy import copy
+        from_ = obj.__class__.__name__
+        name  = self.name(to)
+        if name == from_: return copy(obj)
+
+        cls = self._spaces_[name]
+        res = cls.__new__(cls)
+        res.__dict__.update(obj.__dict__)
+        res.set_whitepoint(X = obj.WHITEX, Y = obj.WHITEY, Z = obj.WHITEZ)
+
+        # Coordinates cached on obj (see colorobject), else converted and
+        # added to the cache of obj (results of lossy conversions with the
+        # fixup used). The coordinates of obj are added to the cache of the
+        # new object unless the conversion is lossy.
+        lossy  = self.lossy(from_, name)
+        cached = obj._cached_(name, fixup)
+        if cached is None:
+            data = self._convert_data_(obj, to, fixup, workers, chunksize, backend)
+            dims = list(data.keys())
+            res._set_coords_(dims, [data[x] for x in dims], obj._alpha_, adopt = True)
+            obj._reprs_ = obj._remember_(name, bool(fixup) if lossy else None,
+                                         res._dims_, res._coords_)
+        else:
+            [res._dims_, res._coords_] = cached
+            res._alpha_ = obj._alpha_
+        res._shared_ = obj._shared_ = True
+        if lossy:
+            res._reprs_ = {}
+        else:
+            res._reprs_ = dict(obj._remember_(from_, None, obj._dims_, obj._coords_))
+            for x in [None, True, False]: res._reprs_.pop((name, x), None)
+        return res
 
-        elif to in "polarLAB":
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
+    def _convert_data_(self, obj, to, fixup, workers, chunksize, backend):
+        """_convert_data_(obj, to, fixup, workers, chunksize, backend)
 
-        else: self._cannot(self.__class__.__name__, to)
+        Converts the coordinates of a color object (looked up in and stored
+        on the ``cache`` of the graph if set), see :py:func:`convert`.
 
+        Returns
+        -------
+        dict
+            Returns the coordinates in the target color space.
+        """
+        from_ = obj.__class__.__name__
+        name  = self.name(to)
+        if (from_, name) in self._ambiguous_:
+            obj._ambiguous(from_, to)
+        elif self.path(from_, name) is None:
+            obj._cannot(from_, to)
+
+        white = [obj.WHITEX, obj.WHITEY, obj.WHITEZ]
+        cache = self.cache
+        key   = None if cache is None else \
+                cache.key(from_, name, obj._coords_, white, obj.GAMMA, fixup, obj.DTYPE)
+        data  = None if key is None else cache.get(key)
+        if data is None:
+            data = dict([(k,v) for k,v in obj._data_.items() if not k == "alpha"])
+            data = self.transform(from_, name, data, white, obj.GAMMA, fixup,
+                                  dtype = obj.DTYPE, workers = workers, chunksize = chunksize,
+                                  backend = backend)
+            if not key is None: cache.put(key, data)
+        return data
+
+
+def _chunk_of_(x, n, a, b):
+    """_chunk_of_(x, n, a, b)
+
+    Returns the colors ``a:b`` of ``x`` if specified per color (an array
+    of length ``n``; white point or gamma), else ``x``.
+    """
+    return x[a:b] if isinstance(x, np.ndarray) and x.ndim > 0 and x.size == n else x
 
+def _convert_shared_chunk_(task):
+    """_convert_shared_chunk_(task)
 
+    Converts one chunk of colors in a worker process, see
+    :py:func:`conversiongraph.transform` (``backend = "process"``).
+    Arrays in shared memory are specified by ``("shm", name, shape, dtype)``
+    and attached by name, the results are written into the rows ``a:b``
+    of the shared result buffer ``res``.
+    """
+    from multiprocessing import shared_memory
+    import pickle
+
+    (graph, node, path, data, white, gamma, fixup, dtype, res, a, b) = task
+    graph = conversions if graph is None else pickle.loads(graph)
+
+    shms = {}
+    def attach(x):
+        if not (isinstance(x, tuple) and len(x) == 4 and x[0] == "shm"): return x
+        if not x[1] in shms: shms[x[1]] = shared_memory.SharedMemory(name = x[1])
+        return np.ndarray(x[2], dtype = x[3], buffer = shms[x[1]].buf)
+
+    def run():
+        buf = attach(res)
+        n   = buf.shape[0]
+        o   = None if buf.ndim == 1 else [buf[a:b,i] for i in range(buf.shape[1])]
+        chunk = graph._run_(node, path, dict([(k, attach(v)[a:b]) for k,v in data.items()]),
+                            [_chunk_of_(attach(x), n, a, b) for x in white],
+                            _chunk_of_(attach(gamma), n, a, b), fixup, o, None, dtype)
+        if buf.ndim == 1: buf[a:b] = np.asarray(list(chunk.values())[0])
+
+    try:
+        run()
+    finally:
+        for shm in shms.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass
 
 
+# -------------------------------------------------------------------
+# Edge kernels of the conversion graph.
+# fun(clib, data, white, gamma, fixup, out = None) -> dict
+# -------------------------------------------------------------------
+def _polarLUV_to_CIELUV_(clib, data, white, gamma, fixup, out = None):
+    [L, U, V] = clib.polarLUV_to_LUV(data["L"], data["C"], data["H"], out = out)
+    return {"L" : L, "U" : U, "V" : V}
+
+def _polarLUV_to_sRGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = kernels.get("polarLUV_to_sRGB")(clib, data["L"], data["C"], data["H"], *white,
+                                                 gamma = gamma, out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _polarLUV_to_hex_(clib, data, white, gamma, fixup, out = None):
+    # The 8-bit quantization table of colorlib.polarLUV_to_hex replaces
+    # the gamma correction, only used by the numpy kernels.
+    if kernels.get_backend("polarLUV_to_sRGB") == "numpy":
+        hex_ = clib.polarLUV_to_hex(data["L"], data["C"], data["H"], *white,
+                                    gamma = gamma, fixup = fixup, dtype = "U7")
+        return {"hex_" : hex_}
+    rgb = clib._columns_("polarLUV_to_hex.RGB", len(data["L"]))
+    [R, G, B] = kernels.get("polarLUV_to_sRGB")(clib, data["L"], data["C"], data["H"], *white,
+                                                 gamma = gamma, out = rgb)
+    return {"hex_" : clib.sRGB_to_hex(R, G, B, fixup, dtype = "U7")}
+
+def _CIELUV_to_CIEXYZ_(clib, data, white, gamma, fixup, out = None):
+    [X, Y, Z] = clib.LUV_to_XYZ(data["L"], data["U"], data["V"], *white, out = out)
+    return {"X" : X, "Y" : Y, "Z" : Z}
+
+def _CIELUV_to_polarLUV_(clib, data, white, gamma, fixup, out = None):
+    [L, C, H] = clib.LUV_to_polarLUV(data["L"], data["U"], data["V"], out = out)
+    return {"L" : L, "C" : C, "H" : H}
+
+def _CIEXYZ_to_CIELUV_(clib, data, white, gamma, fixup, out = None):
+    [L, U, V] = clib.XYZ_to_LUV(data["X"], data["Y"], data["Z"], *white, out = out)
+    return {"L" : L, "U" : U, "V" : V}
+
+def _CIEXYZ_to_CIELAB_(clib, data, white, gamma, fixup, out = None):
+    [L, A, B] = clib.XYZ_to_LAB(data["X"], data["Y"], data["Z"], *white, out = out)
+    return {"L" : L, "A" : A, "B" : B}
+
+def _CIEXYZ_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.XYZ_to_RGB(data["X"], data["Y"], data["Z"], *white, out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _RGB_to_CIEXYZ_(clib, data, white, gamma, fixup, out = None):
+    [X, Y, Z] = clib.RGB_to_XYZ(data["R"], data["G"], data["B"], *white, out = out)
+    return {"X" : X, "Y" : Y, "Z" : Z}
+
+def _RGB_to_sRGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.RGB_to_DEVRGB(data["R"], data["G"], data["B"], gamma, out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _RGB_to_HSV_(clib, data, white, gamma, fixup, out = None):
+    [H, S, V] = clib.RGB_to_HSV(data["R"], data["G"], data["B"], out = out)
+    return {"H" : H, "S" : S, "V" : V}
+
+def _RGB_to_HLS_(clib, data, white, gamma, fixup, out = None):
+    [H, L, S] = clib.RGB_to_HLS(data["R"], data["G"], data["B"], out = out)
+    return {"H" : H, "L" : L, "S" : S}
+
+def _sRGB_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.DEVRGB_to_RGB(data["R"], data["G"], data["B"], gamma, out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _sRGB_to_polarLUV_(clib, data, white, gamma, fixup, out = None):
+    [L, C, H] = kernels.get("sRGB_to_polarLUV")(clib, data["R"], data["G"], data["B"], *white,
+                                                 gamma = gamma, out = out)
+    return {"L" : L, "C" : C, "H" : H}
+
+def _RGB_to_hex_(clib, data, white, gamma, fixup, out = None):
+    return {"hex_" : clib.RGB_to_hex(data["R"], data["G"], data["B"], gamma, fixup, dtype = "U7")}
+
+def _sRGB_to_hex_(clib, data, white, gamma, fixup, out = None):
+    return {"hex_" : clib.sRGB_to_hex(data["R"], data["G"], data["B"], fixup, dtype = "U7")}
+
+def _CIELAB_to_CIEXYZ_(clib, data, white, gamma, fixup, out = None):
+    [X, Y, Z] = clib.LAB_to_XYZ(data["L"], data["A"], data["B"], *white, out = out)
+    return {"X" : X, "Y" : Y, "Z" : Z}
+
+def _CIELAB_to_polarLAB_(clib, data, white, gamma, fixup, out = None):
+    # polarLAB objects store the polar coordinates as L, A, B
+    [L, A, B] = clib.LAB_to_polarLAB(data["L"], data["A"], data["B"], out = out)
+    return {"L" : L, "A" : A, "B" : B}
+
+def _polarLAB_to_CIELAB_(clib, data, white, gamma, fixup, out = None):
+    [L, A, B] = clib.polarLAB_to_LAB(data["L"], data["A"], data["B"], out = out)
+    return {"L" : L, "A" : A, "B" : B}
+
+def _HSV_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.HSV_to_RGB(data["H"], data["S"], data["V"], out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _HLS_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.HLS_to_RGB(data["H"], data["L"], data["S"], out = out)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _hex_to_sRGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.hex_to_sRGB(data["hex_"])
+    return {"R" : R, "G" : G, "B" : B}
+
+def _hex_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.hex_to_RGB(data["hex_"], gamma)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _packedRGBA_to_sRGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.packed_to_sRGB(data["rgba"])
+    return {"R" : R, "G" : G, "B" : B}
+
+def _packedRGBA_to_RGB_(clib, data, white, gamma, fixup, out = None):
+    [R, G, B] = clib.packed_to_RGB(data["rgba"], gamma)
+    return {"R" : R, "G" : G, "B" : B}
+
+def _packedRGBA_to_hex_(clib, data, white, gamma, fixup, out = None):
+    return {"hex_" : clib.packed_to_hex(data["rgba"], dtype = "U7")}
+
+def _sRGB_to_packedRGBA_(clib, data, white, gamma, fixup, out = None):
+    return {"rgba" : clib.sRGB_to_packed(data["R"], data["G"], data["B"], fixup)}
+
+def _RGB_to_packedRGBA_(clib, data, white, gamma, fixup, out = None):
+    return {"rgba" : clib.RGB_to_packed(data["R"], data["G"], data["B"], gamma, fixup)}
+
+def _hex_to_packedRGBA_(clib, data, white, gamma, fixup, out = None):
+    return {"rgba" : clib.hex_to_packed(data["hex_"])}
+
+def _hex_to_polarLUV_(clib, data, white, gamma, fixup, out = None):
+    # Linear RGB from the 8-bit lookup table (see colorlib.hex_to_RGB),
+    # the remaining steps in one (compiled) kernel.
+    [R, G, B] = clib.hex_to_RGB(data["hex_"], gamma)
+    [L, C, H] = kernels.get("RGB_to_polarLUV")(clib, R, G, B, *white, gamma = gamma, out = out)
+    return {"L" : L, "C" : C, "H" : H}
+
+def _packedRGBA_to_polarLUV_(clib, data, white, gamma, fixup, out = None):
+    # See _hex_to_polarLUV_
+    [R, G, B] = clib.packed_to_RGB(data["rgba"], gamma)
+    [L, C, H] = kernels.get("RGB_to_polarLUV")(clib, R, G, B, *white, gamma = gamma, out = out)
+    return {"L" : L, "C" : C, "H" : H}
+
+def _polarLUV_to_packedRGBA_(clib, data, white, gamma, fixup, out = None):
+    # See _polarLUV_to_hex_
+    if kernels.get_backend("polarLUV_to_sRGB") == "numpy":
+        rgba = clib.polarLUV_to_packed(data["L"], data["C"], data["H"], *white,
+                                       gamma = gamma, fixup = fixup)
+        return {"rgba" : rgba}
+    rgb = clib._columns_("polarLUV_to_hex.RGB", len(data["L"]))
+    [R, G, B] = kernels.get("polarLUV_to_sRGB")(clib, data["L"], data["C"], data["H"], *white,
+                                                 gamma = gamma, out = rgb)
+    return {"rgba" : clib.sRGB_to_packed(R, G, B, fixup)}
+
+
+# Setting up the graph of the color spaces provided by the package.
+# The kernels into hex colors are marked as not vectorized: the
+# conversion of the strings into unicode holds the GIL.
+conversions = conversiongraph()
+
+conversions.register_space(polarLUV, aliases = ["HCL"])
+conversions.register_space(CIELUV)
+conversions.register_space(CIEXYZ)
+conversions.register_space(CIELAB)
+conversions.register_space(polarLAB)
+conversions.register_space(RGB)
+conversions.register_space(sRGB)
+conversions.register_space(HSV)
+conversions.register_space(HLS)
+conversions.register_space(hexcols, aliases = ["hex"])
+conversions.register_space(packedRGBA, aliases = ["packed"])
+
+conversions.register("polarLUV", "CIELUV",   _polarLUV_to_CIELUV_)
+conversions.register("CIELUV",   "polarLUV", _CIELUV_to_polarLUV_)
+conversions.register("CIELUV",   "CIEXYZ",   _CIELUV_to_CIEXYZ_)
+conversions.register("CIEXYZ",   "CIELUV",   _CIEXYZ_to_CIELUV_)
+conversions.register("CIEXYZ",   "CIELAB",   _CIEXYZ_to_CIELAB_)
+conversions.register("CIELAB",   "CIEXYZ",   _CIELAB_to_CIEXYZ_)
+conversions.register("CIELAB",   "polarLAB", _CIELAB_to_polarLAB_)
+conversions.register("polarLAB", "CIELAB",   _polarLAB_to_CIELAB_)
+conversions.register("CIEXYZ",   "RGB",      _CIEXYZ_to_RGB_)
+conversions.register("RGB",      "CIEXYZ",   _RGB_to_CIEXYZ_)
+conversions.register("RGB",      "sRGB",     _RGB_to_sRGB_)
+conversions.register("sRGB",     "RGB",      _sRGB_to_RGB_)
+conversions.register("RGB",      "HSV",      _RGB_to_HSV_)
+conversions.register("HSV",      "RGB",      _HSV_to_RGB_)
+conversions.register("RGB",      "HLS",      _RGB_to_HLS_)
+conversions.register("HLS",      "RGB",      _HLS_to_RGB_)
+conversions.register("sRGB",     "hex",      _sRGB_to_hex_, lossy = True, vectorized = False)
+conversions.register("hex",      "sRGB",     _hex_to_sRGB_)
+
+# Fused transformations, slightly cheaper than the four
+# (polarLUV <-> sRGB) and five (polarLUV -> hex) steps they replace
+# (and the paths using the 8-bit lookup tables below).
+# Use the compiled kernels if numba is available (see kernels.kernels).
+conversions.register("polarLUV", "sRGB",     _polarLUV_to_sRGB_, cost = 3.9)
+conversions.register("sRGB",     "polarLUV", _sRGB_to_polarLUV_, cost = 3.9)
+conversions.register("polarLUV", "hex",      _polarLUV_to_hex_,  cost = 4.7, lossy = True,
+                     vectorized = False)
+
+# 8-bit lookup tables instead of the gamma correction, cheaper
+# than the two steps via sRGB (see colorlib.hex_to_RGB).
+conversions.register("hex",      "RGB",      _hex_to_RGB_, cost = 1.8)
+conversions.register("RGB",      "hex",      _RGB_to_hex_, cost = 1.8, lossy = True,
+                     vectorized = False)
+
+# Lookup table followed by the fused RGB -> polarLUV kernel, cheaper than
+# the paths via RGB (lookup table, four steps) or sRGB (fused kernel).
+conversions.register("hex",      "polarLUV", _hex_to_polarLUV_, cost = 4.7)
+
+# Packed 8-bit colors: the same steps as for the hex colors
+# (exact conversions between hex and packed colors).
+conversions.register("packedRGBA", "sRGB",       _packedRGBA_to_sRGB_)
+conversions.register("sRGB",       "packedRGBA", _sRGB_to_packedRGBA_, lossy = True)
+conversions.register("packedRGBA", "hex",        _packedRGBA_to_hex_, vectorized = False)
+conversions.register("hex",        "packedRGBA", _hex_to_packedRGBA_)
+conversions.register("packedRGBA", "RGB",        _packedRGBA_to_RGB_, cost = 1.8)
+conversions.register("RGB",        "packedRGBA", _RGB_to_packedRGBA_, cost = 1.8, lossy = True)
+conversions.register("polarLUV",   "packedRGBA", _polarLUV_to_packedRGBA_, cost = 4.7, lossy = True)
+conversions.register("packedRGBA", "polarLUV",   _packedRGBA_to_polarLUV_, cost = 4.7)
+
+# HSV and HLS are device dependent, conversions from
+# and to the CIE based color spaces are ambiguous.
+conversions.register_ambiguous(["HSV", "HLS"],
+        ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "polarLAB"])
+conversions.register_ambiguous(["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "polarLAB"],
+        ["HSV", "HLS"])
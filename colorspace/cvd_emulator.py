@@ -93,21 +93,23 @@ def cvd_emulator(image = "DEMO", cvd = "desaturate", severity = 1.0,
     except Exception as e:
         raise Exception(str(e))
 
-    # Extracting colors (scale from [0,255] to [0.,1.])
+    # Extracting colors (scale from [0,255] to [0.,1.]). Single precision
+    # is sufficient for 8-bit images and halves the memory needed.
+    from numpy import divide
     data = {}
     if img.shape[2] == 3:
         [data["R"], data["G"], data["B"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2]]
+                [divide(img[:,:,i].flatten(), 255., dtype = "float32") for i in [0,1,2]]
     elif img.shape[2] == 4:
         [data["R"], data["G"], data["B"], data["alpha"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2,3]]
+                [divide(img[:,:,i].flatten(), 255., dtype = "float32") for i in [0,1,2,3]]
     
     # Create sRGB with or without
     from .colorlib import sRGB
     if not "alpha" in data.keys():
-        rgba = sRGB(data["R"], data["G"], data["B"])
+        rgba = sRGB(data["R"], data["G"], data["B"], dtype = "float32")
     else:
-        rgba = sRGB(data["R"], data["G"], data["B"], data["alpha"])
+        rgba = sRGB(data["R"], data["G"], data["B"], data["alpha"], dtype = "float32")
 
 
     # Drop alpha
@@ -0,0 +1,353 @@
+# """
+# Copyright 2005, Ross Ihaka. All Rights Reserved.
+# Ported to python: Copyright 2018, Reto Stauffer.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+# 
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+# 
+#    3. The name of the Ross Ihaka may not be used to endorse or promote
+#       products derived from this software without specific prior written
+#       permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE REGENTS AND CONTRIBUTORS ``AS IS''
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL ROSS IHAKA BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS
+# OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# """
+
+
+import math
+import numpy as np
+
+
+class kernelregistry(object):
+    """kernelregistry()
+
+    Registry of the (fused) conversion kernels used by the
+    :py:class:`colorlib.conversiongraph`.
+
+    Each kernel is registered with a vectorized NumPy implementation and,
+    optionally, a JIT compiled implementation fusing all steps into one
+    loop over the colors (compiled with `numba`). If `numba` can be
+    imported the compiled kernels are used (``backend = "auto"``, compiled
+    on first use and cached on disk), else the NumPy implementations.
+    The compiled kernels agree with the NumPy implementations up to
+    floating point rounding.
+
+    The package registers its kernels on the module level instance
+    ``kernels.kernels``.
+
+    Examples
+    --------
+    >>> from colorspace.kernels import kernels
+    >>> kernels.get_backend()
+    >>> kernels.get_backend("polarLUV_to_sRGB")
+    >>> kernels.set_backend("numpy")
+    """
+
+    # Backend: "auto" (numba if available), "numpy", or "numba"
+    _backend_ = "auto"
+
+    def __init__(self):
+
+        self._kernels_  = {} # Name -> dict (backend -> kernel or factory)
+        self._compiled_ = {} # Name -> compiled kernel (numba)
+        self._numba_    = None
+
+    def register(self, name, numpy, numba = None):
+        """register(name, numpy, numba = None)
+
+        Register a new kernel.
+
+        Parameters
+        ----------
+        name : str
+            name of the kernel
+        numpy : function
+            the vectorized NumPy implementation
+        numba : None or function
+            factory ``numba(njit)`` returning the implementation based on JIT
+            compiled functions (``njit`` is the ``numba.njit`` decorator with
+            the options of the package; the functions should be defined on
+            the module level to be cached on disk). Called once on first
+            use if `numba` is available. Has to have the same signature as
+            the NumPy implementation.
+        """
+        self._kernels_[name] = {"numpy" : numpy, "numba" : numba}
+        self._compiled_.pop(name, None)
+
+    def kernels(self):
+        """kernels()
+
+        Returns
+        -------
+        list
+            Returns a list with the names of all registered kernels.
+        """
+        return list(self._kernels_.keys())
+
+    def has_numba(self):
+        """has_numba()
+
+        Returns
+        -------
+        bool
+            Returns ``True`` if `numba` can be imported.
+        """
+        if self._numba_ is None:
+            try:
+                import numba
+                self._numba_ = True
+            except ImportError:
+                self._numba_ = False
+        return self._numba_
+
+    def set_backend(self, backend):
+        """set_backend(backend)
+
+        Sets the backend of the kernels.
+
+        Parameters
+        ----------
+        backend : str
+            ``"auto"`` (`numba` if available, else NumPy), ``"numpy"``, or
+            ``"numba"``. Raises a ValueError if `numba` is requested but
+            not available.
+        """
+        if not backend in ["auto", "numpy", "numba"]:
+            raise ValueError("backend has to be \"auto\", \"numpy\", or \"numba\", " + \
+                             "got \"{:s}\"".format(str(backend)))
+        if backend == "numba" and not self.has_numba():
+            raise ValueError("backend \"numba\" requested but numba cannot be imported")
+        self._backend_ = backend
+
+    def get_backend(self, name = None):
+        """get_backend(name = None)
+
+        Returns the backend in use.
+
+        Parameters
+        ----------
+        name : None or str
+            name of a kernel. If set, the backend used for this kernel is
+            returned (kernels without compiled implementation always use NumPy).
+
+        Returns
+        -------
+        str
+            Returns ``"numba"`` or ``"numpy"``.
+        """
+        backend = "numpy" if self._backend_ == "numpy" or not self.has_numba() else "numba"
+        if not name is None and self._kernels_[name]["numba"] is None:
+            backend = "numpy"
+        return backend
+
+    def get(self, name):
+        """get(name)
+
+        Returns the kernel ``name`` for the backend in use (see :py:func:`get_backend`).
+
+        Parameters
+        ----------
+        name : str
+            name of the kernel
+
+        Returns
+        -------
+        function
+            Returns the kernel.
+        """
+        if not name in self._kernels_:
+            raise ValueError("no kernel \"{:s}\" registered".format(str(name)))
+        if self.get_backend(name) == "numpy":
+            return self._kernels_[name]["numpy"]
+        if not name in self._compiled_:
+            import numba
+            njit = numba.njit(cache = True, nogil = True)
+            self._compiled_[name] = self._kernels_[name]["numba"](njit)
+        return self._compiled_[name]
+
+
+# -------------------------------------------------------------------
+# Kernels transforming between sRGB (or linear RGB) and polarLUV (HCL).
+# fun(clib, a, b, c, XN, YN, ZN, gamma, out = None) -> [x, y, z]
+# -------------------------------------------------------------------
+def _sRGB_to_polarLUV_numpy_(clib, R, G, B, XN = None, YN = None, ZN = None,
+                             gamma = 2.4, out = None):
+    return clib.sRGB_to_polarLUV(R, G, B, XN, YN, ZN, gamma = gamma, out = out)
+
+def _polarLUV_to_sRGB_numpy_(clib, L, C, H, XN = None, YN = None, ZN = None,
+                             gamma = 2.4, out = None):
+    return clib.polarLUV_to_sRGB(L, C, H, XN, YN, ZN, gamma = gamma, out = out)
+
+def _RGB_to_polarLUV_numpy_(clib, R, G, B, XN = None, YN = None, ZN = None,
+                            gamma = 2.4, out = None):
+    # Linear RGB (e.g., from the 8-bit lookup tables), gamma is not used
+    n   = len(R)
+    xyz = clib._columns_("RGB_to_polarLUV.XYZ", n)
+    luv = clib._columns_("RGB_to_polarLUV.LUV", n)
+    clib.RGB_to_XYZ(R, G, B, XN = XN, YN = YN, ZN = ZN, out = xyz)
+    clib.XYZ_to_LUV(*xyz, XN = XN, YN = YN, ZN = ZN, out = luv)
+    return clib.LUV_to_polarLUV(*luv, out = out)
+
+# Lower bound of L used to avoid divisions by zero, see colorlib.LUV_to_XYZ
+_LMIN_ = np.finfo(float).eps * 10
+
+def _fused_(clib, __fname__, loop, M, cols, XN, YN, ZN, gamma, out):
+    """_fused_(clib, __fname__, loop, M, cols, XN, YN, ZN, gamma, out)
+
+    Prepares the inputs of a compiled loop (white point, gamma, and the
+    result arrays) and calls it. White point and gamma are passed as
+    arrays of length one or one value per color.
+
+    Returns
+    -------
+    list
+        List of three `numpy.ndarray`'s (``out`` if specified).
+    """
+    if clib.validate: clib._check_input_arrays_(__fname__, **cols)
+    cols = [np.asarray(x, dtype = clib.dtype) for x in cols.values()]
+    n    = len(cols[0])
+
+    [uN, vN]     = clib._white_uv_(XN, YN, ZN)
+    [XN, YN, ZN] = clib._get_white_(__fname__, n, XN, YN, ZN)
+    gamma = clib._check_gamma_(__fname__, cols[0], gamma)
+    if out is None:
+        res = np.empty((n, 3), dtype = clib.dtype)
+        out = [res[:,0], res[:,1], res[:,2]]
+    else:
+        out = clib._out_(__fname__, out, n)
+
+    [YN, uN, vN, gamma] = [np.asarray(x, dtype = "float").reshape(-1) for x in [YN, uN, vN, gamma]]
+    loop(*cols, YN, uN, vN, gamma, M, clib.EPSILON, clib.KAPPA, *out)
+    return list(out)
+
+# Fused loops over all colors, the inverse of each other. Compiled with
+# numba.njit by the factories below, the formulas follow the vectorized
+# colorlib methods step by step.
+def _sRGB_to_polarLUV_loop_(R, G, B, YN, uN, vN, gamma, M, EPSILON, KAPPA, L, C, H):
+    for i in range(R.shape[0]):
+        yn  = YN[0]    if YN.shape[0]    == 1 else YN[i]
+        un  = uN[0]    if uN.shape[0]    == 1 else uN[i]
+        vn  = vN[0]    if vN.shape[0]    == 1 else vN[i]
+        gam = gamma[0] if gamma.shape[0] == 1 else gamma[i]
+        # sRGB -> RGB (ftrans) -> CIEXYZ
+        r = R[i]; r = ((r + 0.055) / 1.055)**gam if r > 0.03928 else r / 12.92
+        g = G[i]; g = ((g + 0.055) / 1.055)**gam if g > 0.03928 else g / 12.92
+        b = B[i]; b = ((b + 0.055) / 1.055)**gam if b > 0.03928 else b / 12.92
+        X = (M[0,0] * r + M[0,1] * g + M[0,2] * b) * yn
+        Y = (M[1,0] * r + M[1,1] * g + M[1,2] * b) * yn
+        Z = (M[2,0] * r + M[2,1] * g + M[2,2] * b) * yn
+        # CIEXYZ -> CIELUV
+        t = X + Y + Z
+        x = X / t if t != 0. else 0.
+        y = Y / t if t != 0. else 0.
+        t = 6. * y - x + 1.5
+        f = Y / yn
+        f = f**(1. / 3.) if f > EPSILON else f * (KAPPA / 116.) + 16. / 116.
+        l = 116. * f - 16.
+        U = (2.0 * x / t - un) * l * 13.
+        V = (4.5 * y / t - vn) * l * 13.
+        # CIELUV -> polarLUV
+        L[i] = l
+        C[i] = math.hypot(U, V)
+        H[i] = (math.atan2(V, U) * (180. / math.pi)) % 360.
+
+def _RGB_to_polarLUV_loop_(R, G, B, YN, uN, vN, gamma, M, EPSILON, KAPPA, L, C, H):
+    # Same as _sRGB_to_polarLUV_loop_ without the gamma correction
+    for i in range(R.shape[0]):
+        yn  = YN[0]    if YN.shape[0]    == 1 else YN[i]
+        un  = uN[0]    if uN.shape[0]    == 1 else uN[i]
+        vn  = vN[0]    if vN.shape[0]    == 1 else vN[i]
+        # RGB -> CIEXYZ
+        r = R[i]; g = G[i]; b = B[i]
+        X = (M[0,0] * r + M[0,1] * g + M[0,2] * b) * yn
+        Y = (M[1,0] * r + M[1,1] * g + M[1,2] * b) * yn
+        Z = (M[2,0] * r + M[2,1] * g + M[2,2] * b) * yn
+        # CIEXYZ -> CIELUV
+        t = X + Y + Z
+        x = X / t if t != 0. else 0.
+        y = Y / t if t != 0. else 0.
+        t = 6. * y - x + 1.5
+        f = Y / yn
+        f = f**(1. / 3.) if f > EPSILON else f * (KAPPA / 116.) + 16. / 116.
+        l = 116. * f - 16.
+        U = (2.0 * x / t - un) * l * 13.
+        V = (4.5 * y / t - vn) * l * 13.
+        # CIELUV -> polarLUV
+        L[i] = l
+        C[i] = math.hypot(U, V)
+        H[i] = (math.atan2(V, U) * (180. / math.pi)) % 360.
+
+def _polarLUV_to_sRGB_loop_(L, C, H, YN, uN, vN, gamma, M, EPSILON, KAPPA, R, G, B):
+    for i in range(L.shape[0]):
+        yn  = YN[0]    if YN.shape[0]    == 1 else YN[i]
+        un  = uN[0]    if uN.shape[0]    == 1 else uN[i]
+        vn  = vN[0]    if vN.shape[0]    == 1 else vN[i]
+        gam = gamma[0] if gamma.shape[0] == 1 else gamma[i]
+        # polarLUV -> CIELUV
+        l = L[i]
+        h = H[i] * (math.pi / 180.)
+        U = math.cos(h) * C[i]
+        V = math.sin(h) * C[i]
+        # CIELUV -> CIEXYZ, Y is zero for black
+        f = (l + 16.) / 116.
+        Y = f**3.
+        Y = yn * (Y if Y > EPSILON else (f - 16. / 116.) / (KAPPA / 116.))
+        if l <= 0. and U == 0. and V == 0.: Y = 0.
+        t = (l if l > _LMIN_ else _LMIN_) * 13.
+        u = U / t + un
+        v = V / t + vn
+        X = Y * u * 9. / 4. / v
+        Z = Y / v * 3. - Y * 5. - X / 3.
+        # CIEXYZ -> RGB -> sRGB (gtrans)
+        r = (M[0,0] * X + M[0,1] * Y + M[0,2] * Z) / yn
+        g = (M[1,0] * X + M[1,1] * Y + M[1,2] * Z) / yn
+        b = (M[2,0] * X + M[2,1] * Y + M[2,2] * Z) / yn
+        R[i] = 1.055 * r**(1. / gam) - 0.055 if r > 0.00304 else 12.92 * r
+        G[i] = 1.055 * g**(1. / gam) - 0.055 if g > 0.00304 else 12.92 * g
+        B[i] = 1.055 * b**(1. / gam) - 0.055 if b > 0.00304 else 12.92 * b
+
+def _sRGB_to_polarLUV_numba_(njit):
+    loop = njit(_sRGB_to_polarLUV_loop_)
+    def kernel(clib, R, G, B, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        return _fused_(clib, "sRGB_to_polarLUV", loop, clib._RGB_TO_XYZ_,
+                       {"R" : R, "G" : G, "B" : B}, XN, YN, ZN, gamma, out)
+    return kernel
+
+def _RGB_to_polarLUV_numba_(njit):
+    loop = njit(_RGB_to_polarLUV_loop_)
+    def kernel(clib, R, G, B, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        return _fused_(clib, "RGB_to_polarLUV", loop, clib._RGB_TO_XYZ_,
+                       {"R" : R, "G" : G, "B" : B}, XN, YN, ZN, gamma, out)
+    return kernel
+
+def _polarLUV_to_sRGB_numba_(njit):
+    loop = njit(_polarLUV_to_sRGB_loop_)
+    def kernel(clib, L, C, H, XN = None, YN = None, ZN = None, gamma = 2.4, out = None):
+        return _fused_(clib, "polarLUV_to_sRGB", loop, clib._XYZ_TO_RGB_,
+                       {"L" : L, "C" : C, "H" : H}, XN, YN, ZN, gamma, out)
+    return kernel
+
+
+# Kernels provided by the package
+kernels = kernelregistry()
+
+kernels.register("sRGB_to_polarLUV", _sRGB_to_polarLUV_numpy_, _sRGB_to_polarLUV_numba_)
+kernels.register("polarLUV_to_sRGB", _polarLUV_to_sRGB_numpy_, _polarLUV_to_sRGB_numba_)
+kernels.register("RGB_to_polarLUV",  _RGB_to_polarLUV_numpy_,  _RGB_to_polarLUV_numba_)
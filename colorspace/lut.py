@@ -0,0 +1,331 @@
+# """
+# Copyright 2005, Ross Ihaka. All Rights Reserved.
+# Ported to python: Copyright 2018, Reto Stauffer.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+# 
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+# 
+#    3. The name of the Ross Ihaka may not be used to endorse or promote
+#       products derived from this software without specific prior written
+#       permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE REGENTS AND CONTRIBUTORS ``AS IS''
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL ROSS IHAKA BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS
+# OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# """
+
+
+import os
+import json
+import numpy as np
+
+
+class hcllut(object):
+    """hcllut(path, XN = None, YN = None, ZN = None, gamma = 2.4)
+
+    Precomputed lookup table for the conversion of 24-bit sRGB colors
+    (``uint8`` images, hex colors) to HCL (polarLUV).
+
+    The table contains the hue, chroma, and luminance of all ``2^24``
+    sRGB colors as ``float32`` (about 200 MB) and is computed once with
+    the formulas of :py:class:`colorlib.colorlib` (see :py:func:`build`).
+    The file is opened as a memory map (`numpy.memmap`, read-only): only
+    the pages in use are loaded, and all processes using the same file
+    share the page cache. Converting a pixel is a lookup of the packed
+    index ``R * 65536 + G * 256 + B``.
+
+    The file stores a version stamp with the white point and gamma used
+    to compute the table; opening a table computed for another white
+    point or gamma raises a ValueError.
+
+    Parameters
+    ----------
+    path : str
+        name of the table file, see :py:func:`build`
+    XN, YN, ZN : None or float
+        chromaticity of the white point the table has to be computed for,
+        if ``None`` the defaults of :py:class:`colorlib.colorlib` are used
+    gamma : float
+        gamma the table has to be computed for
+
+    Examples
+    --------
+    >>> from colorspace.lut import hcllut, build
+    >>> build("srgb_hcl.lut")
+    >>> lut = hcllut("srgb_hcl.lut")
+    >>> [H, C, L] = lut.image_to_HCL(img)
+
+    The table can also be built and verified on the command line:
+
+    >>> python -m colorspace.lut build srgb_hcl.lut
+    >>> python -m colorspace.lut verify srgb_hcl.lut
+    """
+
+    def __init__(self, path, XN = None, YN = None, ZN = None, gamma = 2.4):
+
+        stamp = _read_stamp_(path)
+        want  = _stamp_(XN, YN, ZN, gamma)
+        if not [stamp.get(x) for x in ["format", "version", "white", "gamma"]] == \
+               [want.get(x) for x in ["format", "version", "white", "gamma"]]:
+            raise ValueError("lookup table \"{:s}\" was computed for ".format(path) + \
+                    "white point {:s}, gamma {:s} (version {:s}); ".format(
+                        str(stamp.get("white")), str(stamp.get("gamma")), str(stamp.get("version"))) + \
+                    "expected white point {:s}, gamma {:s} (version {:d}), rebuild the table".format(
+                        str(want["white"]), str(want["gamma"]), want["version"]))
+
+        self.path    = path
+        self.stamp   = stamp
+        self._table_ = np.memmap(path, dtype = _DTYPE_, mode = "r",
+                                 offset = _HEADER_, shape = (_N_, 3))
+
+    def __repr__(self):
+        return "<hcllut \"{:s}\": white point {:s}, gamma {:s}>".format(
+                self.path, str(self.stamp["white"]), str(self.stamp["gamma"]))
+
+    def lookup(self, R, G, B):
+        """lookup(R, G, B)
+
+        Looks up the HCL coordinates of 8-bit sRGB colors.
+
+        Parameters
+        ----------
+        R, G, B : numpy.ndarray
+            integer arrays (e.g., ``uint8``) of the same shape with the
+            red, green, and blue intensities (``0`` to ``255``, raises a
+            ValueError if out of range)
+
+        Returns
+        -------
+        list
+            Returns a list of ``float32`` `numpy.ndarray`'s of the same shape
+            as the inputs (``[H, C, L]``).
+        """
+        [R, G, B] = [np.asarray(x) for x in [R, G, B]]
+        if not R.shape == G.shape == B.shape:
+            raise ValueError("inputs R, G, and B to lookup have to be of the same shape")
+        for key,x in zip(["R", "G", "B"], [R, G, B]):
+            if not x.dtype.kind in "iub":
+                raise ValueError("input {:s} to lookup has to be an integer array".format(key))
+            if not x.dtype == np.uint8 and x.size > 0 and (np.min(x) < 0 or np.max(x) > 255):
+                raise ValueError("wrong values specified for input {:s} to lookup: ".format(key) + \
+                                 "values have to lie within [0, 255]")
+        idx = R.astype("int32") << 16
+        idx |= G.astype("int32") << 8
+        idx |= B
+        res = self._table_.view(np.ndarray)[idx.reshape(-1)]
+        return [res[:,i].reshape(R.shape) for i in range(3)]
+
+    def image_to_HCL(self, img):
+        """image_to_HCL(img)
+
+        Pixel image to HCL (polarLUV), see :py:func:`colorlib.image_to_HCL`.
+
+        Parameters
+        ----------
+        img : numpy.ndarray
+            ``uint8`` image of shape ``(height, width, 3)`` or
+            ``(height, width, 4)`` (the alpha channel is ignored)
+
+        Returns
+        -------
+        list
+            Returns a list of ``float32`` `numpy.ndarrays` (``[H, C, L]``),
+            each of shape ``(height, width)``.
+        """
+        img = np.asarray(img)
+        if not img.dtype == np.uint8 or not img.ndim == 3 or not img.shape[2] in [3, 4]:
+            raise ValueError("input img to image_to_HCL has to be an uint8 array of " + \
+                    "shape (height, width, 3) or (height, width, 4)")
+        return self.lookup(img[:,:,0], img[:,:,1], img[:,:,2])
+
+
+# Layout of the table file: a header (JSON version stamp, padded to
+# _HEADER_ bytes) followed by 2^24 rows of float32 H, C, and L.
+_FORMAT_  = "colorspace.lut.hcllut"
+_VERSION_ = 1
+_HEADER_  = 4096
+_N_       = 2**24
+_DTYPE_   = np.dtype("<f4")
+
+def _stamp_(XN = None, YN = None, ZN = None, gamma = 2.4):
+    """_stamp_(XN = None, YN = None, ZN = None, gamma = 2.4)
+
+    Returns the version stamp (dict) of a table for the given
+    white point and gamma.
+    """
+    from .colorlib import colorlib
+    white = [float(np.asarray(colorlib.XN if XN is None else XN).flatten()[0]),
+             float(np.asarray(colorlib.YN if YN is None else YN).flatten()[0]),
+             float(np.asarray(colorlib.ZN if ZN is None else ZN).flatten()[0])]
+    return {"format" : _FORMAT_, "version" : _VERSION_, "white" : white,
+            "gamma" : float(gamma), "dtype" : _DTYPE_.str, "columns" : ["H", "C", "L"]}
+
+def _read_stamp_(path):
+    """_read_stamp_(path)
+
+    Reads the version stamp of a table file, raises a ValueError
+    if the file is no (complete) table.
+    """
+    with open(path, "rb") as fid:
+        head = fid.read(_HEADER_)
+    try:
+        stamp = json.loads(head.rstrip(b"\0").decode("ascii"))
+    except ValueError:
+        stamp = {}
+    if not isinstance(stamp, dict) or not stamp.get("format") == _FORMAT_:
+        raise ValueError("file \"{:s}\" is not an HCL lookup table".format(path))
+    if not os.path.getsize(path) == _HEADER_ + _N_ * 3 * _DTYPE_.itemsize:
+        raise ValueError("lookup table \"{:s}\" is incomplete, rebuild the table".format(path))
+    return stamp
+
+def _compute_(idx, XN, YN, ZN, gamma, workspace = None):
+    """_compute_(idx, XN, YN, ZN, gamma, workspace = None)
+
+    Computes the HCL coordinates of the 24-bit colors ``idx`` (packed
+    indices) with :py:func:`colorlib.image_to_HCL` (double precision).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(len(idx), 3)`` (``H``, ``C``, ``L``).
+    """
+    from .colorlib import colorlib
+    idx = np.asarray(idx, dtype = "int32")
+    img = np.empty((1, len(idx), 3), dtype = "uint8")
+    for i,shift in enumerate([16, 8, 0]): img[0,:,i] = (idx >> shift) & 255
+    white = [None if x is None else np.asarray([x], dtype = "float") for x in [XN, YN, ZN]]
+    res   = colorlib(validate = False, workspace = workspace).image_to_HCL(img, *white, gamma = gamma)
+    return np.stack([x.reshape(-1) for x in res], axis = 1)
+
+def build(path, XN = None, YN = None, ZN = None, gamma = 2.4, chunksize = 2**20):
+    """build(path, XN = None, YN = None, ZN = None, gamma = 2.4, chunksize = 2**20)
+
+    Computes the lookup table of all 24-bit sRGB colors and writes
+    it to ``path`` (about 200 MB), see :py:class:`hcllut`.
+    The table is written to a temporary file first and renamed
+    when complete, processes opening the table never see a partial file.
+
+    Parameters
+    ----------
+    path : str
+        name of the table file
+    XN, YN, ZN : None or float
+        chromaticity of the white point, if ``None`` the defaults
+        of :py:class:`colorlib.colorlib` are used
+    gamma : float
+        gamma used to linearize the sRGB colors
+    chunksize : int
+        number of colors computed at once
+
+    Returns
+    -------
+    dict
+        Returns the version stamp of the table.
+    """
+    from .colorlib import workspace
+    if XN is None and YN is None and ZN is None:
+        stamp = _stamp_(gamma = gamma)
+    elif XN is None or YN is None or ZN is None:
+        raise ValueError("white point has to be specified completely (XN, YN, and ZN) or not at all")
+    else:
+        stamp = _stamp_(XN, YN, ZN, gamma)
+    head  = json.dumps(stamp).encode("ascii")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fid:
+        fid.write(head + b"\0" * (_HEADER_ - len(head)))
+        fid.truncate(_HEADER_ + _N_ * 3 * _DTYPE_.itemsize)
+    try:
+        table = np.memmap(tmp, dtype = _DTYPE_, mode = "r+", offset = _HEADER_, shape = (_N_, 3))
+        ws    = workspace()
+        for a in range(0, _N_, int(chunksize)):
+            b = min(a + int(chunksize), _N_)
+            table[a:b] = _compute_(np.arange(a, b), XN, YN, ZN, gamma, ws)
+        table.flush()
+        del table
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.isfile(tmp): os.remove(tmp)
+        raise
+    return stamp
+
+def verify(path, sample = None, atol = 1e-3, chunksize = 2**20):
+    """verify(path, sample = None, atol = 1e-3, chunksize = 2**20)
+
+    Verifies a lookup table: recomputes the coordinates with the white
+    point and gamma of the version stamp and compares them to the table
+    (the hue modulo ``360``).
+
+    Parameters
+    ----------
+    path : str
+        name of the table file
+    sample : None or int
+        if ``None`` all colors are checked, else a random sample
+        of ``sample`` colors
+    atol : float
+        absolute tolerance (the table is stored in single precision)
+    chunksize : int
+        number of colors checked at once
+
+    Returns
+    -------
+    float
+        Returns the largest absolute difference, raises a ValueError
+        if larger than ``atol``.
+    """
+    stamp = _read_stamp_(path)
+    lut   = hcllut(path, *stamp["white"], gamma = stamp["gamma"])
+    if sample is None:
+        idx = np.arange(_N_)
+    else:
+        idx = np.sort(np.random.choice(_N_, int(sample), replace = False))
+
+    err = 0.
+    for a in range(0, len(idx), int(chunksize)):
+        i    = idx[a:a + int(chunksize)]
+        want = _compute_(i, *stamp["white"], gamma = stamp["gamma"])
+        diff = np.abs(lut._table_[i] - want)
+        diff[:,0] = np.minimum(diff[:,0], 360. - diff[:,0])
+        err = max(err, float(np.nanmax(diff)) if diff.size > 0 else 0.)
+    if err > atol:
+        raise ValueError("lookup table \"{:s}\" differs from colorlib ".format(path) + \
+                "(largest absolute difference {:.3g}), rebuild the table".format(err))
+    return err
+
+
+if __name__ == "__main__":
+
+    import argparse
+    parser = argparse.ArgumentParser(prog = "python -m colorspace.lut",
+            description = "Build or verify the 24-bit sRGB to HCL lookup table.")
+    parser.add_argument("command", choices = ["build", "verify"])
+    parser.add_argument("path", help = "name of the table file")
+    parser.add_argument("--white", type = float, nargs = 3, default = None,
+            metavar = ("XN", "YN", "ZN"), help = "white point (build)")
+    parser.add_argument("--gamma", type = float, default = 2.4, help = "gamma (build)")
+    parser.add_argument("--sample", type = int, default = None,
+            help = "number of randomly drawn colors to check (verify), default all")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        white = [None] * 3 if args.white is None else args.white
+        print(build(args.path, *white, gamma = args.gamma))
+    else:
+        print("ok, largest absolute difference {:.3g}".format(verify(args.path, args.sample)))
@@ -1809,7 +1809,7 @@ class diverging_hsv(hclpalette):
         # _checkinput_ parameters (in the correct order):
         # dtype, length = None, recycle = False, nansallowed = False, **kwargs
         try:
-            h     = self._checkinput_(int,   2, True,  False, h = h)
+            h     = self._checkinput_(int,   2, 2, True,  False, h = h)
             s     = self._checkinput_(float, 1, False, False, s = s)
             v     = self._checkinput_(float, 1, False, False, v = v)
             power = self._checkinput_(float, 1, True,  False, power = power)
@@ -1854,14 +1854,11 @@ class diverging_hsv(hclpalette):
             to explicitly control the fixup here.
         """
 
-        from numpy import linspace, power, abs, repeat
-        from numpy import ndarray, ndenumerate
+        from numpy import linspace, power, abs, repeat, where
 
         # Calculate palette
         rval = linspace(-self.get("s"), self.get("s"), n)
-        H = ndarray(n, dtype = "float")
-        for i,val in ndenumerate(rval):
-            H[i] = self.get("h1") if val > 0 else self.get("h2")
+        H = where(rval > 0, float(self.get("h1")), float(self.get("h2")))
         S = power(abs(rval), self.get("power"))
         V = repeat(self.get("v"), n)
 
@@ -98,10 +98,11 @@ def specplot(hex_, hcl = True, palette = True, fix = True, rgb = False, **kwargs
     # can occur due to the HCL->RGB transformation.
     def fixcoords(x):
 
+        import numpy as np
         [H, C, L] = x
+        H = np.array(H) # Copy, modified below
         n = len(H) # Number of colors
         # Fixing spikes
-        import numpy as np
         for i in range(1,n):
             d = H[i] - H[i - 1]
             if np.abs(d) > 320.:    H[i]   = H[i]       - np.sign(d) * 360.
@@ -1,5 +1,6 @@
 
 # Loading package
+import numpy as np
 from colorspace import *
 from colorspace.colorlib import *
 
@@ -13,3 +14,287 @@ print(cols)
 cols.to("hex")
 print(cols)
 
+
+# Concatenate colors of mixed origin (constructor and conversion)
+red = polarLUV.concat([polarLUV(H = [0.], C = [50.], L = [60.]), hexcols(["#FF0000"])])
+print(red)
+if not abs(red.get("L")[1] - 53.24) < 0.01 or not abs(red.get("H")[1] - 12.17) < 0.01:
+    raise ValueError("concat mixed up the coordinates of the color objects")
+
+# Round trip through hex colors gives the same as a new hexcols object
+cols = HCL([0., 120.], [200., 50.], [50., 70.])
+cols.to("hex")
+ref = hexcols(cols.colors())
+ref.to("HCL")
+cols.to("HCL")
+if not np.allclose(cols.get("C"), ref.get("C")) or not np.allclose(cols.get("H"), ref.get("H")):
+    raise ValueError("round trip through hex colors differs from a new hexcols object")
+
+# Hex and packed colors are converted to HCL by one fused kernel
+for x in ["hex", "packedRGBA"]:
+    if not conversions.path(x, "HCL") == ["polarLUV"]:
+        raise ValueError("{:s} to HCL does not use the fused kernel".format(x))
+
+# HCL lookup table: build, verify a sample, and reject out-of-range inputs
+import os, tempfile
+from colorspace.lut import hcllut, build, verify
+with tempfile.TemporaryDirectory() as tmp:
+    build(os.path.join(tmp, "srgb_hcl.lut"))
+    verify(os.path.join(tmp, "srgb_hcl.lut"), sample = 10000)
+    lut = hcllut(os.path.join(tmp, "srgb_hcl.lut"))
+    [H, C, L] = lut.lookup(np.array([255]), np.array([0]), np.array([0]))
+    if not abs(H[0] - 12.17) < 0.01 or not abs(L[0] - 53.24) < 0.01:
+        raise ValueError("lookup table returns wrong HCL coordinates")
+    try:
+        lut.lookup(np.array([256]), np.array([0]), np.array([0]))
+        raise Exception("lookup accepted an out-of-range input")
+    except ValueError:
+        pass
+    del lut
+
+# Gamma correction: vectorized gtrans/ftrans agree with the scalar formulas
+clib = colorlib()
+u    = np.linspace(0., 1., 101)
+ref  = [1.055 * x**(1. / 2.4) - 0.055 if x > 0.00304 else 12.92 * x for x in u]
+if not np.allclose(clib.gtrans(u.copy(), 2.4), ref):
+    raise ValueError("gtrans differs from the scalar formula")
+ref  = [((x + 0.055) / 1.055)**2.4 if x > 0.03928 else x / 12.92 for x in u]
+if not np.allclose(clib.ftrans(u.copy(), 2.4), ref):
+    raise ValueError("ftrans differs from the scalar formula")
+
+# HSV and HLS agree with the colorsys module of the standard library
+import colorsys
+rgb = np.random.RandomState(2).uniform(0., 1., (3, 50))
+[H, S, V] = colorlib().RGB_to_HSV(*rgb)
+[h, l, s] = colorlib().RGB_to_HLS(*rgb)
+for i in range(rgb.shape[1]):
+    x = colorsys.rgb_to_hsv(*rgb[:,i])
+    y = colorsys.rgb_to_hls(*rgb[:,i])
+    if not np.allclose([H[i] / 360., S[i], V[i]], x) or not np.allclose([h[i] / 360., l[i], s[i]], y):
+        raise ValueError("RGB_to_HSV/RGB_to_HLS differ from colorsys")
+if not np.allclose(colorlib().HSV_to_RGB(H, S, V), rgb) or \
+   not np.allclose(colorlib().HLS_to_RGB(h, l, s), rgb):
+    raise ValueError("HSV_to_RGB/HLS_to_RGB are not the inverse of RGB_to_HSV/RGB_to_HLS")
+
+# CIELAB: the white point is L = 100, A = B = 0; round trips
+clib = colorlib()
+xyz  = [np.array([95.047, 20., 50.]), np.array([100., 30., 10.]), np.array([108.883, 10., 70.])]
+[L, A, B] = clib.XYZ_to_LAB(*xyz)
+if not np.allclose([L[0], A[0], B[0]], [100., 0., 0.]):
+    raise ValueError("XYZ_to_LAB of the white point is not L = 100, A = B = 0")
+if not np.allclose(clib.LAB_to_XYZ(L, A, B), xyz):
+    raise ValueError("LAB_to_XYZ is not the inverse of XYZ_to_LAB")
+[pL, C, H] = clib.LAB_to_polarLAB(L, A, B)
+if not np.allclose(C, np.hypot(A, B)) or not np.allclose(H, np.degrees(np.arctan2(B, A)) % 360.):
+    raise ValueError("LAB_to_polarLAB differs from the polar coordinates")
+if not np.allclose(clib.polarLAB_to_LAB(pL, C, H), [L, A, B]):
+    raise ValueError("polarLAB_to_LAB is not the inverse of LAB_to_polarLAB")
+
+# CIELUV and polarLUV: pure red is H = 12.17, C = 179.04, L = 53.24; round trips
+clib = colorlib()
+[X, Y, Z] = clib.sRGB_to_XYZ(np.array([1., .2]), np.array([0., .5]), np.array([0., .9]))
+[L, U, V] = clib.XYZ_to_LUV(X, Y, Z)
+if not np.allclose(clib.LUV_to_XYZ(L, U, V), [X, Y, Z]):
+    raise ValueError("LUV_to_XYZ is not the inverse of XYZ_to_LUV")
+[L, C, H] = clib.LUV_to_polarLUV(L, U, V)
+if not np.allclose([H[0], C[0], L[0]], [12.17, 179.04, 53.24], atol = 0.01):
+    raise ValueError("wrong polarLUV coordinates of pure red")
+if not np.allclose(clib.polarLUV_to_LUV(L, C, H), clib.XYZ_to_LUV(X, Y, Z)):
+    raise ValueError("polarLUV_to_LUV is not the inverse of LUV_to_polarLUV")
+
+# Fused polarLUV -> sRGB/hex agree with the individual steps
+clib = colorlib()
+hcl  = [np.array([70., 50., 30.]), np.array([35., 60., 20.]), np.array([20., 140., 260.])]
+ref  = clib.XYZ_to_sRGB(*clib.LUV_to_XYZ(*clib.polarLUV_to_LUV(*hcl)))
+if not np.allclose(clib.polarLUV_to_sRGB(*hcl), ref):
+    raise ValueError("polarLUV_to_sRGB differs from the individual steps")
+if not list(clib.polarLUV_to_hex(*hcl)) == list(clib.sRGB_to_hex(*ref)):
+    raise ValueError("polarLUV_to_hex differs from the individual steps")
+
+# Image ingestion: uint8 images to HCL planes
+img  = np.random.RandomState(6).randint(0, 256, (4, 5, 3)).astype("uint8")
+hcl  = colorlib().image_to_HCL(img)
+ref  = colorlib().sRGB_to_polarLUV(*[img[:,:,i].reshape(-1) / 255. for i in range(3)])
+if not np.all([x.shape == (4, 5) for x in hcl]) or \
+   not np.allclose([x.reshape(-1) for x in hcl], [ref[2], ref[1], ref[0]]):
+    raise ValueError("image_to_HCL differs from sRGB_to_polarLUV")
+
+# Conversion graph: planned paths, ambiguous and unknown color spaces
+if not conversions.path("CIELAB", "polarLUV") == ["CIEXYZ", "CIELUV", "polarLUV"] or \
+   not conversions.path("HSV", "HCL") is None:
+    raise ValueError("unexpected paths planned by the conversion graph")
+cols = HSV([0., 120.], [1., .5], [1., .5])
+for to in ["HCL", "HCL", "foo"]:
+    try:
+        cols.to(to); converted = True
+    except Exception:
+        converted = False
+    if converted or not cols.__class__ is HSV:
+        raise ValueError("converted HSV to \"{:s}\"".format(to))
+
+# Coordinates are stored in one C-contiguous (n, 3) array
+cols = polarLUV(H = [0., 120., 240.], C = [50., 60., 70.], L = [30., 40., 50.])
+if not cols._coords_.shape == (3, 3) or not cols._coords_.flags.c_contiguous or \
+   not np.shares_memory(cols.get("C"), cols._coords_) or not list(cols.get("C")) == [50., 60., 70.]:
+    raise ValueError("coordinates not stored in one (n, 3) array")
+
+# validate = False gives the same results without checking the inputs
+rgb = np.random.RandomState(9).uniform(0., 1., (3, 20))
+if not np.array_equal(colorlib(validate = False).sRGB_to_polarLUV(*rgb), colorlib().sRGB_to_polarLUV(*rgb)):
+    raise ValueError("validate = False changes the results")
+try:
+    colorlib().RGB_to_HSV(rgb[0], rgb[1], rgb[2][:5])
+    raise Exception("inputs of different lengths accepted")
+except ValueError:
+    pass
+
+# out = buffers and workspaces: results stored in place, buffers reused
+ws   = workspace()
+clib = colorlib(validate = False, workspace = ws)
+out  = [np.empty(20) for i in range(3)]
+res  = clib.sRGB_to_polarLUV(*rgb, out = out)
+size = ws.nbytes()
+res2 = clib.sRGB_to_polarLUV(*rgb, out = out)
+if not np.all([x is y for x,y in zip(res, out)]) or not ws.nbytes() == size or \
+   not np.array_equal(res2, colorlib().sRGB_to_polarLUV(*rgb)):
+    raise ValueError("out = buffers or workspace not used")
+
+# float32 precision
+cols = sRGB(*rgb, dtype = "float32")
+cols.to("HCL")
+ref  = sRGB(*rgb)
+ref.to("HCL")
+if not cols._coords_.dtype == np.float32 or not np.allclose(cols.get("L"), ref.get("L"), atol = 1e-3):
+    raise ValueError("float32 conversion wrong")
+
+# Chunked conversions on threads give the same results as serial conversions
+rgb  = np.random.RandomState(12).uniform(0., 1., (3, 1001))
+cols = sRGB(*rgb)
+cols.to("HCL", workers = 3, chunksize = 100, backend = "thread")
+ref  = sRGB(*rgb)
+ref.to("HCL")
+if not np.array_equal(cols._coords_, ref._coords_):
+    raise ValueError("chunked conversion on threads differs from serial conversion")
+
+# Conversions on processes give the same results as serial conversions
+# (main guard: the processes may import this script)
+if __name__ == "__main__":
+    ref  = sRGB(*rgb)
+    ref.to("hex")
+    for backend in ["process", "auto"]:
+        cols = sRGB(*rgb)
+        cols.to("hex", workers = 2, chunksize = 300, backend = backend)
+        if not cols._coords_.dtype == ref._coords_.dtype or not np.array_equal(cols._coords_, ref._coords_):
+            raise ValueError("conversion on processes differs from serial conversion")
+
+# Fused kernels: the compiled loops agree with the NumPy implementations
+# (the loops are run as Python code if numba is not available)
+from colorspace.kernels import kernels
+rgb  = np.random.RandomState(14).uniform(0., 1., (3, 200))
+clib = colorlib(validate = False)
+for name in kernels.kernels():
+    fused = kernels._kernels_[name]["numba"]
+    fused = kernels.get(name) if kernels.get_backend(name) == "numba" else fused(lambda f: f)
+    x = rgb if not name.startswith("polarLUV") else [rgb[0] * 100., rgb[1] * 80., rgb[2] * 360.]
+    if not np.allclose(kernels._kernels_[name]["numpy"](clib, *x), fused(clib, *x), atol = 1e-8):
+        raise ValueError("kernel {:s}: compiled loop differs from NumPy".format(name))
+
+# 8-bit lookup tables agree with the gamma correction
+codes = np.arange(256)
+hex_  = colorlib().sRGB_to_hex(codes / 255., codes / 255., codes / 255.)
+if not np.allclose(colorlib().hex_to_RGB(hex_), colorlib().DEVRGB_to_RGB(*colorlib().hex_to_sRGB(hex_))):
+    raise ValueError("hex_to_RGB (lookup table) differs from the gamma correction")
+
+# Hex decoding: upper/lower case, alpha, byte strings, and invalid colors
+[R, G, B] = colorlib().hex_to_sRGB(["#FF8000", "#ff800050", "nan"])
+if not np.allclose([R[:2], G[:2], B[:2]], [[1., 1.], [128. / 255.] * 2, [0., 0.]]) or \
+   not np.all(np.isnan([R[2], G[2], B[2]])):
+    raise ValueError("hex_to_sRGB decoded wrong colors")
+if not hexcols(np.asarray(["#FF8000", "#0000FF50"], dtype = "S9")).colors() == ["#FF8000", "#0000FF50"]:
+    raise ValueError("hexcols decoded byte strings wrong")
+try:
+    hexcols(["#FF80"]); decoded = True
+except ValueError:
+    decoded = False
+if decoded: raise ValueError("invalid hex color accepted")
+
+# Hex encoding: fixup, missing values, and all 8-bit values
+hex_ = colorlib().sRGB_to_hex(np.array([1.2, .5, np.nan]), np.array([0., .5, 0.]), np.array([-.1, .5, 0.]))
+if not hex_[:2] == ["#FF0000", "#808080"] or not np.isnan(hex_[2]):
+    raise ValueError("sRGB_to_hex encoded wrong colors")
+if not list(colorlib().sRGB_to_hex(*[codes / 255.] * 3, dtype = "U7")) == \
+        ["#{0:02X}{0:02X}{0:02X}".format(i) for i in codes]:
+    raise ValueError("sRGB_to_hex encoded wrong grey levels")
+
+# Packed colors: round trips through hex colors and images
+cols = packedRGBA([0xFF8000FF, 0x00000000, 0x12345680])
+if not cols.as_("hex").colors() == ["#FF8000", "#00000000", "#12345650"] or \
+   not np.array_equal(hexcols(["#FF8000", "#12345650"]).as_("packed").get("rgba"), [0xFF8000FF, 0x12345680]):
+    raise ValueError("wrong conversion between packed and hex colors")
+img = np.random.RandomState(19).randint(0, 256, (3, 4, 4)).astype("uint8")
+if not np.array_equal(packedRGBA.from_image(img).to_image((3, 4)), img):
+    raise ValueError("round trip of an image through packedRGBA failed")
+
+# Streaming hex colors from iterables and files (chunks smaller than the input)
+import io
+text = "#FF0000, #00FF00\n#0000FF50\n\n#808080,"
+cols = hexcols.from_file(io.StringIO(text), chunksize = 3)
+if not cols.colors() == ["#FF0000", "#00FF00", "#0000FF50", "#808080"] or \
+   not hexcols.from_iter(iter(cols.colors()), chunksize = 2).colors() == cols.colors():
+    raise ValueError("from_file/from_iter parsed wrong colors")
+if not [len(x) for x in hexcols.from_iter(cols.colors(), chunksize = 3, to = "HCL")] == [3, 1]:
+    raise ValueError("from_iter returned wrong chunks")
+try:
+    hexcols.from_file(io.StringIO("#FF0000 #FF00"), chunksize = 1); parsed = True
+except ValueError:
+    parsed = False
+if parsed: raise ValueError("from_file accepted an invalid hex color")
+
+# Memoization of conversions: repeated conversions are taken from the cache
+conversions.cache = conversioncache(maxsize = 8)
+try:
+    [a, b] = [sRGB(*rgb), sRGB(*rgb)]
+    a.to("HCL"); b.to("HCL")
+    stats = conversions.cache.stats()
+finally:
+    conversions.cache = None
+if not stats["hits"] == 1 or not stats["misses"] == 1 or not np.array_equal(a._coords_, b._coords_):
+    raise ValueError("conversion not taken from the cache")
+
+# Copy-on-write: copies share the coordinates until modified
+from copy import copy, deepcopy
+cols = polarLUV(H = [0., 120.], C = [50., 60.], L = [30., 40.])
+[a, b] = [copy(cols), deepcopy(cols)]
+if not a._coords_ is cols._coords_ or not b._coords_ is cols._coords_:
+    raise ValueError("copies do not share the coordinates")
+a.set(H = [10., 20.])
+if not list(cols.get("H")) == [0., 120.] or not list(a.get("H")) == [10., 20.] or cols.get("H").flags.writeable:
+    raise ValueError("modifying a copy changed the original object")
+
+# as_ returns a new object and does not modify the original object
+hcl = cols.as_("hex")
+if not cols.__class__ is polarLUV or not list(cols.get("H")) == [0., 120.] or \
+   not hcl.__class__ is hexcols or not hcl.colors() == cols.colors():
+    raise ValueError("as_ modified the original object")
+
+# Cached coordinates: lossless round trips restore the coordinates,
+# modifying the colors clears the cache
+cols.to("CIELUV"); cols.to("HCL")
+if not list(cols.get("H")) == [0., 120.]:
+    raise ValueError("round trip through CIELUV did not restore the coordinates")
+cols.to("CIELUV"); cols.set(L = [50., 60.]); cols.to("HCL")
+if not np.allclose(cols.get("L"), [50., 60.]) or not len(cols._reprs_) == 1:
+    raise ValueError("cached coordinates not cleared by set")
+
+# Indexing: length, slices (sharing the coordinates), masks, and bounds
+cols = polarLUV(H = [0., 90., 180., 270.], C = [50.] * 4, L = [60.] * 4, alpha = [.1, .2, .3, .4])
+if not len(cols) == 4 or not np.shares_memory(cols[1:3]._coords_, cols._coords_) or \
+   not list(cols[[True, False, True, False]].get("H")) == [0., 180.] or \
+   not list(cols[-1].get("alpha")) == [.4] or not list(cols[[3, 0]].get("H")) == [270., 0.]:
+    raise ValueError("wrong subset of the colors")
+for idx in [4, -5, [True, False]]:
+    try:
+        cols[idx]; indexed = True
+    except IndexError:
+        indexed = False
+    if indexed: raise ValueError("index {:s} accepted".format(str(idx)))